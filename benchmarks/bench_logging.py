@@ -0,0 +1,84 @@
+"""
+Microbenchmark for emitting request log records.
+
+Compares StructuredLogger's stdlib path (StreamHandler + JSONFormatter) against
+the structlog engine, with both writing to os.devnull. Each iteration logs the
+request_end record of a finished request.
+
+Usage:
+    python benchmarks/bench_logging.py [iterations]
+"""
+
+import os
+import sys
+import timeit
+
+import django
+from django.conf import settings
+
+if not settings.configured:
+    settings.configure(
+        DEBUG=False,
+        ROOT_URLCONF=__name__,
+        ALLOWED_HOSTS=["testserver"],
+        DJANGO_OBSERVABILITY={"METRICS_PREFIX": "bench"},
+    )
+    django.setup()
+
+urlpatterns = []
+
+from django.http import HttpResponse  # noqa: E402
+from django.test import RequestFactory  # noqa: E402
+
+from django_observability.config import get_config  # noqa: E402
+from django_observability.logging import (  # noqa: E402
+    StructlogLogger,
+    StructuredLogger,
+)
+
+
+def stdlib_logger(devnull, backend: str) -> StructuredLogger:
+    config = get_config()
+    config._config["LOGGING_ENGINE"] = "logging"
+    config._config["LOGGING_JSON_BACKEND"] = backend
+    structured_logger = StructuredLogger(config)
+    for handler in structured_logger.logger.handlers:
+        handler.setStream(devnull)
+    return structured_logger
+
+
+def structlog_logger(devnull, backend: str) -> StructuredLogger:
+    config = get_config()
+    config._config["LOGGING_ENGINE"] = "structlog"
+    structured_logger = StructuredLogger(config)
+    structured_logger.logger = StructlogLogger(backend=backend, stream=devnull)
+    return structured_logger
+
+
+def main() -> None:
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    request = RequestFactory().get("/api/users/42/")
+    response = HttpResponse(b"{}", content_type="application/json")
+
+    with open(os.devnull, "w") as devnull:
+        for name, factory, backend in (
+            ("logging + json", stdlib_logger, "json"),
+            ("logging + auto", stdlib_logger, "auto"),
+            ("structlog + json", structlog_logger, "json"),
+            ("structlog + auto", structlog_logger, "auto"),
+        ):
+            structured_logger = factory(devnull, backend)
+            seconds = min(
+                timeit.repeat(
+                    lambda: structured_logger.log_request_end(
+                        request, response, 0.01, "bench"
+                    ),
+                    number=iterations,
+                    repeat=5,
+                )
+            )
+            print(f"{name:<18} {seconds / iterations * 1e6:8.3f} us/record")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Microbenchmark for per-request Prometheus label resolution.
+
+Compares resolving the four request metric children through .labels() on
+every request (the previous behaviour) against MetricsCollector's cached
+per-label-tuple children.
+
+Usage:
+    python benchmarks/bench_metrics.py [iterations]
+"""
+
+import sys
+import timeit
+
+import django
+from django.conf import settings
+
+if not settings.configured:
+    settings.configure(
+        DEBUG=False,
+        ROOT_URLCONF=__name__,
+        DJANGO_OBSERVABILITY={"METRICS_PREFIX": "bench"},
+    )
+    django.setup()
+
+urlpatterns = []
+
+from django_observability.config import get_config  # noqa: E402
+from django_observability.metrics import MetricsCollector  # noqa: E402
+
+LABELS = ("GET", "api/users/{id}/", "200", "users-detail")
+
+
+def labels_per_request(collector: MetricsCollector) -> None:
+    method, endpoint, status, view_name = LABELS
+    collector.http_request_duration_seconds.labels(
+        method=method, endpoint=endpoint, status=status, view_name=view_name
+    ).observe(0.01)
+    collector.http_request_size_bytes.labels(method=method, endpoint=endpoint).observe(
+        128
+    )
+    collector.http_response_size_bytes.labels(
+        method=method, endpoint=endpoint, status=status
+    ).observe(512)
+    collector.http_requests_total.labels(
+        method=method, endpoint=endpoint, status=status, view_name=view_name
+    ).inc()
+
+
+def cached_children(collector: MetricsCollector) -> None:
+    children = collector._get_request_children(*LABELS)
+    children.request_duration.observe(0.01)
+    children.request_size.observe(128)
+    children.response_size.observe(512)
+    children.requests_total.inc()
+
+
+def main() -> None:
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    collector = MetricsCollector(get_config())
+
+    for name, func in (
+        ("labels() per request", labels_per_request),
+        ("cached children", cached_children),
+    ):
+        seconds = min(
+            timeit.repeat(lambda: func(collector), number=iterations, repeat=5)
+        )
+        print(f"{name:<22} {seconds / iterations * 1e6:8.3f} us/request")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+"""
+Label cardinality budgets for Prometheus metrics.
+
+Every label set a metric has seen becomes a child series that lives in the
+registry for the life of the process. A CardinalityLimiter admits label sets
+until a per-metric budget is reached; after that, the high-cardinality label
+values of new label sets are replaced with ``__overflow__`` so they all land in
+a single series. Rejected label sets are remembered (up to a bound), so each is
+counted once and repeat observations skip the lock. Optionally, label sets not
+seen for a TTL are evicted and their series removed.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Optional, Sequence, Tuple
+
+logger = logging.getLogger("django_observability.cardinality")
+
+OVERFLOW_LABEL_VALUE = "__overflow__"
+
+# Default bound on remembered rejected label sets per limiter
+DEFAULT_REJECTED_CACHE_SIZE = 10000
+
+
+class CardinalityLimiter:
+    """
+    Admits label sets for one or more metrics that share the same label key.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        targets: Sequence[Tuple[Any, Sequence[int]]],
+        limit: int,
+        overflow_indices: Optional[Iterable[int]] = None,
+        ttl: Optional[float] = None,
+        rejected_counter: Any = None,
+        on_evict: Optional[Callable[[], None]] = None,
+        rejected_cache_size: int = DEFAULT_REJECTED_CACHE_SIZE,
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            name: Metric name used when counting rejected label sets
+            targets: (metric, key indices) pairs whose children are keyed by the
+                given positions of the label key; used to remove evicted series
+            limit: Maximum number of distinct label sets admitted
+            overflow_indices: Key positions replaced by the overflow value once
+                the budget is exhausted (defaults to every position)
+            ttl: Seconds after which an unseen label set is evicted (optional)
+            rejected_counter: Counter with a "metric" label incremented for every
+                label set folded into the overflow series
+            on_evict: Callback run after stale label sets have been evicted
+            rejected_cache_size: Maximum number of rejected label sets
+                remembered; the oldest are forgotten first
+        """
+        self.name = name
+        self.targets = list(targets)
+        self.limit = limit
+        self.overflow_indices = (
+            frozenset(overflow_indices) if overflow_indices is not None else None
+        )
+        self.ttl = ttl
+        self.on_evict = on_evict
+        self._rejected = (
+            rejected_counter.labels(name) if rejected_counter is not None else None
+        )
+        self._seen: Dict[Tuple[str, ...], float] = {}
+        self._overflowed: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+        self._rejected_cache_size = rejected_cache_size
+        self._lock = threading.Lock()
+        self._next_eviction = time.monotonic() + ttl if ttl else None
+
+    def admit(self, labelvalues: Tuple[str, ...]) -> Tuple[str, ...]:
+        """
+        Return the label values to record under.
+
+        Args:
+            labelvalues: The label key of the observation
+
+        Returns:
+            The label values unchanged, or their overflow form if the budget is
+            exhausted
+        """
+        seen = self._seen
+        if labelvalues in seen:
+            if self.ttl:
+                self.touch(labelvalues)
+            return labelvalues
+        overflowed = self._overflowed.get(labelvalues)
+        if overflowed is not None:
+            return overflowed
+
+        now = time.monotonic()
+        with self._lock:
+            self._maybe_evict(now)
+            if labelvalues in seen or len(seen) < self.limit:
+                seen[labelvalues] = now
+                return labelvalues
+            overflowed = self._overflowed.get(labelvalues)
+            if overflowed is not None:
+                return overflowed
+            overflowed = self.overflow(labelvalues)
+            if len(self._overflowed) >= self._rejected_cache_size:
+                del self._overflowed[next(iter(self._overflowed))]
+            self._overflowed[labelvalues] = overflowed
+
+        if self._rejected is not None:
+            self._rejected.inc()
+        logger.debug(f"Label set over budget for {self.name}: {labelvalues}")
+        return overflowed
+
+    def overflow(self, labelvalues: Tuple[str, ...]) -> Tuple[str, ...]:
+        """Return the overflow form of a label key."""
+        indices = self.overflow_indices
+        return tuple(
+            OVERFLOW_LABEL_VALUE if indices is None or i in indices else value
+            for i, value in enumerate(labelvalues)
+        )
+
+    def touch(self, labelvalues: Tuple[str, ...]) -> None:
+        """Mark an admitted label set as recently used (only needed with a TTL)."""
+        now = time.monotonic()
+        self._seen[labelvalues] = now
+        if self._next_eviction is not None and now >= self._next_eviction:
+            with self._lock:
+                self._maybe_evict(now)
+
+    def _maybe_evict(self, now: float) -> None:
+        """Evict label sets unseen for longer than the TTL. Caller holds the lock."""
+        if self._next_eviction is None or now < self._next_eviction:
+            return
+        self._next_eviction = now + self.ttl
+        cutoff = now - self.ttl
+        stale = [key for key, last_seen in self._seen.items() if last_seen < cutoff]
+        if not stale:
+            return
+
+        for key in stale:
+            self._seen.pop(key, None)
+        for metric, indices in self.targets:
+            # A target keyed by part of the label key shares each series with
+            # every label set projecting onto it; keep those still in use
+            live = {tuple(key[i] for i in indices) for key in self._seen}
+            for series in {tuple(key[i] for i in indices) for key in stale}:
+                if series in live:
+                    continue
+                try:
+                    metric.remove(*series)
+                except KeyError:
+                    pass
+        # Freed budget lets previously rejected label sets be admitted again
+        self._overflowed.clear()
+        logger.debug(f"Evicted {len(stale)} stale label sets for {self.name}")
+        if self.on_evict:
+            self.on_evict()
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+
+def limit_labels(metric: Any, limiter: CardinalityLimiter) -> Any:
+    """
+    Enforce a cardinality budget on a labelled Prometheus metric in place.
+
+    The metric's ``labels()`` is replaced on the instance so that it routes
+    through the limiter; the metric keeps its type and every other method.
+
+    Args:
+        metric: The labelled prometheus_client metric
+        limiter: The limiter guarding its label sets
+
+    Returns:
+        The same metric
+    """
+    labels = metric.labels
+    labelnames = list(metric._labelnames)
+
+    def bounded_labels(*labelvalues: Any, **labelkwargs: Any) -> Any:
+        """Return the child for the given labels, or the overflow child."""
+        if labelkwargs:
+            if labelvalues:
+                raise ValueError("Can't pass both *args and **kwargs")
+            if sorted(labelkwargs) != sorted(labelnames):
+                raise ValueError("Incorrect label names")
+            labelvalues = tuple(str(labelkwargs[name]) for name in labelnames)
+        else:
+            labelvalues = tuple(str(value) for value in labelvalues)
+        return labels(*limiter.admit(labelvalues))
+
+    metric.labels = bounded_labels
+    return metric
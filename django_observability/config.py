@@ -6,11 +6,37 @@ environment variables, and validation with sensible defaults.
 """
 
 import os
-from typing import Any, Dict, List
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
 
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
 
+from .policies import RoutePolicyTable
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledConfig:
+    """
+    Immutable snapshot of the settings read on every request.
+
+    Values are normalized once (booleans, prefix tuples, lowercased sets) so hot
+    paths read plain attributes instead of looking keys up in the config dict.
+    """
+
+    debug_mode: bool
+    add_correlation_header: bool
+    exclude_paths: Tuple[str, ...]
+    logging_include_headers: bool
+    logging_include_body: bool
+    logging_body_max_bytes: int
+    logging_body_capture_streaming: bool
+    route_policies: RoutePolicyTable
+
+    def is_excluded(self, path: str) -> bool:
+        """Check if a request path starts with one of the excluded prefixes."""
+        return path.startswith(self.exclude_paths)
+
 
 class ObservabilityConfig:
     """
@@ -22,7 +48,15 @@ class ObservabilityConfig:
     3. Sensible defaults
     """
 
-    def __init__(self):
+    def __init__(self, overrides: Optional[Dict[str, Any]] = None):
+        """
+        Load the configuration.
+
+        Args:
+            overrides: Settings applied on top of Django settings and environment
+                variables (used by runtime reloads)
+        """
+        self._overrides = dict(overrides or {})
         self._config = self._load_config()
 
     def _load_config(self) -> Dict[str, Any]:
@@ -37,6 +71,20 @@ class ObservabilityConfig:
             "TRACING_EXPORT_ENDPOINT": None,
             "JAEGER_ENDPOINT": None,
             "ZIPKIN_ENDPOINT": None,
+            "TRACING_MAX_QUEUE_SIZE": None,
+            "TRACING_MAX_EXPORT_BATCH_SIZE": None,
+            "TRACING_SCHEDULE_DELAY_MILLIS": None,
+            "TRACING_EXPORT_TIMEOUT_MILLIS": None,
+            "TRACING_FLUSH_ON_SHUTDOWN": True,
+            "TRACING_MODE": "middleware",
+            "TRACING_ROOT_SAMPLER": "traceidratio",
+            "TRACING_ADAPTIVE_BUDGET": 100.0,
+            "TRACING_ADAPTIVE_MIN_RATE": 0.1,
+            "TRACING_ADAPTIVE_INTERVAL": 10.0,
+            "TRACING_TAIL_SAMPLING": False,
+            "TRACING_TAIL_MAX_SPANS": 10000,
+            "TRACING_TAIL_LATENCY_THRESHOLD": 1.0,
+            "TRACING_TAIL_ROUTE_THRESHOLDS": {},
             # Metrics configuration
             "METRICS_ENABLED": True,
             "METRICS_PREFIX": "django_app",
@@ -57,19 +105,45 @@ class ObservabilityConfig:
                 7.5,
                 10.0,
             ],
+            "METRICS_CHILD_CACHE_SIZE": 2048,
+            "METRICS_CARDINALITY_LIMIT": 1000,
+            "METRICS_CARDINALITY_TTL": None,
+            "METRICS_MULTIPROCESS": None,
             # Logging configuration
             "LOGGING_ENABLED": True,
             "LOGGING_FORMAT": "json",
+            "LOGGING_ENGINE": "logging",
+            "LOGGING_JSON_BACKEND": "json",
+            "LOGGING_ASYNC": False,
+            "LOGGING_QUEUE_SIZE": 10000,
+            "LOGGING_QUEUE_DROP_POLICY": "drop_newest",
+            "LOGGING_ACCESS_LOG": False,
+            "LOGGING_ACCESS_LOG_START_PATHS": [],
+            "LOGGING_SAMPLE_RATE": 1.0,
+            "LOGGING_ROUTE_SAMPLE_RATES": {},
+            "LOGGING_RATE_LIMIT": None,
+            "LOGGING_ALWAYS_KEEP_SLOWER_THAN": 1.0,
             "LOGGING_LEVEL": "INFO",
             "LOGGING_INCLUDE_HEADERS": False,
             "LOGGING_INCLUDE_BODY": False,
+            "LOGGING_BODY_MAX_BYTES": 4096,
+            "LOGGING_BODY_CAPTURE_STREAMING": False,
             "LOGGING_SENSITIVE_HEADERS": ["authorization", "cookie", "x-api-key"],
+            "LOGGING_REDACT_PATTERNS": [],
+            "LOGGING_REDACT_BODY_FIELDS": ["password", "token", "secret"],
+            "LOGGING_CONTEXT_INJECTION": True,
             # General configuration
             "ENABLED": True,
             "DEBUG_MODE": False,
             "EXCLUDE_PATHS": ["/health/", "/metrics/", "/favicon.ico"],
             "ASYNC_ENABLED": True,
             "ADD_CORRELATION_HEADER": False,
+            "ROUTE_POLICIES": {},
+            # Runtime reload settings
+            "CONFIG_RELOAD_FILE": None,
+            "CONFIG_RELOAD_INTERVAL": 5.0,
+            "CONFIG_RELOAD_SIGNAL": False,
+            "CONFIG_RELOAD_TOKEN": None,
             # Integration settings
             "INTEGRATE_DB_TRACING": True,
             "INTEGRATE_CACHE_TRACING": True,
@@ -85,6 +159,9 @@ class ObservabilityConfig:
         env_overrides = self._load_env_config()
         config.update(env_overrides)
 
+        # Override with runtime overrides
+        config.update(getattr(self, "_overrides", {}))
+
         # Validate configuration
         self._validate_config(config)
 
@@ -144,6 +221,21 @@ class ObservabilityConfig:
                 f"TRACING_SAMPLE_RATE must be between 0.0 and 1.0, got {sample_rate}"
             )
 
+        # Validate tracing mode
+        tracing_mode = config.get("TRACING_MODE", "middleware")
+        if tracing_mode not in ("middleware", "auto"):
+            raise ImproperlyConfigured(
+                f"TRACING_MODE must be 'middleware' or 'auto', got {tracing_mode}"
+            )
+
+        # Validate root sampler
+        root_sampler = config.get("TRACING_ROOT_SAMPLER", "traceidratio")
+        if root_sampler not in ("traceidratio", "always_on", "always_off", "adaptive"):
+            raise ImproperlyConfigured(
+                "TRACING_ROOT_SAMPLER must be 'traceidratio', 'always_on', "
+                f"'always_off' or 'adaptive', got {root_sampler}"
+            )
+
         # Validate logging format
         log_format = config.get("LOGGING_FORMAT", "json")
         if log_format not in ("json", "text"):
@@ -151,6 +243,23 @@ class ObservabilityConfig:
                 f"LOGGING_FORMAT must be 'json' or 'text', got {log_format}"
             )
 
+        # Validate log queue drop policy
+        drop_policy = config.get("LOGGING_QUEUE_DROP_POLICY", "drop_newest")
+        if drop_policy not in ("drop_newest", "drop_oldest"):
+            raise ImproperlyConfigured(
+                "LOGGING_QUEUE_DROP_POLICY must be 'drop_newest' or 'drop_oldest', "
+                f"got {drop_policy}"
+            )
+
+        logging_engine = config.get("LOGGING_ENGINE", "logging")
+        if logging_engine not in ("logging", "structlog"):
+            raise ImproperlyConfigured(
+                f"LOGGING_ENGINE must be 'logging' or 'structlog', got {logging_engine}"
+            )
+
+        # Validate route policies (raises ImproperlyConfigured)
+        RoutePolicyTable(config.get("ROUTE_POLICIES") or {})
+
         # Validate exclude paths
         exclude_paths = config.get("EXCLUDE_PATHS", [])
         if not isinstance(exclude_paths, list):
@@ -222,6 +331,30 @@ class ObservabilityConfig:
         """Get list of paths to exclude from tracing."""
         return self._config.get("EXCLUDE_PATHS", [])
 
+    def compile(self) -> CompiledConfig:
+        """
+        Build an immutable snapshot of the per-request settings.
+
+        The snapshot does not follow later changes to the configuration; call
+        compile() again after reloading it.
+
+        Returns:
+            The compiled configuration
+        """
+        get = self._config.get
+        return CompiledConfig(
+            debug_mode=bool(get("DEBUG_MODE", False)),
+            add_correlation_header=bool(get("ADD_CORRELATION_HEADER", False)),
+            exclude_paths=tuple(self.get_exclude_paths()),
+            logging_include_headers=bool(get("LOGGING_INCLUDE_HEADERS", False)),
+            logging_include_body=bool(get("LOGGING_INCLUDE_BODY", False)),
+            logging_body_max_bytes=get("LOGGING_BODY_MAX_BYTES", 4096),
+            logging_body_capture_streaming=bool(
+                get("LOGGING_BODY_CAPTURE_STREAMING", False)
+            ),
+            route_policies=RoutePolicyTable.from_config(self),
+        )
+
     def as_dict(self) -> Dict[str, Any]:
         """Return configuration as dictionary (useful for debugging)."""
         return self._config.copy()
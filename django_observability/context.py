@@ -0,0 +1,131 @@
+"""
+Request context for log records.
+
+The middlewares bind the current RequestObservation to a context variable for
+the duration of each request, so it follows the request across threads handed
+off by asgiref and into tasks spawned from async views. RequestContextFilter
+reads it to stamp the correlation ID, and the current OpenTelemetry trace and
+span IDs, onto every log record emitted while the request is handled;
+add_request_context does the same for structlog events.
+"""
+
+import logging
+from contextvars import ContextVar, Token
+from typing import Any, Optional
+
+logger = logging.getLogger("django_observability.context")
+
+try:
+    from opentelemetry.trace import format_span_id, format_trace_id, get_current_span
+
+    OPENTELEMETRY_AVAILABLE = True
+except ImportError:
+    OPENTELEMETRY_AVAILABLE = False
+
+_current_observation: ContextVar[Optional[Any]] = ContextVar(
+    "django_observability_observation", default=None
+)
+
+
+def bind_observation(observation: Any) -> Token:
+    """
+    Make an observation the current request context.
+
+    Args:
+        observation: The RequestObservation of the request being handled
+
+    Returns:
+        A token for unbind_observation
+    """
+    return _current_observation.set(observation)
+
+
+def unbind_observation(token: Optional[Token] = None) -> None:
+    """
+    Clear the current request context.
+
+    Args:
+        token: The token returned by bind_observation. Without one (or if it
+            belongs to another context) the context is simply cleared.
+    """
+    if token is not None:
+        try:
+            _current_observation.reset(token)
+            return
+        except ValueError:
+            pass
+    _current_observation.set(None)
+
+
+def get_current_observation() -> Optional[Any]:
+    """Return the RequestObservation of the request being handled, if any."""
+    return _current_observation.get()
+
+
+class RequestContextFilter(logging.Filter):
+    """
+    Stamps correlation_id, trace_id and span_id onto log records.
+
+    Attributes already set on a record (e.g. through extra) are left alone, and
+    records emitted outside a request only get IDs for an active span. Add it to
+    handlers, where it runs for records from every logger:
+
+        LOGGING = {
+            "filters": {
+                "request_context": {
+                    "()": "django_observability.context.RequestContextFilter",
+                },
+            },
+            "handlers": {
+                "console": {
+                    "class": "logging.StreamHandler",
+                    "filters": ["request_context"],
+                },
+            },
+        }
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        observation = _current_observation.get()
+        if observation is not None and not hasattr(record, "correlation_id"):
+            record.correlation_id = observation.correlation_id
+
+        if OPENTELEMETRY_AVAILABLE and not hasattr(record, "trace_id"):
+            span_context = get_current_span().get_span_context()
+            if span_context.is_valid:
+                record.trace_id = format_trace_id(span_context.trace_id)
+                record.span_id = format_span_id(span_context.span_id)
+        return True
+
+
+def add_request_context(logger: Any, method_name: str, event_dict: dict) -> dict:
+    """
+    structlog processor adding correlation_id, trace_id and span_id to events.
+
+    Like RequestContextFilter, keys already present in the event are kept.
+    """
+    observation = _current_observation.get()
+    if observation is not None and "correlation_id" not in event_dict:
+        event_dict["correlation_id"] = observation.correlation_id
+
+    if OPENTELEMETRY_AVAILABLE and "trace_id" not in event_dict:
+        span_context = get_current_span().get_span_context()
+        if span_context.is_valid:
+            event_dict["trace_id"] = format_trace_id(span_context.trace_id)
+            event_dict["span_id"] = format_span_id(span_context.span_id)
+    return event_dict
+
+
+def install_context_filter(target: Any) -> None:
+    """
+    Add a RequestContextFilter to the handlers of a logger, or to a handler.
+
+    Handlers that already have one are skipped, so this is safe to call again.
+
+    Args:
+        target: A logging.Logger or logging.Handler
+    """
+    handlers = target.handlers if isinstance(target, logging.Logger) else [target]
+    for handler in handlers:
+        if not any(isinstance(f, RequestContextFilter) for f in handler.filters):
+            handler.addFilter(RequestContextFilter())
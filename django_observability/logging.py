@@ -5,15 +5,107 @@ This module provides structured logging capabilities with JSON formatting,
 correlation ID tracking, and integration with Django's logging system.
 """
 
+import atexit
+import hashlib
 import json
 import logging
+import logging.handlers
+import math
+import queue
+import sys
 import time
+import traceback
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Optional, Tuple
 
-from django.http import HttpRequest, HttpResponse
+import structlog
+from django.http import (
+    FileResponse,
+    HttpRequest,
+    HttpResponse,
+    StreamingHttpResponse,
+)
 
-from .config import ObservabilityConfig
-from .utils import get_client_ip, get_view_name, sanitize_headers
+from .config import CompiledConfig, ObservabilityConfig
+from .context import add_request_context, install_context_filter
+from .observation import ObservationSink, RequestObservation, get_observation
+from .redaction import Redactor
+from .utils import get_loaded_user
+
+logger = logging.getLogger("django_observability.logging")
+
+
+# LogRecord attributes that are not user-supplied extra fields
+RESERVED_RECORD_ATTRS = frozenset(
+    {
+        "name",
+        "msg",
+        "args",
+        "levelname",
+        "levelno",
+        "pathname",
+        "filename",
+        "module",
+        "exc_info",
+        "exc_text",
+        "stack_info",
+        "lineno",
+        "funcName",
+        "created",
+        "msecs",
+        "relativeCreated",
+        "thread",
+        "threadName",
+        "processName",
+        "process",
+        "message",
+        "taskName",
+    }
+)
+
+
+def get_json_dumps(backend: str = "json") -> Callable[[Any], str]:
+    """
+    Return a function serializing log entries to JSON with the given backend.
+
+    Non-serializable values are rendered with str(). "auto" picks orjson, then
+    ujson, then the standard library.
+
+    Args:
+        backend: One of "json", "orjson", "ujson" or "auto"
+
+    Returns:
+        A callable taking a log entry and returning its JSON string
+    """
+    if backend in ("orjson", "auto"):
+        try:
+            import orjson
+
+            def dumps(obj: Any) -> str:
+                return orjson.dumps(obj, default=str).decode()
+
+            return dumps
+        except ImportError:
+            if backend == "orjson":
+                logger.warning("orjson is not installed, using json")
+
+    if backend in ("ujson", "auto"):
+        try:
+            import ujson
+
+            def dumps(obj: Any) -> str:
+                return ujson.dumps(obj, ensure_ascii=False, default=str)
+
+            return dumps
+        except ImportError:
+            if backend == "ujson":
+                logger.warning("ujson is not installed, using json")
+
+    def dumps(obj: Any) -> str:
+        return json.dumps(obj, ensure_ascii=False, default=str)
+
+    return dumps
 
 
 class JSONFormatter(logging.Formatter):
@@ -24,9 +116,45 @@ class JSONFormatter(logging.Formatter):
     and includes observability-specific fields.
     """
 
-    def __init__(self, *args, **kwargs):
-        """Initialize the JSON formatter."""
+    def __init__(self, *args, backend: str = "json", **kwargs):
+        """
+        Initialize the JSON formatter.
+
+        Args:
+            backend: JSON backend ("json", "orjson", "ujson" or "auto")
+        """
         super().__init__(*args, **kwargs)
+        self._dumps = get_json_dumps(backend)
+        # (second, ISO prefix) of the last formatted record; replaced atomically
+        self._timestamp_cache: Tuple[int, str] = (-1, "")
+
+    def format_timestamp(self, created: float) -> str:
+        """
+        Format a record's creation time like datetime.isoformat() in UTC.
+
+        The date and time up to the second are formatted once per second.
+
+        Args:
+            created: The record's creation time (epoch seconds)
+
+        Returns:
+            The ISO 8601 timestamp
+        """
+        fraction, whole = math.modf(created)
+        second = int(whole)
+        microsecond = round(fraction * 1e6)
+        if microsecond >= 1000000 or microsecond < 0:
+            return datetime.fromtimestamp(created, tz=timezone.utc).isoformat()
+
+        cached_second, prefix = self._timestamp_cache
+        if cached_second != second:
+            prefix = datetime.fromtimestamp(second, tz=timezone.utc).strftime(
+                "%Y-%m-%dT%H:%M:%S"
+            )
+            self._timestamp_cache = (second, prefix)
+        if microsecond:
+            return f"{prefix}.{microsecond:06d}+00:00"
+        return f"{prefix}+00:00"
 
     def format(self, record: logging.LogRecord) -> str:
         """
@@ -39,9 +167,7 @@ class JSONFormatter(logging.Formatter):
             JSON formatted log string
         """
         log_entry = {
-            "timestamp": datetime.fromtimestamp(
-                record.created, tz=timezone.utc
-            ).isoformat(),
+            "timestamp": self.format_timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -62,44 +188,365 @@ class JSONFormatter(logging.Formatter):
                 "traceback": self.formatException(record.exc_info),
             }
 
-        extra_fields = {}
-        for key, value in record.__dict__.items():
-            if key not in {
-                "name",
-                "msg",
-                "args",
-                "levelname",
-                "levelno",
-                "pathname",
-                "filename",
-                "module",
-                "exc_info",
-                "exc_text",
-                "stack_info",
-                "lineno",
-                "funcName",
-                "created",
-                "msecs",
-                "relativeCreated",
-                "thread",
-                "threadName",
-                "processName",
-                "process",
-                "message",
-            }:
-                try:
-                    json.dumps(value)
-                    extra_fields[key] = value
-                except (TypeError, ValueError):
-                    extra_fields[key] = str(value)
-
+        extra_fields = {
+            key: value
+            for key, value in record.__dict__.items()
+            if key not in RESERVED_RECORD_ATTRS
+        }
         if extra_fields:
             log_entry["extra"] = extra_fields
 
-        return json.dumps(log_entry, ensure_ascii=False)
+        try:
+            return self._dumps(log_entry)
+        except (TypeError, ValueError, OverflowError):
+            # Values default= cannot handle (circular or non-str keys)
+            if extra_fields:
+                log_entry["extra"] = {
+                    key: self._safe_value(value) for key, value in extra_fields.items()
+                }
+            return self._dumps(log_entry)
+
+    def _safe_value(self, value: Any) -> Any:
+        """Return value if it serializes on its own, else its string form."""
+        try:
+            self._dumps(value)
+            return value
+        except (TypeError, ValueError, OverflowError):
+            return str(value)
+
+
+def _render_exc_info(logger: Any, method_name: str, event_dict: dict) -> dict:
+    """structlog processor rendering exc_info into a "traceback" key."""
+    exc_info = event_dict.pop("exc_info", None)
+    if exc_info:
+        if isinstance(exc_info, BaseException):
+            exc_info = (type(exc_info), exc_info, exc_info.__traceback__)
+        elif not isinstance(exc_info, tuple):
+            exc_info = sys.exc_info()
+        if exc_info[0] is not None:
+            event_dict["traceback"] = "".join(traceback.format_exception(*exc_info))
+    return event_dict
+
+
+class StructlogLogger:
+    """
+    Emits structured log records through a pre-built structlog processor chain.
+
+    It accepts the info()/error() calls StructuredLogger makes on a stdlib
+    logger, with the record fields passed as extra. Each event is rendered to a
+    single flat JSON line: structlog context variables and the request context
+    are merged in, then the level, timestamp and traceback are added.
+    """
+
+    def __init__(
+        self, level: int = logging.INFO, backend: str = "json", stream: Any = None
+    ):
+        """
+        Initialize the structlog logger.
+
+        Args:
+            level: Minimum level to emit
+            backend: JSON backend ("json", "orjson", "ujson" or "auto")
+            stream: File the JSON lines are written to (defaults to stderr)
+        """
+        dumps = get_json_dumps(backend)
+        self._logger = structlog.wrap_logger(
+            structlog.WriteLogger(stream or sys.stderr),
+            processors=[
+                structlog.contextvars.merge_contextvars,
+                add_request_context,
+                structlog.processors.add_log_level,
+                structlog.processors.TimeStamper(fmt="iso", utc=True, key="timestamp"),
+                _render_exc_info,
+                structlog.processors.EventRenamer("message", "_event"),
+                structlog.processors.JSONRenderer(
+                    serializer=lambda event_dict, **kwargs: dumps(event_dict)
+                ),
+            ],
+            wrapper_class=structlog.make_filtering_bound_logger(level),
+            cache_logger_on_first_use=True,
+        ).bind(logger="django_observability")
+
+    def info(self, msg: str, exc_info: Any = None, extra: Optional[dict] = None):
+        self._log("info", msg, exc_info, extra)
+
+    def error(self, msg: str, exc_info: Any = None, extra: Optional[dict] = None):
+        self._log("error", msg, exc_info, extra)
+
+    def _log(self, method: str, msg: str, exc_info: Any, extra: Optional[dict]) -> None:
+        """Emit an event; the record's "event" field is kept apart from the message."""
+        event_dict = dict(extra) if extra else {}
+        if "event" in event_dict:
+            event_dict["_event"] = event_dict.pop("event")
+        if exc_info:
+            event_dict["exc_info"] = exc_info
+        getattr(self._logger, method)(msg, **event_dict)
+
+
+class BoundedQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler with a bounded queue that drops records instead of blocking.
+
+    Records are handed to a QueueListener thread that formats and writes them,
+    so the request path never waits on the log sink. When the queue is full,
+    either the incoming record ("drop_newest") or the oldest queued record
+    ("drop_oldest") is discarded and counted.
+    """
+
+    def __init__(
+        self,
+        target: logging.Handler,
+        maxsize: int = 10000,
+        drop_policy: str = "drop_newest",
+    ):
+        """
+        Initialize the handler and start its listener thread.
+
+        Args:
+            target: The handler that writes records (runs on the listener thread)
+            maxsize: Maximum number of queued records
+            drop_policy: "drop_newest" or "drop_oldest"
+        """
+        super().__init__(queue.Queue(maxsize))
+        self.drop_policy = drop_policy
+        self.dropped_records = 0
+        self.on_drop: Optional[Callable[[], None]] = None
+        self.listener = _LogQueueListener(self.queue, target)
+        self.listener.start()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Freeze the message; unlike QueueHandler, keep exc_info for the formatter.
+        """
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Queue a record, applying the drop policy if the queue is full."""
+        try:
+            self.queue.put_nowait(record)
+            return
+        except queue.Full:
+            pass
+
+        # Producers are serialized by the handler lock; only the listener competes
+        if self.drop_policy == "drop_oldest":
+            try:
+                self.queue.get_nowait()
+                self.queue.put_nowait(record)
+            except (queue.Empty, queue.Full):
+                pass
+        self.dropped_records += 1
+        if self.on_drop:
+            self.on_drop()
+
+    def close(self) -> None:
+        """Write out the queued records and stop the listener thread."""
+        if self.listener is not None:
+            listener, self.listener = self.listener, None
+            listener.stop()
+            for handler in listener.handlers:
+                handler.flush()
+        super().close()
 
 
-class StructuredLogger:
+class _LogQueueListener(logging.handlers.QueueListener):
+    """QueueListener whose stop() waits for room in a full queue."""
+
+    def __init__(self, log_queue: queue.Queue, *handlers: logging.Handler):
+        super().__init__(log_queue, *handlers, respect_handler_level=True)
+
+    def enqueue_sentinel(self) -> None:
+        try:
+            self.queue.put(self._sentinel, timeout=5)
+        except queue.Full:
+            logger.error("Log queue did not drain; queued records may be lost")
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            super().stop()
+
+
+class LogSampler:
+    """
+    Decides which request records are logged.
+
+    Sampling is deterministic per request: it is keyed on the trace ID when the
+    request is traced, using the same trace-ID ratio as the trace sampler, so a
+    sampled trace keeps its logs whenever the log rate is at least the trace
+    rate. Otherwise it is keyed on a hash of the correlation ID. Records of
+    requests that failed, returned a 5xx status or ran longer than the slow
+    threshold are always kept.
+    """
+
+    TRACE_ID_LIMIT = (1 << 64) - 1
+
+    def __init__(
+        self,
+        rate: float = 1.0,
+        route_rates: Optional[Dict[str, float]] = None,
+        rate_limit: Optional[float] = None,
+        slow_threshold: Optional[float] = None,
+    ):
+        """
+        Initialize the sampler.
+
+        Args:
+            rate: Default fraction of requests logged
+            route_rates: Per-route fractions keyed by endpoint label
+            rate_limit: Maximum sampled records per second per route (optional)
+            slow_threshold: Requests slower than this many seconds are always kept
+        """
+        self.rate = rate
+        self.route_rates = route_rates or {}
+        self.rate_limit = rate_limit
+        self.slow_threshold = slow_threshold
+        self.sampled_out_records = 0
+        self.on_sampled_out: Optional[Callable[[str], None]] = None
+        self._windows: Dict[str, Tuple[int, int]] = {}
+
+    def sample(self, observation: RequestObservation) -> bool:
+        """
+        Return the head decision for a request (used for request_start records).
+
+        Args:
+            observation: The request observation
+
+        Returns:
+            True if the request falls in its route's sample
+        """
+        rate = self.route_rates.get(observation.endpoint, self.rate)
+        if rate >= 1.0:
+            return True
+        if rate <= 0.0:
+            return False
+        return self._sample_key(observation) < round(rate * (self.TRACE_ID_LIMIT + 1))
+
+    def keep(self, observation: RequestObservation) -> bool:
+        """
+        Return whether the completed request's record is logged.
+
+        Args:
+            observation: The finished request observation
+
+        Returns:
+            True if the record should be emitted
+        """
+        if observation.exception is not None:
+            return True
+        status_code = observation.status_code
+        if status_code is not None and status_code >= 500:
+            return True
+        if (
+            self.slow_threshold is not None
+            and observation.duration >= self.slow_threshold
+        ):
+            return True
+        return self.sample(observation) and self._within_rate_limit(
+            observation.endpoint
+        )
+
+    def record_sampled_out(self, observation: RequestObservation) -> None:
+        """Count a record that was not logged."""
+        self.sampled_out_records += 1
+        if self.on_sampled_out:
+            self.on_sampled_out(observation.endpoint)
+
+    def _sample_key(self, observation: RequestObservation) -> int:
+        """Return the 64-bit key the sampling decision is based on."""
+        span = observation.span
+        if span is not None:
+            span_context = span.get_span_context()
+            if span_context.is_valid:
+                return span_context.trace_id & self.TRACE_ID_LIMIT
+        digest = hashlib.blake2b(
+            observation.correlation_id.encode(), digest_size=8
+        ).digest()
+        return int.from_bytes(digest, "big")
+
+    def _within_rate_limit(self, route: str) -> bool:
+        """Apply the per-route records-per-second limit (fixed one-second windows)."""
+        if self.rate_limit is None:
+            return True
+        second = int(time.monotonic())
+        window_second, count = self._windows.get(route, (second, 0))
+        if window_second != second:
+            count = 0
+        if count >= self.rate_limit:
+            return False
+        self._windows[route] = (second, count + 1)
+        return True
+
+
+@dataclass(frozen=True, slots=True)
+class LoggerSettings:
+    """
+    The settings a StructuredLogger applies to requests, swapped as one unit.
+
+    A request reads the current instance once and keeps it, so a reload never
+    mixes old and new settings within one request.
+    """
+
+    config: ObservabilityConfig
+    snapshot: CompiledConfig
+    redactor: Redactor
+    sampler: Optional[LogSampler]
+    access_log: bool
+    access_log_start_paths: Tuple[str, ...]
+
+    @classmethod
+    def from_config(
+        cls,
+        config: ObservabilityConfig,
+        on_sampled_out: Optional[Callable[[str], None]] = None,
+    ) -> "LoggerSettings":
+        """
+        Build the settings from the observability configuration.
+
+        Args:
+            config: The observability configuration instance
+            on_sampled_out: Callback given to the log sampler, if one is created
+
+        Returns:
+            The LoggerSettings
+        """
+        sampler = cls._create_sampler(config)
+        if sampler is not None:
+            sampler.on_sampled_out = on_sampled_out
+        return cls(
+            config=config,
+            snapshot=config.compile(),
+            redactor=Redactor.from_config(config),
+            sampler=sampler,
+            access_log=bool(config.get("LOGGING_ACCESS_LOG", False)),
+            access_log_start_paths=tuple(
+                config.get("LOGGING_ACCESS_LOG_START_PATHS") or ()
+            ),
+        )
+
+    @staticmethod
+    def _create_sampler(config: ObservabilityConfig) -> Optional[LogSampler]:
+        """Create the request log sampler, or None if every record is logged."""
+        rate = config.get("LOGGING_SAMPLE_RATE", 1.0)
+        route_rates = config.get("LOGGING_ROUTE_SAMPLE_RATES") or {}
+        rate_limit = config.get("LOGGING_RATE_LIMIT")
+        if rate >= 1.0 and not route_rates and rate_limit is None:
+            return None
+        return LogSampler(
+            rate=rate,
+            route_rates=route_rates,
+            rate_limit=rate_limit,
+            slow_threshold=config.get("LOGGING_ALWAYS_KEEP_SLOWER_THAN", 1.0),
+        )
+
+    @property
+    def body_max_bytes(self) -> int:
+        """Maximum number of body bytes captured per record."""
+        return self.snapshot.logging_body_max_bytes
+
+
+class StructuredLogger(ObservationSink):
     """
     Structured logger for Django observability.
 
@@ -114,19 +561,65 @@ class StructuredLogger:
         Args:
             config: The observability configuration instance
         """
-        self.config = config
         self.logger = logging.getLogger("django_observability")
+        self._on_sampled_out: Optional[Callable[[str], None]] = None
+        self.settings = LoggerSettings.from_config(config)
         self._setup_logger()
 
+    @property
+    def config(self) -> ObservabilityConfig:
+        """The current configuration."""
+        return self.settings.config
+
+    @property
+    def sampler(self) -> Optional[LogSampler]:
+        """The current request log sampler, or None if every record is logged."""
+        return self.settings.sampler
+
+    @property
+    def on_sampled_out(self) -> Optional[Callable[[str], None]]:
+        """Callback run with the endpoint of every sampled-out request record."""
+        return self._on_sampled_out
+
+    @on_sampled_out.setter
+    def on_sampled_out(self, callback: Optional[Callable[[str], None]]) -> None:
+        # Kept for the samplers of reloaded settings as well
+        self._on_sampled_out = callback
+        if self.settings.sampler is not None:
+            self.settings.sampler.on_sampled_out = callback
+
+    def _settings_for(self, observation: RequestObservation) -> LoggerSettings:
+        """Return the settings a request was started with, pinning them if new."""
+        settings = observation.log_settings
+        if settings is None:
+            settings = observation.log_settings = self.settings
+        return settings
+
     def _setup_logger(self) -> None:
         """Setup the logger with appropriate handlers and formatters."""
         # Set log level
-        log_level = getattr(logging, self.config.get("LOGGING_LEVEL", "INFO").upper())
+        log_level = self._get_log_level()
         self.logger.setLevel(log_level)
 
         # Remove existing handlers to avoid duplicates
         for handler in self.logger.handlers[:]:
             self.logger.removeHandler(handler)
+            if isinstance(handler, BoundedQueueHandler):
+                handler.close()
+
+        context_injection = self.config.get("LOGGING_CONTEXT_INJECTION", True)
+        if context_injection:
+            # Stamp request IDs on application records, whichever engine is used
+            install_context_filter(logging.getLogger())
+
+        if self.config.get("LOGGING_ENGINE", "logging") == "structlog":
+            # Records bypass the stdlib handlers and are rendered by structlog
+            self.queue_handler = None
+            self.logger = StructlogLogger(
+                level=log_level,
+                backend=self.config.get("LOGGING_JSON_BACKEND", "json"),
+            )
+            return
 
         # Create console handler
         handler = logging.StreamHandler()
@@ -134,7 +627,9 @@ class StructuredLogger:
         # Set formatter based on configuration
         log_format = self.config.get("LOGGING_FORMAT", "json")
         if log_format == "json":
-            formatter = JSONFormatter()
+            formatter = JSONFormatter(
+                backend=self.config.get("LOGGING_JSON_BACKEND", "json")
+            )
         else:
             formatter = logging.Formatter(
                 fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
@@ -142,11 +637,66 @@ class StructuredLogger:
             )
 
         handler.setFormatter(formatter)
+
+        if self.config.get("LOGGING_ASYNC", False):
+            # Format and write on a listener thread, off the request path
+            handler = BoundedQueueHandler(
+                handler,
+                maxsize=self.config.get("LOGGING_QUEUE_SIZE", 10000),
+                drop_policy=self.config.get("LOGGING_QUEUE_DROP_POLICY", "drop_newest"),
+            )
+            atexit.register(handler.close)
+
+        self.queue_handler = (
+            handler if isinstance(handler, BoundedQueueHandler) else None
+        )
+        if context_injection:
+            install_context_filter(handler)
         self.logger.addHandler(handler)
 
         # Prevent propagation to avoid duplicate logs
         self.logger.propagate = False
 
+    def _get_log_level(self) -> int:
+        """Return the numeric level for LOGGING_LEVEL."""
+        return getattr(logging, self.config.get("LOGGING_LEVEL", "INFO").upper())
+
+    def apply_config(self, config: ObservabilityConfig) -> None:
+        """
+        Swap in the logging settings of a reloaded configuration.
+
+        LOGGING_LEVEL and the sampling, access-log, body and redaction settings
+        are replaced, as one LoggerSettings swapped by reference; handlers,
+        LOGGING_FORMAT and LOGGING_ENGINE only apply at startup.
+
+        Args:
+            config: The reloaded configuration
+        """
+        try:
+            self.settings = LoggerSettings.from_config(config, self._on_sampled_out)
+
+            log_level = self._get_log_level()
+            if isinstance(self.logger, StructlogLogger):
+                self.logger = StructlogLogger(
+                    level=log_level,
+                    backend=config.get("LOGGING_JSON_BACKEND", "json"),
+                )
+            else:
+                self.logger.setLevel(log_level)
+            logger.info("Logging configuration reloaded")
+        except Exception as e:
+            logger.error(f"Failed to reload logging configuration: {str(e)}")
+
+    @property
+    def dropped_records(self) -> int:
+        """Number of records dropped because the log queue was full."""
+        return self.queue_handler.dropped_records if self.queue_handler else 0
+
+    def shutdown(self) -> None:
+        """Write out queued records and stop the log listener thread, if any."""
+        if self.queue_handler:
+            self.queue_handler.close()
+
     def _should_log_body(self, request: HttpRequest) -> bool:
         """
         Determine if the request body should be logged.
@@ -162,6 +712,254 @@ class StructuredLogger:
             ("application/json", "text/", "multipart/form-data")
         )
 
+    def _get_request_data(
+        self, request: HttpRequest, observation: RequestObservation
+    ) -> Dict[str, Any]:
+        """
+        Build the request fields shared by request_start and access records.
+
+        Args:
+            request: The Django HttpRequest object
+            observation: The request observation
+
+        Returns:
+            The request log fields
+        """
+        log_data = {
+            "correlation_id": observation.correlation_id,
+            "http": {
+                "method": observation.method,
+                "url": observation.url,
+                "path": observation.path,
+                "query_string": observation.query_string,
+                "scheme": observation.scheme,
+                "host": observation.host,
+                "user_agent": observation.user_agent,
+                "view_name": observation.view_name,
+            },
+            "network": {
+                "client_ip": observation.client_ip,
+                "remote_addr": observation.remote_addr,
+            },
+        }
+
+        settings = self._settings_for(observation)
+
+        # Add request headers if enabled
+        if settings.snapshot.logging_include_headers:
+            log_data["http"]["headers"] = settings.redactor.redact_meta(request.META)
+
+        # Add request body if enabled and safe
+        if self._include_body(observation) and self._should_log_body(request):
+            log_data["http"]["body"] = self._capture_request_body(request, settings)
+
+        return log_data
+
+    def _include_body(self, observation: RequestObservation) -> bool:
+        """Check if bodies are logged for a request, honouring its route policy."""
+        log_body = observation.policy.log_body
+        if log_body is None:
+            return self._settings_for(observation).snapshot.logging_include_body
+        return log_body
+
+    def _policy_allows(self, observation: RequestObservation, level: int) -> bool:
+        """Check if a request record at level passes its route policy's log_level."""
+        log_level = observation.policy.log_level
+        return log_level is None or level >= log_level
+
+    def _add_user_data(self, log_data: Dict[str, Any], request: HttpRequest) -> None:
+        """
+        Add the authenticated user to a log record's fields.
+
+        Only a user the application has already loaded is used, so logging never
+        triggers a session read or user query.
+
+        Args:
+            log_data: The log fields to extend
+            request: The Django HttpRequest object
+        """
+        user = get_loaded_user(request)
+        if user is not None and user.is_authenticated:
+            log_data["user"] = {
+                "id": str(user.pk),
+                "username": user.get_username(),
+                "is_staff": getattr(user, "is_staff", False),
+                "is_superuser": getattr(user, "is_superuser", False),
+            }
+
+    def _add_response_data(
+        self,
+        log_data: Dict[str, Any],
+        response: HttpResponse,
+        observation: RequestObservation,
+    ) -> None:
+        """
+        Add the optional response headers and body to a log record's fields.
+
+        Args:
+            log_data: The log fields to extend
+            response: The Django HttpResponse object
+            observation: The request observation
+        """
+        settings = self._settings_for(observation)
+
+        # Add response headers if enabled
+        if settings.snapshot.logging_include_headers:
+            log_data["http"]["response_headers"] = settings.redactor.redact_headers(
+                response.headers
+            )
+
+        # Add response body if enabled and safe
+        if self._include_body(observation):
+            content_type = response.get("Content-Type", "").lower()
+            if not content_type.startswith(("application/json", "text/")):
+                return
+            if isinstance(response, FileResponse):
+                return
+            if response.streaming:
+                if settings.snapshot.logging_body_capture_streaming:
+                    self._tee_streaming_body(
+                        response, log_data["correlation_id"], settings
+                    )
+                return
+            content = response.content
+            log_data["http"]["response_body"] = self._format_body(
+                content[: settings.body_max_bytes],
+                len(content),
+                settings.redactor,
+                content_type.startswith("application/json"),
+            )
+
+    def _format_body(
+        self, data: bytes, total_size: int, redactor: Redactor, is_json: bool = False
+    ) -> str:
+        """
+        Decode and redact a captured body prefix, marking it if the body was longer.
+
+        Args:
+            data: The captured bytes (at most LOGGING_BODY_MAX_BYTES)
+            total_size: The full body size in bytes
+            redactor: The redactor of the request's settings
+            is_json: Whether the body has a JSON content type
+
+        Returns:
+            The decoded body, with a truncation marker if it was cut
+        """
+        if total_size <= len(data):
+            try:
+                return redactor.redact_body(data.decode("utf-8"), is_json)
+            except UnicodeDecodeError:
+                return "[UNDECODABLE]"
+        # The cut may split a multi-byte character
+        text = redactor.redact_body(data.decode("utf-8", errors="replace"), is_json)
+        return f"{text}...[TRUNCATED {total_size - len(data)} bytes]"
+
+    def _capture_request_body(
+        self, request: HttpRequest, settings: LoggerSettings
+    ) -> str:
+        """
+        Capture at most LOGGING_BODY_MAX_BYTES of the request body.
+
+        The body is only read if its Content-Length fits in the cap, so large
+        uploads (and bodies of unknown length, e.g. chunked requests) are never
+        loaded into memory for logging, and a stream the view already consumed
+        is not touched.
+
+        Args:
+            request: The Django HttpRequest object
+            settings: The request's logger settings
+
+        Returns:
+            The captured body, or a marker if it was not captured
+        """
+        body = getattr(request, "_body", None)
+        if body is None:
+            if getattr(request, "_read_started", False):
+                return "[NOT CAPTURED: stream consumed]"
+            try:
+                content_length = int(request.META.get("CONTENT_LENGTH") or "")
+            except ValueError:
+                return "[NOT CAPTURED: unknown length]"
+            if content_length > settings.body_max_bytes:
+                return f"[NOT CAPTURED: {content_length} bytes]"
+            try:
+                body = request.body
+            except Exception:
+                return "[NOT CAPTURED]"
+        return self._format_body(
+            body[: settings.body_max_bytes],
+            len(body),
+            settings.redactor,
+            request.META.get("CONTENT_TYPE", "").startswith("application/json"),
+        )
+
+    def _tee_streaming_body(
+        self,
+        response: StreamingHttpResponse,
+        correlation_id: str,
+        settings: LoggerSettings,
+    ) -> None:
+        """
+        Capture the first bytes of a streaming response as it is sent.
+
+        The chunks are passed through unchanged; once the stream ends, the
+        captured prefix is logged as a separate response_body record.
+
+        Args:
+            response: The streaming response
+            correlation_id: The correlation ID for this request
+            settings: The request's logger settings
+        """
+        max_bytes = settings.body_max_bytes
+        is_json = response.get("Content-Type", "").startswith("application/json")
+        captured = bytearray()
+        total = 0
+
+        def capture(chunk) -> None:
+            nonlocal total
+            data = chunk.encode() if isinstance(chunk, str) else bytes(chunk)
+            total += len(data)
+            if len(captured) < max_bytes:
+                captured.extend(data[: max_bytes - len(captured)])
+
+        def emit() -> None:
+            self.logger.info(
+                "Response body",
+                extra={
+                    "event": "response_body",
+                    "correlation_id": correlation_id,
+                    "http": {
+                        "response_body": self._format_body(
+                            bytes(captured), total, settings.redactor, is_json
+                        )
+                    },
+                },
+            )
+
+        content = response.streaming_content
+        # is_async only exists from Django 4.2
+        if getattr(response, "is_async", False):
+
+            async def tee():
+                try:
+                    async for chunk in content:
+                        capture(chunk)
+                        yield chunk
+                finally:
+                    emit()
+
+        else:
+
+            def tee():
+                try:
+                    for chunk in content:
+                        capture(chunk)
+                        yield chunk
+                finally:
+                    emit()
+
+        response.streaming_content = tee()
+
     def log_request_start(self, request: HttpRequest, correlation_id: str) -> None:
         """
         Log the start of an HTTP request.
@@ -171,56 +969,43 @@ class StructuredLogger:
             correlation_id: The correlation ID for this request
         """
         try:
+            observation = get_observation(request, correlation_id)
             log_data = {
                 "event": "request_start",
-                "correlation_id": correlation_id,
-                "http": {
-                    "method": request.method,
-                    "url": request.build_absolute_uri(),
-                    "path": request.path,
-                    "query_string": request.META.get("QUERY_STRING", ""),
-                    "scheme": request.scheme,
-                    "host": request.get_host(),
-                    "user_agent": request.META.get("HTTP_USER_AGENT", ""),
-                    "view_name": get_view_name(request),
-                },
-                "network": {
-                    "client_ip": get_client_ip(request),
-                    "remote_addr": request.META.get("REMOTE_ADDR", ""),
-                },
+                **self._get_request_data(request, observation),
                 "timing": {
                     "start_time": time.time(),
                 },
             }
+            log_data["correlation_id"] = correlation_id
 
-            # Add user information if available
-            if hasattr(request, "user") and request.user.is_authenticated:
-                log_data["user"] = {
-                    "id": str(request.user.id),
-                    "username": request.user.username,
-                    "is_staff": request.user.is_staff,
-                    "is_superuser": request.user.is_superuser,
-                }
-
-            # Add request headers if enabled
-            if self.config.get("LOGGING_INCLUDE_HEADERS", False):
-                headers = sanitize_headers(
-                    request.META, self.config.get_sensitive_headers()
-                )
-                log_data["http"]["headers"] = headers
+            self.logger.info("Request started", extra=log_data)
 
-            # Add request body if enabled and safe
-            if self.config.get("LOGGING_INCLUDE_BODY", False) and self._should_log_body(
-                request
-            ):
-                try:
-                    body = request.body.decode("utf-8")
-                    log_data["http"]["body"] = body
-                except (UnicodeDecodeError, AttributeError):
-                    log_data["http"]["body"] = "[UNDECODABLE]"
+        except Exception as e:
+            self.logger.error(
+                "Failed to log request start",
+                exc_info=True,
+                extra={"correlation_id": correlation_id},
+            )
 
-            self.logger.info("Request started", extra=log_data)
+    def log_request_pending(self, request: HttpRequest, correlation_id: str) -> None:
+        """
+        Log a lightweight start record for a request expected to run long.
 
+        Args:
+            request: The Django HttpRequest object
+            correlation_id: The correlation ID for this request
+        """
+        try:
+            observation = get_observation(request, correlation_id)
+            self.logger.info(
+                "Request started",
+                extra={
+                    "event": "request_start",
+                    "correlation_id": correlation_id,
+                    "http": {"method": observation.method, "path": observation.path},
+                },
+            )
         except Exception as e:
             self.logger.error(
                 "Failed to log request start",
@@ -228,6 +1013,48 @@ class StructuredLogger:
                 extra={"correlation_id": correlation_id},
             )
 
+    def log_access(
+        self,
+        request: HttpRequest,
+        response: HttpResponse,
+        duration: float,
+        correlation_id: str,
+    ) -> None:
+        """
+        Log a single access record combining the request and response fields.
+
+        Args:
+            request: The Django HttpRequest object
+            response: The Django HttpResponse object
+            duration: The request duration in seconds
+            correlation_id: The correlation ID for this request
+        """
+        try:
+            observation = get_observation(request, correlation_id)
+            end_time = time.time()
+            log_data = {
+                "event": "request",
+                **self._get_request_data(request, observation),
+                "timing": {
+                    "start_time": end_time - duration,
+                    "duration_ms": duration * 1000,
+                    "end_time": end_time,
+                },
+            }
+            log_data["correlation_id"] = correlation_id
+            log_data["http"]["status_code"] = response.status_code
+            self._add_user_data(log_data, request)
+            self._add_response_data(log_data, response, observation)
+
+            self.logger.info("Request completed", extra=log_data)
+
+        except Exception as e:
+            self.logger.error(
+                "Failed to log request",
+                exc_info=True,
+                extra={"correlation_id": correlation_id},
+            )
+
     def log_request_end(
         self,
         request: HttpRequest,
@@ -245,15 +1072,16 @@ class StructuredLogger:
             correlation_id: The correlation ID for this request
         """
         try:
+            observation = get_observation(request, correlation_id)
             log_data = {
                 "event": "request_end",
                 "correlation_id": correlation_id,
                 "http": {
-                    "method": request.method,
-                    "url": request.build_absolute_uri(),
-                    "path": request.path,
+                    "method": observation.method,
+                    "url": observation.url,
+                    "path": observation.path,
                     "status_code": response.status_code,
-                    "view_name": get_view_name(request),
+                    "view_name": observation.view_name,
                 },
                 "timing": {
                     "duration_ms": duration * 1000,
@@ -261,24 +1089,8 @@ class StructuredLogger:
                 },
             }
 
-            # Add response headers if enabled
-            if self.config.get("LOGGING_INCLUDE_HEADERS", False):
-                headers = sanitize_headers(
-                    {k: v for k, v in response.items()},
-                    self.config.get_sensitive_headers(),
-                )
-                log_data["http"]["response_headers"] = headers
-
-            # Add response body if enabled and safe
-            if self.config.get("LOGGING_INCLUDE_BODY", False):
-                content_type = response.get("Content-Type", "").lower()
-                if content_type.startswith(("application/json", "text/")):
-                    try:
-                        log_data["http"]["response_body"] = response.content.decode(
-                            "utf-8"
-                        )
-                    except UnicodeDecodeError:
-                        log_data["http"]["response_body"] = "[UNDECODABLE]"
+            self._add_user_data(log_data, request)
+            self._add_response_data(log_data, response, observation)
 
             self.logger.info("Request completed", extra=log_data)
 
@@ -301,14 +1113,15 @@ class StructuredLogger:
             correlation_id: The correlation ID for this request
         """
         try:
+            observation = get_observation(request, correlation_id)
             log_data = {
                 "event": "exception",
                 "correlation_id": correlation_id,
                 "http": {
-                    "method": request.method,
-                    "url": request.build_absolute_uri(),
-                    "path": request.path,
-                    "view_name": get_view_name(request),
+                    "method": observation.method,
+                    "url": observation.url,
+                    "path": observation.path,
+                    "view_name": observation.view_name,
                 },
                 "exception": {
                     "type": exception.__class__.__name__,
@@ -324,3 +1137,50 @@ class StructuredLogger:
                 exc_info=True,
                 extra={"correlation_id": correlation_id},
             )
+
+    def request_started(self, observation: RequestObservation) -> None:
+        """Log the start of the observed request."""
+        if not self._policy_allows(observation, logging.INFO):
+            return
+        settings = self._settings_for(observation)
+        if settings.access_log:
+            log = self.log_request_pending
+            start_paths = settings.access_log_start_paths
+            if not start_paths or not observation.path.startswith(start_paths):
+                return
+        else:
+            log = self.log_request_start
+
+        # The outcome is not known yet, so only the head decision applies
+        sampler = settings.sampler
+        if sampler and not sampler.sample(observation):
+            sampler.record_sampled_out(observation)
+            return
+        log(observation.request, observation.correlation_id)
+
+    def request_finished(self, observation: RequestObservation) -> None:
+        """Log the completion of the observed request."""
+        if observation.response is None or not self._policy_allows(
+            observation, logging.INFO
+        ):
+            return
+        settings = self._settings_for(observation)
+        sampler = settings.sampler
+        if sampler and not sampler.keep(observation):
+            sampler.record_sampled_out(observation)
+            return
+        log = self.log_access if settings.access_log else self.log_request_end
+        log(
+            observation.request,
+            observation.response,
+            observation.duration,
+            observation.correlation_id,
+        )
+
+    def request_failed(
+        self, observation: RequestObservation, exception: Exception
+    ) -> None:
+        """Log the unhandled exception."""
+        if not self._policy_allows(observation, logging.ERROR):
+            return
+        self.log_exception(observation.request, exception, observation.correlation_id)
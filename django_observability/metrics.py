@@ -1,7 +1,9 @@
+import asyncio
+import contextvars
 import logging
-import re
+import os
 import time
-from typing import List, Optional
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
 
 from django import get_version as django_get_version
 from django.conf import settings
@@ -16,24 +18,115 @@ try:
         Histogram,
         Info,
         generate_latest,
+        multiprocess,
     )
 
     PROMETHEUS_AVAILABLE = True
 except ImportError:
     PROMETHEUS_AVAILABLE = False
 
-from django.core.cache import cache
-from django.db import connection
+from django.core.cache import caches
+from django.core.cache.backends.base import BaseCache
+from django.db import connections
+from django.db.backends.signals import connection_created
 from django.http import HttpRequest, HttpResponse
 
+from .cardinality import CardinalityLimiter, limit_labels
 from .config import ObservabilityConfig
-from .utils import get_view_name
+from .observation import ObservationSink, RequestObservation, get_observation
+from .policies import RoutePolicyTable
+from .utils import get_response_size
 
 logger = logging.getLogger("django_observability.metrics")
 
 # Singleton MetricsCollector instance
 _metrics_collector_instance = None
 
+# Cache backend methods instrumented for metrics. BaseCache implements several
+# of these on top of others (get_many -> get, incr -> get/set, a* -> sync);
+# nested calls are recorded only once, as the outermost operation.
+CACHE_OPERATIONS = (
+    "get",
+    "get_many",
+    "get_or_set",
+    "has_key",
+    "set",
+    "add",
+    "set_many",
+    "touch",
+    "delete",
+    "delete_many",
+    "incr",
+    "decr",
+)
+
+CACHE_DURATION_BUCKETS = [
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+]
+
+# Default bound on cached per-label-tuple request metric children
+DEFAULT_CHILD_CACHE_SIZE = 2048
+
+
+class RequestMetricChildren(NamedTuple):
+    """Pre-resolved metric children for one (method, endpoint, status, view) tuple."""
+
+    requests_total: Any
+    request_duration: Any
+    request_size: Any
+    response_size: Any
+
+
+# Set while an instrumented cache call is in progress in the current context
+_cache_call_active = contextvars.ContextVar(
+    "django_observability_cache_call_active", default=False
+)
+
+
+def get_multiprocess_dir() -> Optional[str]:
+    """Return the prometheus_client multiprocess directory, if configured."""
+    return os.environ.get(
+        "PROMETHEUS_MULTIPROC_DIR", os.environ.get("prometheus_multiproc_dir")
+    )
+
+
+def mark_process_dead(pid: int) -> None:
+    """
+    Clean up the live gauge files of a worker that has exited.
+
+    Only needed in multiprocess mode; a no-op otherwise.
+
+    Args:
+        pid: The process ID of the exited worker
+    """
+    if not PROMETHEUS_AVAILABLE or get_multiprocess_dir() is None:
+        return
+    try:
+        multiprocess.mark_process_dead(pid)
+        logger.debug(f"Marked metrics process dead: pid={pid}")
+    except Exception as e:
+        logger.error(f"Failed to mark metrics process {pid} dead: {e}")
+
+
+def child_exit(server: Any, worker: Any) -> None:
+    """
+    Gunicorn ``child_exit`` server hook for multiprocess metrics.
+
+    Use in gunicorn.conf.py:
+        from django_observability.metrics import child_exit
+    """
+    mark_process_dead(worker.pid)
+
 
 def get_metrics_collector(config: ObservabilityConfig) -> "MetricsCollector":
     """Return a singleton MetricsCollector instance."""
@@ -43,7 +136,7 @@ def get_metrics_collector(config: ObservabilityConfig) -> "MetricsCollector":
     return _metrics_collector_instance
 
 
-class MetricsCollector:
+class MetricsCollector(ObservationSink):
     """
     Collects and manages Prometheus metrics for Django applications.
 
@@ -64,6 +157,20 @@ class MetricsCollector:
         self.config = config
         self.registry = CollectorRegistry()
         self._initialized = False
+        self._db_instrumented = False
+        self._cache_instrumented = False
+        self._request_children: Dict[
+            Tuple[str, str, str, str], RequestMetricChildren
+        ] = {}
+        # Label tuples over the cardinality budget, mapped to the overflow children
+        self._overflow_children: Dict[
+            Tuple[str, str, str, str], RequestMetricChildren
+        ] = {}
+        self._child_cache_size = config.get(
+            "METRICS_CHILD_CACHE_SIZE", DEFAULT_CHILD_CACHE_SIZE
+        )
+        self._scrape_registry = None
+        self.multiprocess = self._resolve_multiprocess_mode()
 
         if not PROMETHEUS_AVAILABLE:
             logger.warning(
@@ -111,18 +218,57 @@ class MetricsCollector:
             registry=self.registry,
         )
 
-        # Exception Metrics
-        self.http_exceptions_total = Counter(
-            name=f"{prefix}_http_exceptions_total",
-            documentation="Total number of HTTP exceptions",
-            labelnames=["method", "endpoint", "exception_type"],
+        # Route policies with their own buckets get a histogram each, since a
+        # Prometheus metric has a single bucket layout
+        self.policy_request_duration_seconds: Dict[str, Histogram] = {}
+        for policy in RoutePolicyTable.from_config(self.config):
+            if policy.histogram_buckets is None:
+                continue
+            self.policy_request_duration_seconds[policy.name] = Histogram(
+                name=f"{prefix}_http_request_duration_{policy.metric_slug}_seconds",
+                documentation=f"HTTP request duration in seconds for the {policy.name} route policy",
+                labelnames=["method", "endpoint", "status", "view_name"],
+                buckets=policy.histogram_buckets,
+                registry=self.registry,
+            )
+
+        # Cardinality budget accounting
+        self.metrics_label_sets_rejected_total = Counter(
+            name=f"{prefix}_metrics_label_sets_rejected_total",
+            documentation="Label sets folded into the overflow series after a metric exhausted its cardinality budget",
+            labelnames=["metric"],
             registry=self.registry,
         )
 
+        # Request metrics share one budget keyed by (method, endpoint, status, view_name)
+        self._request_limiter = self._create_limiter(
+            f"{prefix}_http_requests",
+            targets=[
+                (self.http_requests_total, (0, 1, 2, 3)),
+                (self.http_request_duration_seconds, (0, 1, 2, 3)),
+                (self.http_request_size_bytes, (0, 1)),
+                (self.http_response_size_bytes, (0, 1, 2)),
+            ],
+            overflow_indices=(1, 3),
+            on_evict=self._clear_request_children,
+        )
+
+        # Exception Metrics
+        self.http_exceptions_total = self._bounded(
+            Counter(
+                name=f"{prefix}_http_exceptions_total",
+                documentation="Total number of HTTP exceptions",
+                labelnames=["method", "endpoint", "exception_type"],
+                registry=self.registry,
+            ),
+            overflow_indices=(1, 2),
+        )
+
         # Django-specific Metrics
         self.django_active_requests = Gauge(
             name=f"{prefix}_django_active_requests",
             documentation="Number of active HTTP requests",
+            multiprocess_mode="livesum",
             registry=self.registry,
         )
 
@@ -147,25 +293,139 @@ class MetricsCollector:
             registry=self.registry,
         )
 
-        # Application Info
-        self.django_info = Info(
-            name=f"{prefix}_django_info",
-            documentation="Django application information",
+        self.django_cache_operation_duration_seconds = Histogram(
+            name=f"{prefix}_django_cache_operation_duration_seconds",
+            documentation="Cache operation duration in seconds",
+            labelnames=["cache_name", "operation"],
+            buckets=CACHE_DURATION_BUCKETS,
+            registry=self.registry,
+        )
+
+        # Span export pipeline
+        self.tracing_span_queue_size = Gauge(
+            name=f"{prefix}_tracing_span_queue_size",
+            documentation="Spans waiting in the export queue",
+            multiprocess_mode="livesum",
+            registry=self.registry,
+        )
+
+        self.tracing_spans_dropped_total = Counter(
+            name=f"{prefix}_tracing_spans_dropped_total",
+            documentation="Spans dropped because the export queue was full",
+            registry=self.registry,
+        )
+
+        self.tracing_spans_exported_total = Counter(
+            name=f"{prefix}_tracing_spans_exported_total",
+            documentation="Spans handed to the exporter",
+            labelnames=["result"],
+            registry=self.registry,
+        )
+
+        self.tracing_span_export_duration_seconds = Histogram(
+            name=f"{prefix}_tracing_span_export_duration_seconds",
+            documentation="Span batch export duration in seconds",
             registry=self.registry,
         )
 
-        # Set application info
-        self.django_info.info(
-            {
-                "version": getattr(settings, "VERSION", "unknown"),
-                "environment": getattr(settings, "ENVIRONMENT", "unknown"),
-                "debug": str(settings.DEBUG),
-                "django_version": self._get_django_version(),
-            }
+        self.logging_records_dropped_total = Counter(
+            name=f"{prefix}_logging_records_dropped_total",
+            documentation="Log records dropped because the log queue was full",
+            registry=self.registry,
+        )
+
+        self.logging_records_sampled_out_total = Counter(
+            name=f"{prefix}_logging_records_sampled_out_total",
+            documentation="Request log records skipped by log sampling",
+            labelnames=["endpoint"],
+            registry=self.registry,
         )
 
+        # Application Info
+        app_info = {
+            "version": getattr(settings, "VERSION", "unknown"),
+            "environment": getattr(settings, "ENVIRONMENT", "unknown"),
+            "debug": str(settings.DEBUG),
+            "django_version": self._get_django_version(),
+        }
+        if self.multiprocess:
+            # Info metrics are not supported by the multiprocess collector
+            self.django_info = Gauge(
+                name=f"{prefix}_django_info",
+                documentation="Django application information",
+                labelnames=sorted(app_info),
+                multiprocess_mode="max",
+                registry=self.registry,
+            )
+            self.django_info.labels(**app_info).set(1)
+        else:
+            self.django_info = Info(
+                name=f"{prefix}_django_info",
+                documentation="Django application information",
+                registry=self.registry,
+            )
+            self.django_info.info(app_info)
+
         logger.info("Prometheus metrics initialized")
 
+    def _create_limiter(
+        self,
+        name: str,
+        targets: list,
+        overflow_indices: Optional[tuple] = None,
+        on_evict: Optional[Callable[[], None]] = None,
+    ) -> CardinalityLimiter:
+        """Create a cardinality limiter using the configured budget and TTL."""
+        return CardinalityLimiter(
+            name,
+            targets,
+            limit=self.config.get("METRICS_CARDINALITY_LIMIT", 1000),
+            overflow_indices=overflow_indices,
+            ttl=self.config.get("METRICS_CARDINALITY_TTL"),
+            rejected_counter=self.metrics_label_sets_rejected_total,
+            on_evict=on_evict,
+        )
+
+    def _bounded(self, metric: Any, overflow_indices: Optional[tuple] = None) -> Any:
+        """Subject a labelled metric's label sets to the budget; returns the metric."""
+        if not metric._labelnames:
+            return metric
+        limiter = self._create_limiter(
+            metric._name,
+            targets=[(metric, tuple(range(len(metric._labelnames))))],
+            overflow_indices=overflow_indices,
+        )
+        return limit_labels(metric, limiter)
+
+    def _resolve_multiprocess_mode(self) -> bool:
+        """
+        Decide whether metrics are aggregated across worker processes.
+
+        METRICS_MULTIPROCESS defaults to auto-detection from the
+        PROMETHEUS_MULTIPROC_DIR environment variable, which prometheus_client
+        requires to be set before any metric is created.
+        """
+        setting = self.config.get("METRICS_MULTIPROCESS")
+        directory = get_multiprocess_dir()
+        if setting is None:
+            return directory is not None
+        if setting and directory is None:
+            logger.error(
+                "METRICS_MULTIPROCESS is enabled but PROMETHEUS_MULTIPROC_DIR is not set. Falling back to per-process metrics."
+            )
+            return False
+        return bool(setting)
+
+    def _get_scrape_registry(self) -> Any:
+        """Return the registry to expose: aggregated across workers in multiprocess mode."""
+        if not self.multiprocess:
+            return self.registry
+        if self._scrape_registry is None:
+            registry = CollectorRegistry()
+            multiprocess.MultiProcessCollector(registry)
+            self._scrape_registry = registry
+        return self._scrape_registry
+
     def _get_django_version(self) -> str:
         """Get Django version."""
         try:
@@ -186,117 +446,212 @@ class MetricsCollector:
             logger.error(f"Failed to setup metrics instrumentations: {e}")
 
     def _instrument_database(self) -> None:
-        """Instrument database queries for metrics."""
-        try:
-            original_execute = connection.cursor().execute
-
-            def wrapped_execute(cursor, sql, params=()):
-                logger.debug(f"Executing query: {sql}, params={params}")
-                start_time = time.time()
-                try:
-                    result = original_execute(cursor, sql, params)
-                    duration = time.time() - start_time
-                    query_type = self._get_query_type(sql)
-                    logger.debug(
-                        f"Query completed: type={query_type}, duration={duration}"
-                    )
-                    self.record_db_query(
-                        db_alias=connection.alias,
-                        query_type=query_type,
-                        duration=duration,
-                    )
-                    return result
-                except Exception as e:
-                    logger.error(f"Query failed: {e}")
-                    self.increment_exception_counter(None, e)
-                    raise
+        """
+        Instrument database queries for metrics.
 
-            import types
+        Installs an execute wrapper on every connection alias, and on every
+        connection opened later in any thread, through the connection_created
+        signal. Safe to call repeatedly: the install happens only once.
+        """
+        if self._db_instrumented:
+            return
 
-            connection.cursor().execute = types.MethodType(
-                wrapped_execute, connection.cursor()
+        try:
+            connection_created.connect(
+                self._on_connection_created,
+                weak=False,
+                dispatch_uid=f"django_observability.metrics.db.{id(self)}",
             )
+            for conn in connections.all():
+                self._add_execute_wrapper(conn)
+            self._db_instrumented = True
             logger.info("Database metrics instrumentation enabled")
         except Exception as e:
             logger.error(f"Failed to record database instrumentation: {e}")
 
+    def _on_connection_created(self, sender, connection, **kwargs) -> None:
+        """Attach the execute wrapper to a newly opened connection."""
+        self._add_execute_wrapper(connection)
+
+    def _add_execute_wrapper(self, conn) -> None:
+        """Attach the execute wrapper to a connection unless already present."""
+        if self._execute_wrapper not in conn.execute_wrappers:
+            # Outermost, so the stack of connection.execute_wrapper() blocks
+            # opened around the connection's creation still pops their own
+            conn.execute_wrappers.insert(0, self._execute_wrapper)
+
+    def _execute_wrapper(self, execute, sql, params, many, context):
+        """
+        Django execute wrapper recording query count and latency.
+
+        Covers both cursor.execute() and cursor.executemany().
+        """
+        start_time = time.time()
+        try:
+            result = execute(sql, params, many, context)
+        except Exception as e:
+            logger.error(f"Query failed: {e}")
+            self.increment_exception_counter(None, e)
+            raise
+        duration = time.time() - start_time
+        query_type = self._get_query_type(sql)
+        logger.debug(
+            f"Query completed: type={query_type}, many={many}, duration={duration}"
+        )
+        self.record_db_query(
+            db_alias=context["connection"].alias,
+            query_type=query_type,
+            duration=duration,
+        )
+        return result
+
     def _instrument_cache(self) -> None:
-        """Instrument cache operations for metrics."""
+        """
+        Instrument cache operations for metrics.
+
+        Wraps the backend returned for every alias in django.core.cache.caches,
+        both the ones already created in this thread and every backend created
+        later in any thread. Safe to call repeatedly: each backend is wrapped
+        once.
+        """
+        if self._cache_instrumented:
+            return
+
         try:
-            original_get = cache.get
-            original_set = cache.set
-            original_get_many = cache.get_many
+            original_create_connection = caches.create_connection
 
-            def wrapped_get(key, *args, **kwargs):
-                logger.debug(f"Cache get: key={key}")
-                try:
-                    start_time = time.time()
-                    result = original_get(key, *args, **kwargs)
-                    duration = time.time() - start_time
-                    self.record_cache_operation(
-                        cache_name="default",
-                        operation="get",
-                        result="hit" if result is not None else "miss",
-                    )
-                    logger.debug(f"Cache get completed: key={key}, duration={duration}")
-                    return result
-                except Exception as e:
-                    logger.error(f"Failed to record cache operation: {e}")
-                    self.record_cache_operation(
-                        cache_name="default", operation="get", result="error"
-                    )
-                    raise
+            def create_connection(alias):
+                backend = original_create_connection(alias)
+                self._instrument_cache_backend(alias, backend)
+                return backend
 
-            def wrapped_set(key, value, timeout=None, *args, **kwargs):
-                logger.debug(f"Cache set: key={key}")
-                try:
-                    start_time = time.time()
-                    result = original_set(key, value, timeout, *args, **kwargs)
-                    duration = time.time() - start_time
-                    self.record_cache_operation(
-                        cache_name="default", operation="set", result="success"
-                    )
-                    logger.debug(f"Cache set completed: key={key}, duration={duration}")
-                    return result
-                except Exception as e:
-                    logger.error(f"Failed to record cache operation: {e}")
-                    self.record_cache_operation(
-                        cache_name="default", operation="set", result="error"
-                    )
-                    raise
+            caches.create_connection = create_connection
+            for alias in caches:
+                self._instrument_cache_backend(alias, caches[alias])
+            self._cache_instrumented = True
+            logger.info("Cache metrics instrumentation enabled")
+        except Exception as e:
+            logger.error(f"Failed to record cache instrumentation: {e}")
+
+    def _instrument_cache_backend(self, alias: str, backend: BaseCache) -> None:
+        """
+        Wrap the cache operations of a single backend instance.
+
+        Async variants are wrapped only when the backend implements them
+        natively; BaseCache's defaults delegate to the sync methods.
+        """
+        if getattr(backend, "_observability_collector", None) is self:
+            return
 
-            def wrapped_get_many(keys, *args, **kwargs):
-                logger.debug(f"Cache get_many: keys={keys}")
+        backend_class = type(backend)
+        for operation in CACHE_OPERATIONS:
+            method = getattr(backend, operation, None)
+            if method is not None:
+                setattr(
+                    backend,
+                    operation,
+                    self._wrap_cache_method(alias, operation, method),
+                )
+
+            async_operation = f"a{operation}"
+            async_method = getattr(backend, async_operation, None)
+            if async_method is not None and getattr(
+                backend_class, async_operation, None
+            ) is not getattr(BaseCache, async_operation, None):
+                setattr(
+                    backend,
+                    async_operation,
+                    self._wrap_cache_method(alias, async_operation, async_method),
+                )
+
+        backend._observability_collector = self
+        logger.debug(f"Cache backend instrumented: alias={alias}")
+
+    def _wrap_cache_method(
+        self, alias: str, operation: str, method: Callable
+    ) -> Callable:
+        """Return a sync or async wrapper recording latency and result."""
+        if asyncio.iscoroutinefunction(method):
+
+            async def async_wrapped(*args, **kwargs):
+                if _cache_call_active.get():
+                    return await method(*args, **kwargs)
+                token = _cache_call_active.set(True)
+                start_time = time.time()
                 try:
-                    start_time = time.time()
-                    result = original_get_many(keys, *args, **kwargs)
-                    duration = time.time() - start_time
-                    self.record_cache_operation(
-                        cache_name="default",
-                        operation="get_many",
-                        result="hit" if result else "miss",
-                    )
-                    logger.debug(
-                        f"Cache get_many completed: keys={keys}, duration={duration}"
-                    )
-                    return result
+                    result = await method(*args, **kwargs)
                 except Exception as e:
-                    logger.error(f"Failed to record cache operation: {e}")
+                    logger.debug(f"Cache {operation} failed: {e}")
                     self.record_cache_operation(
-                        cache_name="default", operation="get_many", result="error"
+                        alias, operation, "error", time.time() - start_time
                     )
                     raise
+                finally:
+                    _cache_call_active.reset(token)
+                self._record_cache_result(
+                    alias, operation, result, args, kwargs, time.time() - start_time
+                )
+                return result
+
+            return async_wrapped
+
+        def wrapped(*args, **kwargs):
+            if _cache_call_active.get():
+                return method(*args, **kwargs)
+            token = _cache_call_active.set(True)
+            start_time = time.time()
+            try:
+                result = method(*args, **kwargs)
+            except Exception as e:
+                logger.debug(f"Cache {operation} failed: {e}")
+                self.record_cache_operation(
+                    alias, operation, "error", time.time() - start_time
+                )
+                raise
+            finally:
+                _cache_call_active.reset(token)
+            self._record_cache_result(
+                alias, operation, result, args, kwargs, time.time() - start_time
+            )
+            return result
 
-            cache.get = wrapped_get
-            cache.set = wrapped_set
-            cache.get_many = wrapped_get_many
-            logger.info("Cache metrics instrumentation enabled")
-        except Exception as e:
-            logger.error(f"Failed to record cache instrumentation: {e}")
+        return wrapped
+
+    def _record_cache_result(
+        self,
+        alias: str,
+        operation: str,
+        result: Any,
+        args: tuple,
+        kwargs: dict,
+        duration: float,
+    ) -> None:
+        """Classify a completed cache call as hit/miss/success and record it."""
+        base_operation = operation
+        if operation.startswith("a") and operation[1:] in CACHE_OPERATIONS:
+            base_operation = operation[1:]
+        if base_operation == "get":
+            default = args[1] if len(args) > 1 else kwargs.get("default")
+            outcome = "miss" if result is None or result is default else "hit"
+        elif base_operation == "has_key":
+            outcome = "hit" if result else "miss"
+        elif base_operation == "get_many":
+            keys = args[0] if args else kwargs.get("keys", ())
+            hits = len(result) if result else 0
+            self.record_cache_operation(alias, operation, "hit", duration, hits)
+            try:
+                misses = len(keys) - hits
+            except TypeError:
+                misses = 0
+            self.record_cache_operation(alias, operation, "miss", None, misses)
+            return
+        else:
+            outcome = "success"
+        self.record_cache_operation(alias, operation, outcome, duration)
 
     def _get_query_type(self, sql: str) -> str:
         """Determine the type of SQL query."""
-        sql = sql.strip().upper()
+        sql = sql.lstrip()[:6].upper()
         if sql.startswith("SELECT"):
             return "SELECT"
         elif sql.startswith("INSERT"):
@@ -324,8 +679,6 @@ class MetricsCollector:
             f"MetricsCollector: Starting request {request.method} {request.path}"
         )
         self.increment_request_counter(request)
-        self._instrument_database()
-        self._instrument_cache()
 
     def end_request(
         self, request: HttpRequest, response: HttpResponse, duration: float
@@ -379,34 +732,109 @@ class MetricsCollector:
             return
 
         try:
-            method = request.method
+            observation = get_observation(request)
+            method = observation.method
             endpoint = self._get_endpoint_label(request)
             status = str(response.status_code)
-            view_name = get_view_name(request)
+            view_name = observation.view_name
 
             logger.debug(
                 f"Recording duration: method={method}, endpoint={endpoint}, status={status}, view_name={view_name}, duration={duration}"
             )
 
-            self.http_request_duration_seconds.labels(
-                method=method, endpoint=endpoint, status=status, view_name=view_name
-            ).observe(duration)
+            children = self._get_request_children(method, endpoint, status, view_name)
+            children.request_duration.observe(duration)
+            policy_histogram = self.policy_request_duration_seconds.get(
+                observation.policy.name
+            )
+            if policy_histogram is not None:
+                # Policy routes are few and named, so their series stay bounded
+                policy_histogram.labels(method, endpoint, status, view_name).observe(
+                    duration
+                )
 
             request_size = self._get_request_size(request)
             if request_size > 0:
-                self.http_request_size_bytes.labels(
-                    method=method, endpoint=endpoint
-                ).observe(request_size)
+                children.request_size.observe(request_size)
 
-            response_size = self._get_response_size(response)
+            response_size = (
+                observation.response_size
+                if observation.response is response
+                else self._get_response_size(response)
+            )
             if response_size > 0:
-                self.http_response_size_bytes.labels(
-                    method=method, endpoint=endpoint, status=status
-                ).observe(response_size)
+                children.response_size.observe(response_size)
 
         except Exception as e:
             logger.error(f"Failed to record request duration: {e}")
 
+    def _get_request_children(
+        self, method: str, endpoint: str, status: str, view_name: str
+    ) -> RequestMetricChildren:
+        """
+        Return the request metric children for a label tuple.
+
+        Resolving a child through .labels() takes a lock and kwargs handling on
+        every call, so resolved children are cached per label tuple. The cache
+        is bounded by METRICS_CHILD_CACHE_SIZE and is cleared when full. Label
+        tuples over the cardinality budget are cached too, mapped to the
+        overflow children, so they are admitted and counted only once.
+
+        Args:
+            method: The HTTP method
+            endpoint: The endpoint label
+            status: The response status code
+            view_name: The resolved view name
+
+        Returns:
+            The children for http requests, duration, request and response size
+        """
+        key = (method, endpoint, status, view_name)
+        children = self._request_children.get(key)
+        if children is not None:
+            if self._request_limiter.ttl:
+                self._request_limiter.touch(key)
+            return children
+        children = self._overflow_children.get(key)
+        if children is not None:
+            return children
+
+        admitted = self._request_limiter.admit(key)
+        if admitted is not key:
+            # Over budget: record under the overflow series
+            cache = self._overflow_children
+            children = self._resolve_request_children(*admitted)
+        else:
+            cache = self._request_children
+            children = self._resolve_request_children(*key)
+
+        if len(cache) >= self._child_cache_size:
+            cache.clear()
+        cache[key] = children
+        return children
+
+    def _clear_request_children(self) -> None:
+        """Drop cached request children after the limiter evicted label sets."""
+        self._request_children.clear()
+        self._overflow_children.clear()
+
+    def _resolve_request_children(
+        self, method: str, endpoint: str, status: str, view_name: str
+    ) -> RequestMetricChildren:
+        """Resolve the request metric children for a label tuple via .labels()."""
+        return RequestMetricChildren(
+            requests_total=self.http_requests_total.labels(
+                method, endpoint, status, view_name
+            ),
+            request_duration=self.http_request_duration_seconds.labels(
+                method, endpoint, status, view_name
+            ),
+            request_size=self.http_request_size_bytes.labels(method, endpoint),
+            response_size=self.http_response_size_bytes.labels(
+                method, endpoint, status
+            ),
+        )
+
     def increment_response_counter(
         self, request: HttpRequest, response: HttpResponse
     ) -> None:
@@ -421,18 +849,19 @@ class MetricsCollector:
             return
 
         try:
-            method = request.method
+            observation = get_observation(request)
+            method = observation.method
             endpoint = self._get_endpoint_label(request)
             status = str(response.status_code)
-            view_name = get_view_name(request)
+            view_name = observation.view_name
 
             logger.debug(
                 f"Incrementing response counter: method={method}, endpoint={endpoint}, status={status}, view_name={view_name}"
             )
 
-            self.http_requests_total.labels(
-                method=method, endpoint=endpoint, status=status, view_name=view_name
-            ).inc()
+            self._get_request_children(
+                method, endpoint, status, view_name
+            ).requests_total.inc()
 
             self.django_active_requests.dec()
             logger.debug(
@@ -502,7 +931,12 @@ class MetricsCollector:
             logger.error(f"Failed to record DB query metrics: {e}")
 
     def record_cache_operation(
-        self, cache_name: str, operation: str, result: str
+        self,
+        cache_name: str,
+        operation: str,
+        result: str,
+        duration: Optional[float] = None,
+        count: int = 1,
     ) -> None:
         """
         Record cache operation metrics.
@@ -511,21 +945,92 @@ class MetricsCollector:
             cache_name: The cache name/alias
             operation: The operation type (get, set, delete, etc.)
             result: The result (hit, miss, success, error)
+            duration: The operation duration in seconds (optional)
+            count: Number of keys the result applies to
         """
         if not self.is_available():
             return
 
         try:
             logger.debug(
-                f"Recording cache operation: cache_name={cache_name}, operation={operation}, result={result}"
+                f"Recording cache operation: cache_name={cache_name}, operation={operation}, result={result}, duration={duration}"
             )
-            self.django_cache_operations_total.labels(
-                cache_name=cache_name, operation=operation, result=result
-            ).inc()
+            if count > 0:
+                self.django_cache_operations_total.labels(
+                    cache_name=cache_name, operation=operation, result=result
+                ).inc(count)
+
+            if duration is not None:
+                self.django_cache_operation_duration_seconds.labels(
+                    cache_name=cache_name, operation=operation
+                ).observe(duration)
 
         except Exception as e:
             logger.error(f"Failed to record cache operation metrics: {e}")
 
+    def instrument_span_processor(self, processor: Any) -> None:
+        """
+        Report queue depth, drops and export latency of a batch span processor.
+
+        Args:
+            processor: A MonitoredBatchSpanProcessor
+        """
+        if not self.is_available() or processor is None:
+            return
+
+        processor.on_drop = self.tracing_spans_dropped_total.inc
+        processor.on_export = self.record_span_export
+        logger.debug("Span processor instrumented")
+
+    def instrument_log_handler(self, handler: Any) -> None:
+        """
+        Count records dropped by a bounded log queue handler.
+
+        Args:
+            handler: A BoundedQueueHandler
+        """
+        if not self.is_available() or handler is None:
+            return
+
+        handler.on_drop = self.logging_records_dropped_total.inc
+        logger.debug("Log queue handler instrumented")
+
+    def instrument_log_sampler(self, sampler: Any) -> None:
+        """
+        Count request log records skipped by a log sampler, per endpoint.
+
+        Args:
+            sampler: A LogSampler, or a StructuredLogger to instrument its current
+                and reloaded samplers
+        """
+        if not self.is_available() or sampler is None:
+            return
+
+        counter = self.logging_records_sampled_out_total
+        sampler.on_sampled_out = lambda endpoint: counter.labels(endpoint).inc()
+        logger.debug("Log sampler instrumented")
+
+    def record_span_export(
+        self, duration: float, span_count: int, success: bool, queue_size: int
+    ) -> None:
+        """
+        Record span export metrics. Called from the span processor's export thread.
+
+        Args:
+            duration: The export duration in seconds
+            span_count: Number of spans in the batch
+            success: Whether the exporter reported success
+            queue_size: Spans still queued after the batch was taken
+        """
+        try:
+            self.tracing_span_export_duration_seconds.observe(duration)
+            self.tracing_spans_exported_total.labels(
+                "success" if success else "failure"
+            ).inc(span_count)
+            self.tracing_span_queue_size.set(queue_size)
+        except Exception as e:
+            logger.error(f"Failed to record span export metrics: {e}")
+
     def _get_endpoint_label(self, request: Optional[HttpRequest]) -> str:
         """
         Generate endpoint label for metrics.
@@ -539,16 +1044,7 @@ class MetricsCollector:
         if not request:
             return "unknown"
 
-        if hasattr(request, "resolver_match") and request.resolver_match:
-            url_name = request.resolver_match.url_name
-            if url_name:
-                return url_name
-
-        path = request.path
-        path = re.sub(r"/\d+/", "/{id}/", path)
-        path = re.sub(r"/[0-9a-f-]{36}/", "/{uuid}/", path)
-
-        return path.lstrip("/")
+        return get_observation(request).endpoint
 
     def _get_request_size(self, request: HttpRequest) -> int:
         """Get request content size in bytes."""
@@ -566,12 +1062,25 @@ class MetricsCollector:
 
     def _get_response_size(self, response: HttpResponse) -> int:
         """Get response content size in bytes."""
-        try:
-            if hasattr(response, "content"):
-                return len(response.content)
-            return 0
-        except:
-            return 0
+        return get_response_size(response)
+
+    def request_started(self, observation: RequestObservation) -> None:
+        """Track the request as active."""
+        self.start_request(observation.request)
+
+    def request_finished(self, observation: RequestObservation) -> None:
+        """Record request metrics once a response is available."""
+        if observation.response is None:
+            return
+        self.end_request(
+            observation.request, observation.response, observation.duration
+        )
+
+    def request_failed(
+        self, observation: RequestObservation, exception: Exception
+    ) -> None:
+        """Record the unhandled exception."""
+        self.increment_exception_counter(observation.request, exception)
 
     def get_metrics(self) -> str:
         """
@@ -584,7 +1093,7 @@ class MetricsCollector:
             return ""
 
         try:
-            return generate_latest(self.registry).decode("utf-8")
+            return generate_latest(self._get_scrape_registry()).decode("utf-8")
         except Exception as e:
             logger.error(f"Failed to generate metrics: {e}")
             return ""
@@ -605,7 +1114,8 @@ class MetricsCollector:
             labelnames: Optional label names
 
         Returns:
-            The created counter, or None if metrics are not available or creation fails
+            The created counter (bounded by the cardinality budget when labelled),
+            or None if metrics are not available or creation fails
         """
         if not self.is_available():
             return None
@@ -613,12 +1123,13 @@ class MetricsCollector:
         try:
             prefix = self.config.get_metrics_prefix()
             metric_name = f"{prefix}_{name}_total"
-            return Counter(
+            metric = Counter(
                 name=metric_name,
                 documentation=documentation,
                 labelnames=labelnames or [],
                 registry=self.registry,
             )
+            return self._bounded(metric)
         except Exception as e:
             logger.error(
                 f"Failed to create custom counter {metric_name}: {e}", exc_info=True
@@ -642,7 +1153,8 @@ class MetricsCollector:
             buckets: Optional histogram buckets
 
         Returns:
-            The created histogram, or None if metrics are not available or creation fails
+            The created histogram (bounded by the cardinality budget when labelled),
+            or None if metrics are not available or creation fails
         """
         if not self.is_available():
             return None
@@ -650,13 +1162,14 @@ class MetricsCollector:
         try:
             prefix = self.config.get_metrics_prefix()
             metric_name = f"{prefix}_{name}"
-            return Histogram(
+            metric = Histogram(
                 name=metric_name,
                 documentation=documentation,
                 labelnames=labelnames or [],
                 buckets=buckets or self.config.get("METRICS_HISTOGRAM_BUCKETS"),
                 registry=self.registry,
             )
+            return self._bounded(metric)
         except Exception as e:
             logger.error(
                 f"Failed to create custom histogram {metric_name}: {e}", exc_info=True
@@ -664,7 +1177,11 @@ class MetricsCollector:
             return None
 
     def create_custom_gauge(
-        self, name: str, documentation: str, labelnames: Optional[List[str]] = None
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Optional[List[str]] = None,
+        multiprocess_mode: str = "all",
     ) -> Optional[Gauge]:
         """
         Create a custom gauge metric.
@@ -673,9 +1190,12 @@ class MetricsCollector:
             name: The metric name
             documentation: The metric documentation
             labelnames: Optional label names
+            multiprocess_mode: How values are combined across workers in
+                multiprocess mode (all, liveall, min, max, sum, livesum, ...)
 
         Returns:
-            The created gauge, or None if metrics are not available or creation fails
+            The created gauge (bounded by the cardinality budget when labelled),
+            or None if metrics are not available or creation fails
         """
         if not self.is_available():
             return None
@@ -683,12 +1203,14 @@ class MetricsCollector:
         try:
             prefix = self.config.get_metrics_prefix()
             metric_name = f"{prefix}_{name}"
-            return Gauge(
+            metric = Gauge(
                 name=metric_name,
                 documentation=documentation,
                 labelnames=labelnames or [],
+                multiprocess_mode=multiprocess_mode,
                 registry=self.registry,
             )
+            return self._bounded(metric)
         except Exception as e:
             logger.error(
                 f"Failed to create custom gauge {metric_name}: {e}", exc_info=True
@@ -8,22 +8,42 @@ including distributed tracing, metrics collection, and structured logging.
 import logging
 import time
 import uuid
-from typing import Callable, Optional
+from typing import Any, Callable, Optional
 
 from django.core.exceptions import MiddlewareNotUsed
 from django.http import HttpRequest, HttpResponse
 from django.utils.deprecation import MiddlewareMixin
 
 from .config import get_config
+from .context import bind_observation, unbind_observation
 from .exceptions import ObservabilityError
 from .logging import StructuredLogger
 from .metrics import get_metrics_collector
+from .observation import RequestObservation, get_observation
+from .reload import get_reloader
 from .tracing import TracingManager
-from .utils import is_excluded_path
 
 logger = logging.getLogger("django_observability")
 
 
+def apply_reloaded_config(middleware: Any, config: Any) -> None:
+    """
+    Swap a reloaded configuration into a middleware and its sinks.
+
+    The compiled snapshot is replaced by reference, and each request keeps the
+    snapshot it started with; feature switches (TRACING_ENABLED etc.) only apply
+    at startup.
+
+    Args:
+        middleware: An ObservabilityMiddleware or AsyncObservabilityMiddleware
+        config: The reloaded configuration
+    """
+    middleware.config = config
+    middleware.snapshot = config.compile()
+    for sink in middleware.sinks:
+        sink.apply_config(config)
+
+
 class ObservabilityMiddleware(MiddlewareMixin):
     """
     Main observability middleware that coordinates tracing, metrics, and logging.
@@ -49,6 +69,9 @@ class ObservabilityMiddleware(MiddlewareMixin):
             logger.info("Django Observability is disabled")
             raise MiddlewareNotUsed("Django Observability is disabled")
 
+        # Settings read on every request
+        self.snapshot = self.config.compile()
+
         # Initialize components
         self.tracing_manager = (
             TracingManager(self.config) if self.config.is_tracing_enabled() else None
@@ -61,6 +84,27 @@ class ObservabilityMiddleware(MiddlewareMixin):
         self.structured_logger = (
             StructuredLogger(self.config) if self.config.is_logging_enabled() else None
         )
+        if self.tracing_manager and self.metrics_collector:
+            self.metrics_collector.instrument_span_processor(
+                self.tracing_manager.span_processor
+            )
+        if self.structured_logger and self.metrics_collector:
+            self.metrics_collector.instrument_log_handler(
+                self.structured_logger.queue_handler
+            )
+            self.metrics_collector.instrument_log_sampler(self.structured_logger)
+        self.sinks = [
+            sink
+            for sink in (
+                self.tracing_manager,
+                self.structured_logger,
+                self.metrics_collector,
+            )
+            if sink
+        ]
+        self.reloader = get_reloader()
+        self.reloader.configure(self.config)
+        self.reloader.register(self)
 
         super().__init__(get_response)
 
@@ -74,6 +118,15 @@ class ObservabilityMiddleware(MiddlewareMixin):
             },
         )
 
+    def apply_config(self, config) -> None:
+        """
+        Swap in a reloaded configuration.
+
+        Args:
+            config: The reloaded configuration
+        """
+        apply_reloaded_config(self, config)
+
     def process_request(self, request: HttpRequest) -> Optional[HttpResponse]:
         """
         Process incoming request - start tracing, add correlation ID, log request.
@@ -84,34 +137,34 @@ class ObservabilityMiddleware(MiddlewareMixin):
         Returns:
             None to continue processing, or HttpResponse to short-circuit
         """
-        if is_excluded_path(request.path, self.config.get("EXCLUDE_PATHS", [])):
+        self.reloader.check()
+        snapshot = self.snapshot
+        if snapshot.is_excluded(request.path):
             logger.debug(f"Skipping request due to excluded path: {request.path}")
             return None
 
         # Add correlation ID to request
         correlation_id = str(uuid.uuid4())
+        start_time = time.time()
+        observation = RequestObservation(request, correlation_id, start_time)
+        observation.snapshot = snapshot
+        observation.policy = snapshot.route_policies.resolve(observation)
+        if observation.policy.exclude:
+            logger.debug(f"Skipping request excluded by route policy: {request.path}")
+            return None
+
         request.observability_correlation_id = correlation_id
-        request.observability_start_time = time.time()
+        request.observability_start_time = start_time
+        request.observability_observation = observation
+        observation.context_token = bind_observation(observation)
 
         try:
             logger.debug(
                 f"Processing request: {request.method} {request.path}, correlation_id={correlation_id}"
             )
-            # Start tracing
-            if self.tracing_manager:
-                span = self.tracing_manager.start_request_span(request, correlation_id)
-                request.observability_span = span
-
-            # Log incoming request
-            if self.structured_logger:
-                self.structured_logger.log_request_start(request, correlation_id)
-
-            # Increment request counter
-            if self.metrics_collector:
-                logger.debug(
-                    f"Calling start_request for {request.method} {request.path}"
-                )
-                self.metrics_collector.start_request(request)
+            # Start tracing, log the request and track it as active
+            for sink in self.sinks:
+                sink.request_started(observation)
 
         except Exception as e:
             logger.error(
@@ -119,7 +172,7 @@ class ObservabilityMiddleware(MiddlewareMixin):
                 exc_info=True,
                 extra={"correlation_id": correlation_id},
             )
-            if self.config.get("DEBUG_MODE", False):
+            if snapshot.debug_mode:
                 raise ObservabilityError(f"Failed to process request: {e}") from e
 
         return None
@@ -144,6 +197,8 @@ class ObservabilityMiddleware(MiddlewareMixin):
             return response
 
         correlation_id = request.observability_correlation_id
+        observation = get_observation(request, correlation_id)
+        snapshot = observation.snapshot or self.snapshot
 
         try:
             # Calculate request duration
@@ -156,23 +211,12 @@ class ObservabilityMiddleware(MiddlewareMixin):
                 f"Processing response: {request.method} {request.path}, status={response.status_code}, duration={duration}, correlation_id={correlation_id}"
             )
 
-            # Record metrics
-            if self.metrics_collector:
-                self.metrics_collector.end_request(request, response, duration)
-
-            # End tracing
-            if self.tracing_manager and hasattr(request, "observability_span"):
-                self.tracing_manager.end_request_span(
-                    request.observability_span, request, response, duration
-                )
+            # Record metrics, log the response and end tracing
+            observation.finish(response, duration)
+            for sink in reversed(self.sinks):
+                sink.request_finished(observation)
 
-            # Log response
-            if self.structured_logger:
-                self.structured_logger.log_request_end(
-                    request, response, duration, correlation_id
-                )
-
-            if self.config.get("ADD_CORRELATION_HEADER", False):
+            if snapshot.add_correlation_header:
                 response["X-Correlation-ID"] = correlation_id
 
         except Exception as e:
@@ -182,8 +226,10 @@ class ObservabilityMiddleware(MiddlewareMixin):
                 exc_info=True,
                 extra={"correlation_id": correlation_id},
             )
-            if self.config.get("DEBUG_MODE", False):
+            if snapshot.debug_mode:
                 raise ObservabilityError(f"Failed to process response: {e}") from e
+        finally:
+            unbind_observation(observation.context_token)
 
         return response
 
@@ -206,19 +252,11 @@ class ObservabilityMiddleware(MiddlewareMixin):
             logger.debug(
                 f"Processing exception for {request.method} {request.path}: {exception.__class__.__name__}, correlation_id={correlation_id}"
             )
-            # Record exception in tracing
-            if self.tracing_manager and hasattr(request, "observability_span"):
-                self.tracing_manager.record_exception(
-                    request.observability_span, exception
-                )
-
-            # Record exception metrics
-            if self.metrics_collector:
-                self.metrics_collector.increment_exception_counter(request, exception)
-
-            # Log exception
-            if self.structured_logger:
-                self.structured_logger.log_exception(request, exception, correlation_id)
+            # Record exception in tracing, metrics and logs
+            observation = get_observation(request, correlation_id)
+            observation.exception = exception
+            for sink in self.sinks:
+                sink.request_failed(observation, exception)
 
         except Exception as e:
             logger.error(
@@ -261,6 +299,9 @@ class AsyncObservabilityMiddleware:
             logger.info("Django Observability async support is disabled")
             raise MiddlewareNotUsed("Django Observability async support is disabled")
 
+        # Settings read on every request
+        self.snapshot = self.config.compile()
+
         # Initialize components
         self.tracing_manager = (
             TracingManager(self.config) if self.config.is_tracing_enabled() else None
@@ -273,9 +314,39 @@ class AsyncObservabilityMiddleware:
         self.structured_logger = (
             StructuredLogger(self.config) if self.config.is_logging_enabled() else None
         )
+        if self.tracing_manager and self.metrics_collector:
+            self.metrics_collector.instrument_span_processor(
+                self.tracing_manager.span_processor
+            )
+        if self.structured_logger and self.metrics_collector:
+            self.metrics_collector.instrument_log_handler(
+                self.structured_logger.queue_handler
+            )
+            self.metrics_collector.instrument_log_sampler(self.structured_logger)
+        self.sinks = [
+            sink
+            for sink in (
+                self.tracing_manager,
+                self.structured_logger,
+                self.metrics_collector,
+            )
+            if sink
+        ]
+        self.reloader = get_reloader()
+        self.reloader.configure(self.config)
+        self.reloader.register(self)
 
         logger.info("Django Observability Async Middleware initialized")
 
+    def apply_config(self, config) -> None:
+        """
+        Swap in a reloaded configuration.
+
+        Args:
+            config: The reloaded configuration
+        """
+        apply_reloaded_config(self, config)
+
     async def __call__(self, request: HttpRequest) -> HttpResponse:
         """
         Process request and response asynchronously.
@@ -286,62 +357,47 @@ class AsyncObservabilityMiddleware:
         Returns:
             The HttpResponse object
         """
+        self.reloader.check()
+        snapshot = self.snapshot
+
         # Skip excluded paths
-        if is_excluded_path(request.path, self.config.get("EXCLUDE_PATHS", [])):
+        if snapshot.is_excluded(request.path):
             logger.debug(f"Skipping request due to excluded path: {request.path}")
             return await self.get_response(request)
 
         # Add correlation ID and start time
         correlation_id = str(uuid.uuid4())
+        start_time = time.time()
+        observation = RequestObservation(request, correlation_id, start_time)
+        observation.snapshot = snapshot
+        observation.policy = snapshot.route_policies.resolve(observation)
+        if observation.policy.exclude:
+            logger.debug(f"Skipping request excluded by route policy: {request.path}")
+            return await self.get_response(request)
+
         request.observability_correlation_id = correlation_id
-        request.observability_start_time = time.time()
+        request.observability_start_time = start_time
+        request.observability_observation = observation
+        context_token = bind_observation(observation)
 
-        span = None
+        response = None
 
         try:
             logger.debug(
                 f"Processing request: {request.method} {request.path}, correlation_id={correlation_id}"
             )
-            # Start tracing
-            if self.tracing_manager:
-                span = self.tracing_manager.start_request_span(request, correlation_id)
-                request.observability_span = span
-
-            # Log incoming request
-            if self.structured_logger:
-                self.structured_logger.log_request_start(request, correlation_id)
-
-            # Increment request counter
-            if self.metrics_collector:
-                logger.debug(
-                    f"Calling start_request for {request.method} {request.path}"
-                )
-                if not hasattr(self.metrics_collector, "_instrument_database"):
-                    self.metrics_collector.start_request(request)
-                else:
-                    logger.debug("Skipping database instrumentation in async context")
+            # Start tracing, log the request and track it as active
+            for sink in self.sinks:
+                sink.request_started(observation)
 
             # Process the request
             response = await self.get_response(request)
 
-            # Calculate duration
-            duration = time.time() - request.observability_start_time
-
             logger.debug(
-                f"Processing response: {request.method} {request.path}, status={response.status_code}, duration={duration}, correlation_id={correlation_id}"
+                f"Processing response: {request.method} {request.path}, status={response.status_code}, correlation_id={correlation_id}"
             )
 
-            # Record metrics
-            if self.metrics_collector:
-                self.metrics_collector.end_request(request, response, duration)
-
-            # Log response
-            if self.structured_logger:
-                self.structured_logger.log_request_end(
-                    request, response, duration, correlation_id
-                )
-
-            if self.config.get("ADD_CORRELATION_HEADER", False):
+            if snapshot.add_correlation_header:
                 response["X-Correlation-ID"] = correlation_id
             return response
 
@@ -350,18 +406,9 @@ class AsyncObservabilityMiddleware:
                 logger.debug(
                     f"Processing exception for {request.method} {request.path}: {exception.__class__.__name__}, correlation_id={correlation_id}"
                 )
-                if self.tracing_manager and span:
-                    self.tracing_manager.record_exception(span, exception)
-
-                if self.metrics_collector:
-                    self.metrics_collector.increment_exception_counter(
-                        request, exception
-                    )
-
-                if self.structured_logger:
-                    self.structured_logger.log_exception(
-                        request, exception, correlation_id
-                    )
+                observation.exception = exception
+                for sink in self.sinks:
+                    sink.request_failed(observation, exception)
 
             except Exception as e:
                 logger.error(
@@ -373,10 +420,16 @@ class AsyncObservabilityMiddleware:
             raise exception
 
         finally:
-            # End tracing
-            if self.tracing_manager and span:
-                duration = time.time() - request.observability_start_time
-                response_obj = locals().get("response")
-                self.tracing_manager.end_request_span(
-                    span, request, response_obj, duration
+            # Record metrics, log the response and end tracing
+            duration = time.time() - request.observability_start_time
+            observation.finish(response, duration)
+            try:
+                for sink in reversed(self.sinks):
+                    sink.request_finished(observation)
+            except Exception as e:
+                logger.error(
+                    "Error finishing request in async middleware",
+                    exc_info=True,
+                    extra={"correlation_id": correlation_id},
                 )
+            unbind_observation(context_token)
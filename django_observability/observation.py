@@ -0,0 +1,209 @@
+"""
+Single-pass request telemetry for Django Observability.
+
+The middleware creates one RequestObservation per request and hands it to every
+configured sink (tracing, metrics, logging). Derived request fields are computed
+lazily on first access and cached, so each is evaluated at most once per request
+regardless of how many sinks consume it.
+"""
+
+import logging
+import time
+from functools import cached_property
+from typing import Any, Optional, Tuple
+
+from django.http import HttpRequest, HttpResponse
+
+from .policies import DEFAULT_POLICY, RoutePolicy
+from .routes import UNMATCHED_ENDPOINT
+from .utils import (
+    get_client_ip,
+    get_endpoint_label,
+    get_response_size,
+    get_view_name,
+    resolve_request,
+)
+
+logger = logging.getLogger("django_observability.observation")
+
+
+class RequestObservation:
+    """
+    Lazily computed, per-request view of the fields used by observability sinks.
+    """
+
+    def __init__(
+        self,
+        request: HttpRequest,
+        correlation_id: str = "unknown",
+        start_time: Optional[float] = None,
+    ):
+        """
+        Initialize the observation.
+
+        Args:
+            request: The Django HttpRequest object
+            correlation_id: The correlation ID for this request
+            start_time: The request start time (defaults to now)
+        """
+        self.request = request
+        self.correlation_id = correlation_id
+        self.start_time = time.time() if start_time is None else start_time
+        self.response: Optional[HttpResponse] = None
+        self.duration = 0.0
+        self.span: Any = None
+        self.span_context_token: Any = None
+        self.context_token: Any = None
+        self.exception: Optional[BaseException] = None
+        self.policy: RoutePolicy = DEFAULT_POLICY
+        self.snapshot: Any = None
+        self.log_settings: Any = None
+        self._response_size: Optional[int] = None
+        self._resolver_match: Any = None
+        self._route_labels: Optional[Tuple[str, str]] = None
+
+    def finish(self, response: Optional[HttpResponse], duration: float) -> None:
+        """
+        Attach the response and duration once the request has completed.
+
+        Args:
+            response: The Django HttpResponse object (None if the view raised)
+            duration: The request duration in seconds
+        """
+        self.response = response
+        self.duration = duration
+        self._response_size = None
+
+    @cached_property
+    def method(self) -> str:
+        return self.request.method
+
+    @cached_property
+    def path(self) -> str:
+        return self.request.path
+
+    @property
+    def view_name(self) -> str:
+        return self._get_route_labels()[0]
+
+    @property
+    def endpoint(self) -> str:
+        return self._get_route_labels()[1]
+
+    def _get_route_labels(self) -> Tuple[str, str]:
+        """
+        Return the (view_name, endpoint) labels, computed once per URL match.
+
+        Django's own resolver_match is preferred, since it honours SCRIPT_NAME
+        and per-request urlconfs set by later middleware. Before Django has
+        resolved the request (or if it never does, e.g. on a 404) the request
+        is resolved here once, and the labels are recomputed when Django's
+        match appears.
+        """
+        match = getattr(self.request, "resolver_match", None)
+        labels = self._route_labels
+        if labels is not None and (match is None or match is self._resolver_match):
+            return labels
+
+        if match is None:
+            match = resolve_request(self.request)
+        if match is None:
+            labels = ("unknown", UNMATCHED_ENDPOINT)
+        else:
+            labels = (
+                get_view_name(self.request, match),
+                get_endpoint_label(self.request, match),
+            )
+        self._resolver_match = match
+        self._route_labels = labels
+        return labels
+
+    @cached_property
+    def url(self) -> str:
+        return self.request.build_absolute_uri()
+
+    @cached_property
+    def scheme(self) -> str:
+        return self.request.scheme
+
+    @cached_property
+    def host(self) -> str:
+        return self.request.get_host()
+
+    @cached_property
+    def client_ip(self) -> str:
+        return get_client_ip(self.request)
+
+    @cached_property
+    def remote_addr(self) -> str:
+        return self.request.META.get("REMOTE_ADDR", "")
+
+    @cached_property
+    def user_agent(self) -> str:
+        return self.request.META.get("HTTP_USER_AGENT", "")
+
+    @cached_property
+    def query_string(self) -> str:
+        return self.request.META.get("QUERY_STRING", "")
+
+    @property
+    def status_code(self) -> Optional[int]:
+        return self.response.status_code if self.response is not None else None
+
+    @property
+    def response_size(self) -> int:
+        """Response content size in bytes, computed once per response."""
+        if self._response_size is None:
+            self._response_size = get_response_size(self.response)
+        return self._response_size
+
+
+def get_observation(
+    request: HttpRequest, correlation_id: Optional[str] = None
+) -> RequestObservation:
+    """
+    Return the observation attached to a request, creating one if needed.
+
+    Args:
+        request: The Django HttpRequest object
+        correlation_id: Correlation ID to use when a new observation is created
+
+    Returns:
+        The request's RequestObservation
+    """
+    observation = getattr(request, "observability_observation", None)
+    if observation is None:
+        observation = RequestObservation(
+            request,
+            correlation_id
+            or getattr(request, "observability_correlation_id", "unknown"),
+            getattr(request, "observability_start_time", None),
+        )
+        try:
+            request.observability_observation = observation
+        except AttributeError:
+            logger.debug("Could not attach observation to request")
+    return observation
+
+
+class ObservationSink:
+    """
+    Base class for components that consume request observations.
+
+    The middleware calls these hooks for every configured sink. Subclasses
+    override the hooks they care about; the defaults do nothing.
+    """
+
+    def request_started(self, observation: RequestObservation) -> None:
+        """Called once the request has been accepted for observation."""
+
+    def request_finished(self, observation: RequestObservation) -> None:
+        """Called after the response (or None, if the view raised) is known."""
+
+    def request_failed(
+        self, observation: RequestObservation, exception: Exception
+    ) -> None:
+        """Called when the view raised an unhandled exception."""
+
+    def apply_config(self, config: Any) -> None:
+        """Called with a reloaded ObservabilityConfig while requests are served."""
@@ -0,0 +1,220 @@
+"""
+Per-route observability policies.
+
+ROUTE_POLICIES maps a URL name ("checkout", or "shop:checkout" with its
+namespace) or a route prefix ("/api/bulk/", matched against the route template)
+to settings that override the global ones for matching requests:
+
+    "ROUTE_POLICIES": {
+        "/checkout/": {"trace_sample_rate": 1.0},
+        "/upload/": {"log_body": False},
+        "/api/bulk/": {"histogram_buckets": [1, 5, 30, 120]},
+        "healthcheck": {"exclude": True},
+    }
+
+The table is compiled once: URL names go into a dict and prefixes into a list
+ordered longest first. A request matches a single policy (its URL name, else
+the longest matching prefix), resolved once by the middleware and stored on the
+request's observation.
+"""
+
+import logging
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from django.core.exceptions import ImproperlyConfigured
+
+logger = logging.getLogger("django_observability.policies")
+
+DEFAULT_POLICY_CACHE_SIZE = 1000
+
+
+@dataclass(frozen=True, slots=True)
+class RoutePolicy:
+    """
+    Observability settings for the requests of one route.
+
+    Fields left as None fall back to the global configuration.
+    """
+
+    name: str = ""
+    exclude: bool = False
+    trace_sample_rate: Optional[float] = None
+    log_level: Optional[int] = None
+    log_body: Optional[bool] = None
+    histogram_buckets: Optional[Tuple[float, ...]] = None
+
+    @classmethod
+    def from_dict(cls, name: str, settings: Dict[str, Any]) -> "RoutePolicy":
+        """
+        Build a policy from its ROUTE_POLICIES entry.
+
+        Args:
+            name: The URL name or route prefix the policy is keyed by
+            settings: The policy settings
+
+        Returns:
+            The validated RoutePolicy
+
+        Raises:
+            ImproperlyConfigured: If a setting is unknown or invalid
+        """
+        if not isinstance(settings, dict):
+            raise ImproperlyConfigured(f"ROUTE_POLICIES[{name!r}] must be a dict")
+        unknown = set(settings) - (set(cls.__dataclass_fields__) - {"name"})
+        if unknown:
+            raise ImproperlyConfigured(
+                f"Unknown settings in ROUTE_POLICIES[{name!r}]: {sorted(unknown)}"
+            )
+
+        rate = settings.get("trace_sample_rate")
+        if rate is not None and (
+            not isinstance(rate, (int, float)) or not 0.0 <= rate <= 1.0
+        ):
+            raise ImproperlyConfigured(
+                f"ROUTE_POLICIES[{name!r}] trace_sample_rate must be between "
+                f"0.0 and 1.0, got {rate}"
+            )
+
+        log_level = settings.get("log_level")
+        if log_level is not None:
+            level = getattr(logging, str(log_level).upper(), None)
+            if not isinstance(level, int):
+                raise ImproperlyConfigured(
+                    f"ROUTE_POLICIES[{name!r}] has an invalid log_level: {log_level}"
+                )
+            log_level = level
+
+        buckets = settings.get("histogram_buckets")
+        if buckets is not None:
+            try:
+                buckets = tuple(float(bucket) for bucket in buckets)
+            except (TypeError, ValueError) as e:
+                raise ImproperlyConfigured(
+                    f"ROUTE_POLICIES[{name!r}] has invalid histogram_buckets: {e}"
+                ) from e
+
+        log_body = settings.get("log_body")
+        return cls(
+            name=name,
+            exclude=bool(settings.get("exclude", False)),
+            trace_sample_rate=rate,
+            log_level=log_level,
+            log_body=None if log_body is None else bool(log_body),
+            histogram_buckets=buckets,
+        )
+
+    @property
+    def metric_slug(self) -> str:
+        """Return the metric name fragment of the policy's duration histogram."""
+        return re.sub(r"[^a-zA-Z0-9]+", "_", self.name).strip("_").lower()
+
+
+DEFAULT_POLICY = RoutePolicy()
+
+
+class RoutePolicyTable:
+    """
+    Compiled ROUTE_POLICIES lookup.
+    """
+
+    def __init__(
+        self,
+        policies: Optional[Dict[str, Dict[str, Any]]] = None,
+        cache_size: int = DEFAULT_POLICY_CACHE_SIZE,
+    ):
+        """
+        Compile the policy table.
+
+        Args:
+            policies: ROUTE_POLICIES, keyed by URL name or by route prefix (any
+                key containing "/")
+            cache_size: Maximum number of (view name, route) resolutions cached
+        """
+        self._url_names: Dict[str, RoutePolicy] = {}
+        prefixes: List[Tuple[str, RoutePolicy]] = []
+        slugs: Dict[str, str] = {}
+        for key, settings in (policies or {}).items():
+            policy = RoutePolicy.from_dict(key, settings)
+            if policy.histogram_buckets is not None:
+                # Each policy histogram needs a distinct metric name
+                slug = policy.metric_slug
+                if not slug:
+                    raise ImproperlyConfigured(
+                        f"ROUTE_POLICIES[{key!r}] cannot have histogram_buckets: "
+                        f"its key has no letters or digits for a metric name"
+                    )
+                if slug in slugs:
+                    raise ImproperlyConfigured(
+                        f"ROUTE_POLICIES[{key!r}] and ROUTE_POLICIES[{slugs[slug]!r}] "
+                        f"both name their histogram {slug!r}"
+                    )
+                slugs[slug] = key
+            if "/" in key:
+                # Route templates have no leading slash ("api/bulk/<int:pk>/")
+                prefixes.append((key.lstrip("/"), policy))
+            else:
+                self._url_names[key] = policy
+        self._prefixes = sorted(prefixes, key=lambda item: len(item[0]), reverse=True)
+        self._cache: Dict[Tuple[str, str], RoutePolicy] = {}
+        self._cache_size = cache_size
+
+    @classmethod
+    def from_config(cls, config: Any) -> "RoutePolicyTable":
+        """
+        Compile the table from the observability configuration.
+
+        Args:
+            config: The observability configuration instance
+
+        Returns:
+            The compiled RoutePolicyTable
+        """
+        return cls(config.get("ROUTE_POLICIES") or {})
+
+    def __bool__(self) -> bool:
+        return bool(self._url_names or self._prefixes)
+
+    def __iter__(self) -> Iterator[RoutePolicy]:
+        yield from self._url_names.values()
+        for _, policy in self._prefixes:
+            yield policy
+
+    def resolve(self, observation: Any) -> RoutePolicy:
+        """
+        Return the policy for an observed request.
+
+        Resolving the request's URL is only needed when the table has policies.
+
+        Args:
+            observation: The request's RequestObservation
+
+        Returns:
+            The matching RoutePolicy, or DEFAULT_POLICY
+        """
+        if not self._url_names and not self._prefixes:
+            return DEFAULT_POLICY
+
+        view_name = observation.view_name
+        endpoint = observation.endpoint
+        key = (view_name, endpoint)
+        policy = self._cache.get(key)
+        if policy is None:
+            policy = self._match(view_name, endpoint)
+            if len(self._cache) >= self._cache_size:
+                self._cache.clear()
+            self._cache[key] = policy
+        return policy
+
+    def _match(self, view_name: str, endpoint: str) -> RoutePolicy:
+        """Match a view name, then the longest route prefix."""
+        policy = self._url_names.get(view_name)
+        if policy is None:
+            policy = self._url_names.get(view_name.rpartition(":")[2])
+        if policy is not None:
+            return policy
+        for prefix, policy in self._prefixes:
+            if endpoint.startswith(prefix):
+                return policy
+        return DEFAULT_POLICY
@@ -0,0 +1,235 @@
+"""
+Redaction of sensitive data in logged headers and bodies.
+
+A Redactor is compiled once from configuration: header names become a set of
+lookup keys, value patterns are combined into a single regular expression, and
+JSON body key paths are split into segments. Redaction then takes a single
+pass over the relevant data.
+"""
+
+import json
+import logging
+import re
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from .config import ObservabilityConfig
+
+logger = logging.getLogger("django_observability.redaction")
+
+REDACTED = "[REDACTED]"
+
+# Patterns for common secrets in header values and bodies
+BEARER_TOKEN_PATTERN = r"(?i:\bbearer\s+[a-z0-9._~+/=-]+)"
+JWT_PATTERN = r"\beyJ[a-zA-Z0-9_-]+\.[a-zA-Z0-9_-]+\.[a-zA-Z0-9_-]*"
+# Matches are only redacted if they pass the Luhn check, so timestamps, phone
+# numbers and IDs of the same length are left alone
+CARD_NUMBER_PATTERN = r"\b(?P<card_number>(?:\d[ -]?){12,18}\d)\b"
+
+# META keys that carry headers without the HTTP_ prefix
+_UNPREFIXED_HEADER_KEYS = frozenset({"CONTENT_TYPE", "CONTENT_LENGTH"})
+
+
+def _passes_luhn(number: str) -> bool:
+    """Check the Luhn checksum of a card number, ignoring separators."""
+    digits = [int(char) for char in number if char.isdigit()]
+    checksum = sum(digits[-1::-2]) + sum(
+        2 * digit - 9 if digit > 4 else 2 * digit for digit in digits[-2::-2]
+    )
+    return checksum % 10 == 0
+
+
+class Redactor:
+    """
+    Redacts sensitive headers, value patterns and JSON body fields.
+    """
+
+    def __init__(
+        self,
+        headers: Iterable[str] = (),
+        value_patterns: Iterable[str] = (),
+        body_keys: Iterable[str] = (),
+        replacement: str = REDACTED,
+    ):
+        """
+        Compile the redaction rules.
+
+        Args:
+            headers: Header names to redact (case-insensitive, e.g. "authorization")
+            value_patterns: Regular expressions whose matches are redacted in
+                header values and bodies
+            body_keys: JSON body fields to redact, either a key name matched at
+                any depth ("password") or a dotted path from the root where "*"
+                matches any key or list item ("user.card.number", "items.*.token")
+            replacement: The text substituted for redacted data
+        """
+        self.replacement = replacement
+        names = {name.lower() for name in headers}
+        self.header_names = frozenset(names)
+        self.meta_keys = frozenset(
+            "HTTP_" + name.upper().replace("-", "_") for name in names
+        ) | frozenset(
+            key
+            for key in _UNPREFIXED_HEADER_KEYS
+            if key.replace("_", "-").lower() in names
+        )
+
+        patterns = list(value_patterns)
+        self.value_pattern = (
+            re.compile("|".join(f"(?:{pattern})" for pattern in patterns))
+            if patterns
+            else None
+        )
+        # Card number matches need a callback for the Luhn check
+        self._value_replacement: Any = (
+            self._replace_value
+            if self.value_pattern is not None
+            and "card_number" in self.value_pattern.groupindex
+            else self.replacement
+        )
+
+        self.body_key_names = frozenset(key for key in body_keys if "." not in key)
+        self.body_key_paths: List[Tuple[str, ...]] = [
+            tuple(key.split(".")) for key in body_keys if "." in key
+        ]
+        # Used when a body is not valid JSON (e.g. truncated): "key": value
+        leaf_names = self.body_key_names | {path[-1] for path in self.body_key_paths}
+        self.body_key_pattern = (
+            re.compile(
+                # A string (possibly cut off by truncation), number or literal
+                r'("(?:%s)"\s*:\s*)'
+                r'(?:"(?:[^"\\]|\\.)*(?:"|$)|-?\d[\d.eE+-]*|true|false|null)'
+                % "|".join(re.escape(name) for name in sorted(leaf_names))
+            )
+            if leaf_names
+            else None
+        )
+
+    @classmethod
+    def from_config(cls, config: ObservabilityConfig) -> "Redactor":
+        """
+        Compile a redactor from the observability configuration.
+
+        Args:
+            config: The observability configuration instance
+
+        Returns:
+            The compiled Redactor
+        """
+        return cls(
+            headers=config.get_sensitive_headers(),
+            value_patterns=config.get("LOGGING_REDACT_PATTERNS", []),
+            body_keys=config.get(
+                "LOGGING_REDACT_BODY_FIELDS", ["password", "token", "secret"]
+            ),
+        )
+
+    def redact_value(self, value: Any) -> Any:
+        """Redact value pattern matches in a string; other values pass through."""
+        if self.value_pattern is None or not isinstance(value, str):
+            return value
+        return self.value_pattern.sub(self._value_replacement, value)
+
+    def _replace_value(self, match: "re.Match[str]") -> str:
+        """Return the replacement for a value pattern match."""
+        card_number = match.group("card_number")
+        if card_number is not None and not _passes_luhn(card_number):
+            return match.group(0)
+        return self.replacement
+
+    def redact_meta(self, meta: Mapping[str, Any]) -> Dict[str, Any]:
+        """
+        Return the request headers from request.META, redacted.
+
+        Only HTTP_* keys (and CONTENT_TYPE/CONTENT_LENGTH) are included; the
+        rest of the WSGI/ASGI environment is skipped.
+
+        Args:
+            meta: The request's META dict
+
+        Returns:
+            The redacted headers, keyed as in META
+        """
+        sensitive = self.meta_keys
+        redact_value = self.redact_value
+        return {
+            key: self.replacement if key in sensitive else redact_value(value)
+            for key, value in meta.items()
+            if key.startswith("HTTP_") or key in _UNPREFIXED_HEADER_KEYS
+        }
+
+    def redact_headers(self, headers: Mapping[str, Any]) -> Dict[str, Any]:
+        """
+        Redact a mapping of header names (e.g. response headers) to values.
+
+        Args:
+            headers: Header names and values
+
+        Returns:
+            The redacted headers
+        """
+        sensitive = self.header_names
+        redact_value = self.redact_value
+        return {
+            key: self.replacement if key.lower() in sensitive else redact_value(value)
+            for key, value in headers.items()
+        }
+
+    def redact_body(self, body: str, is_json: bool = False) -> str:
+        """
+        Redact a captured body.
+
+        JSON bodies have their configured fields replaced; bodies that cannot
+        be parsed (e.g. truncated) fall back to redacting "key": value pairs
+        textually, for string, number, boolean and null values. Value patterns
+        apply to every body.
+
+        Args:
+            body: The decoded body text
+            is_json: Whether the body has a JSON content type
+
+        Returns:
+            The redacted body
+        """
+        if is_json and (self.body_key_names or self.body_key_paths):
+            try:
+                data = json.loads(body)
+            except ValueError:
+                body = self.body_key_pattern.sub(rf'\1"{self.replacement}"', body)
+            else:
+                data = self._redact_json(data)
+                for path in self.body_key_paths:
+                    self._redact_path(data, path)
+                body = json.dumps(data, ensure_ascii=False)
+        return self.redact_value(body)
+
+    def _redact_json(self, data: Any) -> Any:
+        """Redact fields named in body_key_names at any depth."""
+        if isinstance(data, dict):
+            return {
+                key: (
+                    self.replacement
+                    if key in self.body_key_names
+                    else self._redact_json(value)
+                )
+                for key, value in data.items()
+            }
+        if isinstance(data, list):
+            return [self._redact_json(item) for item in data]
+        return data
+
+    def _redact_path(self, data: Any, path: Tuple[str, ...]) -> None:
+        """Redact the field at a dotted path in place."""
+        key, rest = path[0], path[1:]
+        if isinstance(data, dict):
+            keys: Optional[Iterable[Any]] = (
+                list(data) if key == "*" else [key] if key in data else []
+            )
+        elif isinstance(data, list) and key == "*":
+            keys = range(len(data))
+        else:
+            return
+        for item_key in keys:
+            if rest:
+                self._redact_path(data[item_key], rest)
+            else:
+                data[item_key] = self.replacement
@@ -0,0 +1,212 @@
+"""
+Runtime configuration reload for Django Observability.
+
+A reload builds a new ObservabilityConfig from Django settings, environment
+variables and the JSON overrides in CONFIG_RELOAD_FILE, then hands it to every
+registered component (the middlewares, which pass it on to their tracing
+manager and structured logger). Each component swaps its compiled settings in
+by reference, so requests in flight keep the settings they started with.
+
+Reloads are triggered by SIGHUP (CONFIG_RELOAD_SIGNAL), by a change of the
+reload file's modification time (polled every CONFIG_RELOAD_INTERVAL seconds),
+or by a POST to reload_view. Signals and file changes are applied by the next
+request the process serves rather than in the signal handler itself.
+"""
+
+import hmac
+import json
+import logging
+import os
+import signal
+import threading
+import time
+import weakref
+from typing import Any, Dict, Optional
+
+from django.core.exceptions import ImproperlyConfigured
+from django.http import HttpRequest, HttpResponse, JsonResponse
+
+from . import config as config_module
+from .config import ObservabilityConfig
+
+logger = logging.getLogger("django_observability.reload")
+
+RELOAD_TOKEN_HEADER = "HTTP_X_OBSERVABILITY_RELOAD_TOKEN"
+
+
+class ConfigReloader:
+    """
+    Rebuilds the configuration and swaps it into registered components.
+    """
+
+    def __init__(self):
+        self._targets: "weakref.WeakSet[Any]" = weakref.WeakSet()
+        self._lock = threading.Lock()
+        self._pending = False
+        self._signal_installed = False
+        self.path: Optional[str] = None
+        self.interval: Optional[float] = None
+        self.reload_count = 0
+        self._mtime: Optional[float] = None
+        self._next_check = 0.0
+
+    def configure(self, config: ObservabilityConfig) -> None:
+        """
+        Apply the reload settings of the startup configuration.
+
+        Args:
+            config: The observability configuration instance
+        """
+        self.path = config.get("CONFIG_RELOAD_FILE")
+        self.interval = config.get("CONFIG_RELOAD_INTERVAL", 5.0) if self.path else None
+        if self.path and self._mtime is None:
+            self._mtime = self._get_mtime()
+            self._next_check = time.monotonic() + (self.interval or 0.0)
+        if config.get("CONFIG_RELOAD_SIGNAL", False):
+            self.install_signal_handler()
+
+    def register(self, target: Any) -> None:
+        """
+        Register a component to receive reloaded configurations.
+
+        Args:
+            target: An object with an apply_config(config) method
+        """
+        self._targets.add(target)
+
+    def install_signal_handler(self) -> None:
+        """Request a reload when the process receives SIGHUP."""
+        if self._signal_installed or not hasattr(signal, "SIGHUP"):
+            return
+        try:
+            signal.signal(signal.SIGHUP, lambda signum, frame: self.request_reload())
+            self._signal_installed = True
+            logger.info("SIGHUP configuration reload enabled")
+        except ValueError:
+            # Signal handlers can only be installed from the main thread
+            logger.warning("Could not install SIGHUP handler outside the main thread")
+
+    def request_reload(self) -> None:
+        """Mark a reload to be applied by the next request. Safe in signal handlers."""
+        self._pending = True
+
+    def check(self) -> None:
+        """
+        Apply a requested reload, or one due to a changed reload file.
+
+        Called by the middleware on every request; without a pending reload or
+        a due file check this only compares a flag and a timestamp.
+        """
+        if not self._pending and (
+            self.interval is None or time.monotonic() < self._next_check
+        ):
+            return
+
+        if self._pending:
+            self._pending = False
+            self.reload()
+            return
+
+        self._next_check = time.monotonic() + self.interval
+        mtime = self._get_mtime()
+        if mtime != self._mtime:
+            self._mtime = mtime
+            self.reload()
+
+    def reload(self) -> Optional[ObservabilityConfig]:
+        """
+        Build a new configuration and swap it into every registered component.
+
+        An invalid configuration is logged and the current one is kept.
+
+        Returns:
+            The new configuration, or None if it was not applied
+        """
+        if not self._lock.acquire(blocking=False):
+            logger.debug("Configuration reload already in progress")
+            return None
+        try:
+            if self.path:
+                self._mtime = self._get_mtime()
+            try:
+                new_config = ObservabilityConfig(overrides=self._read_overrides())
+            except (ImproperlyConfigured, ValueError, TypeError) as e:
+                logger.error(f"Configuration reload rejected: {str(e)}")
+                return None
+
+            config_module.config = new_config
+            for target in list(self._targets):
+                try:
+                    target.apply_config(new_config)
+                except Exception as e:
+                    logger.error(
+                        f"Failed to apply reloaded configuration to {target}: {e}"
+                    )
+            self.reload_count += 1
+            logger.info(f"Configuration reloaded ({len(self._targets)} components)")
+            return new_config
+        finally:
+            self._lock.release()
+
+    def _get_mtime(self) -> Optional[float]:
+        """Return the reload file's modification time, or None if it is missing."""
+        try:
+            return os.stat(self.path).st_mtime
+        except (OSError, TypeError):
+            return None
+
+    def _read_overrides(self) -> Dict[str, Any]:
+        """
+        Read the JSON object of setting overrides from the reload file.
+
+        Returns:
+            The overrides (empty if no file is configured or it does not exist)
+        """
+        if not self.path or not os.path.exists(self.path):
+            return {}
+        with open(self.path) as f:
+            try:
+                overrides = json.load(f)
+            except ValueError as e:
+                raise ImproperlyConfigured(f"Invalid JSON in {self.path}: {e}") from e
+        if not isinstance(overrides, dict):
+            raise ImproperlyConfigured(f"{self.path} must contain a JSON object")
+        return overrides
+
+
+_reloader = ConfigReloader()
+
+
+def get_reloader() -> ConfigReloader:
+    """Get the process-wide configuration reloader."""
+    return _reloader
+
+
+def reload_view(request: HttpRequest) -> HttpResponse:
+    """
+    Reload the configuration of the process serving this request.
+
+    Requires a POST with the CONFIG_RELOAD_TOKEN in the
+    X-Observability-Reload-Token header; the endpoint is disabled while no token
+    is configured.
+
+    Args:
+        request: The Django HttpRequest object
+
+    Returns:
+        A JSON response describing the outcome
+    """
+    token = config_module.get_config().get("CONFIG_RELOAD_TOKEN")
+    if not token:
+        return JsonResponse({"error": "reload endpoint disabled"}, status=404)
+    if request.method != "POST":
+        return JsonResponse({"error": "method not allowed"}, status=405)
+    if not hmac.compare_digest(
+        request.META.get(RELOAD_TOKEN_HEADER, "").encode(), str(token).encode()
+    ):
+        return JsonResponse({"error": "forbidden"}, status=403)
+
+    reloader = get_reloader()
+    if reloader.reload() is None:
+        return JsonResponse({"reloaded": False}, status=409)
+    return JsonResponse({"reloaded": True, "reload_count": reloader.reload_count})
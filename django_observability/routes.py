@@ -0,0 +1,117 @@
+"""
+URL route catalog for low-cardinality endpoint labels.
+
+The catalog walks the project's URL patterns once and maps every full route
+template (as reported by ``ResolverMatch.route``) to a precomputed endpoint
+label. Requests that do not resolve to any pattern share a single
+``unmatched`` label, so arbitrary paths cannot create new metric series.
+"""
+
+import logging
+import threading
+from typing import Dict, Optional
+
+from django.core.signals import setting_changed
+from django.urls import URLResolver, get_resolver
+
+logger = logging.getLogger("django_observability.routes")
+
+UNMATCHED_ENDPOINT = "unmatched"
+
+
+def _join_route(prefix: str, route: str) -> str:
+    """Join two routes the way Django builds ResolverMatch.route."""
+    if not prefix:
+        return route
+    return prefix + (route[1:] if route.startswith("^") else route)
+
+
+def normalize_route(route: str) -> str:
+    """
+    Turn a route template into an endpoint label.
+
+    Args:
+        route: A path() route or re_path() regex
+
+    Returns:
+        The route with regex anchors removed, or "/" for the root route
+    """
+    label = route
+    if label.startswith("^"):
+        label = label[1:]
+    if label.endswith("$") and not label.endswith("\\$"):
+        label = label[:-1]
+    return label or "/"
+
+
+class RouteCatalog:
+    """
+    Precompiled mapping of URL route templates to endpoint labels.
+    """
+
+    def __init__(self, urlconf: Optional[str] = None):
+        """
+        Build the catalog by walking the URL patterns once.
+
+        Args:
+            urlconf: The URLconf module to walk (defaults to ROOT_URLCONF)
+        """
+        self.labels: Dict[str, str] = {}
+        try:
+            self._walk(get_resolver(urlconf).url_patterns, "")
+            logger.debug(f"Route catalog built with {len(self.labels)} routes")
+        except Exception as e:
+            logger.error(f"Failed to build route catalog: {e}")
+
+    def _walk(self, patterns, prefix: str) -> None:
+        """Recursively collect the full route of every URL pattern."""
+        for pattern in patterns:
+            route = _join_route(prefix, str(pattern.pattern))
+            if isinstance(pattern, URLResolver):
+                self._walk(pattern.url_patterns, route)
+            else:
+                self.labels[route] = normalize_route(route)
+
+    def label_for(self, resolver_match) -> str:
+        """
+        Return the endpoint label for a resolved request.
+
+        Args:
+            resolver_match: The request's ResolverMatch (or None)
+
+        Returns:
+            The route template label, or "unmatched" if the request did not resolve
+        """
+        route = getattr(resolver_match, "route", None)
+        if route is None:
+            return UNMATCHED_ENDPOINT
+        label = self.labels.get(route)
+        if label is None:
+            # Routes from a per-request urlconf are still code-defined templates
+            label = normalize_route(route)
+        return label
+
+
+_route_catalog: Optional[RouteCatalog] = None
+_route_catalog_lock = threading.Lock()
+
+
+def get_route_catalog() -> RouteCatalog:
+    """Return the process-wide route catalog, building it on first use."""
+    global _route_catalog
+    if _route_catalog is None:
+        with _route_catalog_lock:
+            if _route_catalog is None:
+                _route_catalog = RouteCatalog()
+    return _route_catalog
+
+
+def reset_route_catalog(**kwargs) -> None:
+    """Discard the route catalog so it is rebuilt on next use."""
+    global _route_catalog
+    if kwargs.get("setting") not in (None, "ROOT_URLCONF"):
+        return
+    _route_catalog = None
+
+
+setting_changed.connect(reset_route_catalog)
@@ -0,0 +1,394 @@
+"""
+Trace samplers for Django Observability.
+
+AdaptiveRouteSampler keeps the number of sampled root traces under a global
+spans-per-second budget while guaranteeing every route a minimum trace rate.
+It counts requests per route and periodically recomputes per-route sampling
+probabilities from those counts.
+
+RoutePolicySampler applies the trace_sample_rate of route policies.
+ReloadableSampler lets a reloaded configuration replace the sampler of a
+running tracer provider.
+
+TailSamplingSpanProcessor buffers the spans of each trace until its local root
+span ends and only then decides whether the trace is exported, so error and
+slow traces are kept regardless of the head sampling rate.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional
+
+from opentelemetry.sdk.trace import ReadableSpan, SpanProcessor
+from opentelemetry.sdk.trace.sampling import (
+    Decision,
+    Sampler,
+    SamplingResult,
+    TraceIdRatioBased,
+)
+from opentelemetry.semconv.trace import SpanAttributes
+from opentelemetry.trace import StatusCode, get_current_span
+
+logger = logging.getLogger("django_observability.sampling")
+
+ROUTE_ATTRIBUTE = "http.endpoint"
+# Start attribute carrying a route policy's trace_sample_rate to the sampler
+POLICY_RATE_ATTRIBUTE = "observability.policy.sample_rate"
+
+
+def allocate_budget(
+    rates: Dict[str, float], budget: float, min_rate: float = 0.0
+) -> Dict[str, float]:
+    """
+    Split a traces-per-second budget across routes (max-min fair share).
+
+    Routes requesting less than an equal share are fully sampled and the rest of
+    the budget is shared among busier routes. Every route then gets at least
+    min_rate traces per second, or all of its traffic if it has less.
+
+    Args:
+        rates: Observed requests per second for each route
+        budget: Total traces per second to allocate
+        min_rate: Minimum traces per second per route
+
+    Returns:
+        The sampling probability for each route
+    """
+    allocation: Dict[str, float] = {}
+    remaining = budget
+    pending = sorted((rate, route) for route, rate in rates.items() if rate > 0)
+    while pending:
+        share = remaining / len(pending)
+        rate, route = pending[0]
+        if rate > share:
+            for rate, route in pending:
+                allocation[route] = share
+            break
+        allocation[route] = rate
+        remaining -= rate
+        pending.pop(0)
+
+    return {
+        route: min(1.0, max(allocation[route], min(rate, min_rate)) / rate)
+        for route, rate in rates.items()
+        if rate > 0
+    }
+
+
+class AdaptiveRouteSampler(Sampler):
+    """
+    Per-route trace-ID ratio sampler whose ratios adapt to a spans/sec budget.
+    """
+
+    def __init__(
+        self,
+        budget: float,
+        min_rate: float = 0.1,
+        interval: float = 10.0,
+        initial_rate: float = 0.1,
+    ):
+        """
+        Initialize the sampler.
+
+        Args:
+            budget: Target number of sampled root traces per second
+            min_rate: Minimum traces per second for every route
+            interval: Seconds between rate recomputations
+            initial_rate: Sampling probability for routes without statistics
+        """
+        self.budget = budget
+        self.min_rate = min_rate
+        self.interval = interval
+        self.initial_rate = initial_rate
+        self._counts: Dict[str, int] = {}
+        self._bounds: Dict[str, int] = {}
+        self._initial_bound = TraceIdRatioBased.get_bound_for_rate(initial_rate)
+        self._lock = threading.Lock()
+        self._window_start = time.monotonic()
+        self._next_recompute = self._window_start + interval
+
+    def should_sample(
+        self,
+        parent_context,
+        trace_id: int,
+        name: str,
+        kind=None,
+        attributes=None,
+        links=None,
+        trace_state=None,
+    ) -> SamplingResult:
+        route = (attributes or {}).get(ROUTE_ATTRIBUTE) or name
+        counts = self._counts
+        counts[route] = counts.get(route, 0) + 1
+
+        now = time.monotonic()
+        if now >= self._next_recompute:
+            self._recompute(now)
+
+        bound = self._bounds.get(route, self._initial_bound)
+        if trace_id & TraceIdRatioBased.TRACE_ID_LIMIT < bound:
+            decision = Decision.RECORD_AND_SAMPLE
+        else:
+            decision = Decision.DROP
+            attributes = None
+        return SamplingResult(
+            decision,
+            attributes,
+            get_current_span(parent_context).get_span_context().trace_state,
+        )
+
+    def _recompute(self, now: float) -> None:
+        """Derive per-route sampling probabilities from the last window's counts."""
+        if not self._lock.acquire(blocking=False):
+            return
+        try:
+            if now < self._next_recompute:
+                return
+            counts, self._counts = self._counts, {}
+            elapsed = max(now - self._window_start, 1e-9)
+            self._window_start = now
+            self._next_recompute = now + self.interval
+
+            probabilities = allocate_budget(
+                {route: count / elapsed for route, count in counts.items()},
+                self.budget,
+                self.min_rate,
+            )
+            self._bounds = {
+                route: TraceIdRatioBased.get_bound_for_rate(probability)
+                for route, probability in probabilities.items()
+            }
+            logger.debug(f"Recomputed sampling rates for {len(probabilities)} routes")
+        except Exception as e:
+            logger.error(f"Failed to recompute sampling rates: {e}")
+        finally:
+            self._lock.release()
+
+    def get_rate(self, route: str) -> Optional[float]:
+        """Return the current sampling probability of a route, if known."""
+        bound = self._bounds.get(route)
+        if bound is None:
+            return None
+        return bound / (TraceIdRatioBased.TRACE_ID_LIMIT + 1)
+
+    def get_description(self) -> str:
+        return f"AdaptiveRouteSampler{{budget={self.budget}, min_rate={self.min_rate}}}"
+
+
+class RoutePolicySampler(Sampler):
+    """
+    Applies route policy sample rates, delegating other traces to a root sampler.
+
+    The rate arrives as the POLICY_RATE_ATTRIBUTE start attribute, which is
+    removed before the span is created.
+    """
+
+    def __init__(self, root: Sampler):
+        """
+        Initialize the sampler.
+
+        Args:
+            root: Sampler for traces without a policy rate
+        """
+        self.root = root
+        self._bounds: Dict[float, int] = {}
+
+    def should_sample(
+        self,
+        parent_context,
+        trace_id: int,
+        name: str,
+        kind=None,
+        attributes=None,
+        links=None,
+        trace_state=None,
+    ) -> SamplingResult:
+        rate = attributes.get(POLICY_RATE_ATTRIBUTE) if attributes else None
+        if rate is None:
+            return self.root.should_sample(
+                parent_context, trace_id, name, kind, attributes, links, trace_state
+            )
+
+        bound = self._bounds.get(rate)
+        if bound is None:
+            bound = self._bounds[rate] = TraceIdRatioBased.get_bound_for_rate(rate)
+        if trace_id & TraceIdRatioBased.TRACE_ID_LIMIT < bound:
+            decision = Decision.RECORD_AND_SAMPLE
+            attributes = {
+                key: value
+                for key, value in attributes.items()
+                if key != POLICY_RATE_ATTRIBUTE
+            }
+        else:
+            decision = Decision.DROP
+            attributes = None
+        return SamplingResult(
+            decision,
+            attributes,
+            get_current_span(parent_context).get_span_context().trace_state,
+        )
+
+    def get_description(self) -> str:
+        return f"RoutePolicySampler{{{self.root.get_description()}}}"
+
+
+class ReloadableSampler(Sampler):
+    """
+    Delegates to a sampler that can be replaced while spans are being created.
+
+    The tracer provider keeps a reference to its sampler for its lifetime, so the
+    delegate is looked up on every decision and a reloaded configuration swaps
+    whatever the lookup reads instead.
+    """
+
+    def __init__(self, get_delegate: Callable[[], Sampler]):
+        """
+        Initialize the sampler.
+
+        Args:
+            get_delegate: Returns the sampler currently making the decisions
+        """
+        self._get_delegate = get_delegate
+
+    @property
+    def delegate(self) -> Sampler:
+        """The sampler currently making the decisions."""
+        return self._get_delegate()
+
+    def should_sample(self, *args, **kwargs) -> SamplingResult:
+        return self._get_delegate().should_sample(*args, **kwargs)
+
+    def get_description(self) -> str:
+        return f"ReloadableSampler{{{self.delegate.get_description()}}}"
+
+
+class TailSamplingSpanProcessor(SpanProcessor):
+    """
+    Buffers spans per trace and forwards only interesting traces downstream.
+
+    A trace is decided when its local root span (no parent, or a remote parent)
+    ends. It is kept if the root has a 5xx status or an error status, if it took
+    longer than the latency threshold of its route, or if its trace ID falls in
+    the random baseline. Buffered spans are bounded; when the pool is full the
+    oldest undecided trace is discarded.
+    """
+
+    def __init__(
+        self,
+        downstream: SpanProcessor,
+        max_spans: int = 10000,
+        latency_threshold: float = 1.0,
+        route_thresholds: Optional[Dict[str, float]] = None,
+        baseline_rate: float = 0.0,
+        max_decisions: int = 10000,
+    ):
+        """
+        Initialize the processor.
+
+        Args:
+            downstream: Processor that receives the spans of kept traces
+            max_spans: Maximum number of spans buffered across all traces
+            latency_threshold: Root duration in seconds above which a trace is kept
+            route_thresholds: Per-route latency thresholds keyed by endpoint label
+            baseline_rate: Probability of keeping a trace that is not interesting
+            max_decisions: Number of recent decisions remembered for spans that
+                end after their root
+        """
+        self.downstream = downstream
+        self.max_spans = max_spans
+        self.latency_threshold = latency_threshold
+        self.route_thresholds = route_thresholds or {}
+        self.baseline_bound = TraceIdRatioBased.get_bound_for_rate(baseline_rate)
+        self.max_decisions = max_decisions
+        self.kept_traces = 0
+        self.dropped_traces = 0
+        self.evicted_spans = 0
+        self._traces: "OrderedDict[int, List[ReadableSpan]]" = OrderedDict()
+        self._decisions: "OrderedDict[int, bool]" = OrderedDict()
+        self._buffered = 0
+        self._lock = threading.Lock()
+
+    def on_start(self, span, parent_context=None) -> None:
+        self.downstream.on_start(span, parent_context=parent_context)
+
+    def on_end(self, span: ReadableSpan) -> None:
+        trace_id = span.context.trace_id
+        parent = span.parent
+        is_root = parent is None or parent.is_remote
+
+        with self._lock:
+            decision = self._decisions.get(trace_id)
+            if decision is None and not is_root:
+                self._buffer(trace_id, span)
+                return
+            spans = self._traces.pop(trace_id, [])
+            self._buffered -= len(spans)
+
+        if decision is None:
+            decision = self.should_keep(span)
+            with self._lock:
+                self._decisions[trace_id] = decision
+                if len(self._decisions) > self.max_decisions:
+                    self._decisions.popitem(last=False)
+            if decision:
+                self.kept_traces += 1
+            else:
+                self.dropped_traces += 1
+
+        if decision:
+            for buffered_span in spans:
+                self.downstream.on_end(buffered_span)
+            self.downstream.on_end(span)
+
+    def _buffer(self, trace_id: int, span: ReadableSpan) -> None:
+        """Buffer a span of an undecided trace. Caller holds the lock."""
+        spans = self._traces.get(trace_id)
+        if spans is None:
+            spans = self._traces[trace_id] = []
+        spans.append(span)
+        self._buffered += 1
+
+        while self._buffered > self.max_spans and self._traces:
+            _, evicted = self._traces.popitem(last=False)
+            self._buffered -= len(evicted)
+            self.evicted_spans += len(evicted)
+            logger.debug(f"Tail sampling buffer full, evicted {len(evicted)} spans")
+
+    def should_keep(self, root: ReadableSpan) -> bool:
+        """
+        Decide whether a trace is exported, given its local root span.
+
+        Args:
+            root: The ended local root span
+
+        Returns:
+            True if the trace should be exported
+        """
+        attributes = root.attributes or {}
+        status_code = attributes.get(SpanAttributes.HTTP_STATUS_CODE)
+        if isinstance(status_code, int) and status_code >= 500:
+            return True
+        if root.status.status_code is StatusCode.ERROR and status_code is None:
+            return True
+
+        if root.end_time is not None and root.start_time is not None:
+            route = attributes.get(ROUTE_ATTRIBUTE)
+            threshold = self.route_thresholds.get(route, self.latency_threshold)
+            if (root.end_time - root.start_time) / 1e9 > threshold:
+                return True
+
+        return (
+            root.context.trace_id & TraceIdRatioBased.TRACE_ID_LIMIT
+            < self.baseline_bound
+        )
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self._traces.clear()
+            self._buffered = 0
+        self.downstream.shutdown()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return self.downstream.force_flush(timeout_millis)
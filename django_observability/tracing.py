@@ -5,8 +5,11 @@ This module provides distributed tracing capabilities using OpenTelemetry,
 including automatic instrumentation of Django requests.
 """
 
+import atexit
 import logging
-from typing import Optional
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
 
 from django.conf import settings
 from django.http import HttpRequest, HttpResponse
@@ -14,12 +17,25 @@ from django.http import HttpRequest, HttpResponse
 logger = logging.getLogger("django_observability.tracing")
 
 try:
-    from opentelemetry import trace
+    from opentelemetry import context, propagate, trace
     from opentelemetry.instrumentation.django import DjangoInstrumentor
+    from opentelemetry.propagators.composite import CompositePropagator
+    from opentelemetry.propagators.textmap import Getter
     from opentelemetry.sdk.resources import Resource
     from opentelemetry.sdk.trace import TracerProvider
-    from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
+    from opentelemetry.sdk.trace.export import (
+        BatchSpanProcessor,
+        ConsoleSpanExporter,
+        SpanExportResult,
+    )
+    from opentelemetry.sdk.trace.sampling import (
+        ALWAYS_OFF,
+        ALWAYS_ON,
+        ParentBased,
+        TraceIdRatioBased,
+    )
     from opentelemetry.semconv.trace import SpanAttributes
+    from opentelemetry.util._importlib_metadata import entry_points
 
     OPENTELEMETRY_AVAILABLE = True
     OTLP_AVAILABLE = False
@@ -49,10 +65,97 @@ except ImportError as e:
     )
 
 from .config import ObservabilityConfig
-from .utils import get_client_ip, get_view_name
+from .policies import RoutePolicyTable
+
+if OPENTELEMETRY_AVAILABLE:
+    from .sampling import (
+        POLICY_RATE_ATTRIBUTE,
+        ROUTE_ATTRIBUTE,
+        AdaptiveRouteSampler,
+        ReloadableSampler,
+        RoutePolicySampler,
+        TailSamplingSpanProcessor,
+    )
+from .observation import ObservationSink, RequestObservation, get_observation
+from .utils import get_response_size
+
+if OPENTELEMETRY_AVAILABLE:
+
+    class RequestMetaGetter(Getter):
+        """Reads propagation headers from a Django request's META dict."""
+
+        def get(self, carrier, key):
+            value = carrier.get("HTTP_" + key.upper().replace("-", "_"))
+            return [value] if value is not None else None
+
+        def keys(self, carrier):
+            return [
+                key[5:].lower().replace("_", "-")
+                for key in carrier
+                if key.startswith("HTTP_")
+            ]
+
+    request_meta_getter = RequestMetaGetter()
+
+    class MonitoredBatchSpanProcessor(BatchSpanProcessor):
+        """
+        BatchSpanProcessor that reports queue depth, dropped spans and export latency.
 
+        Spans are exported from the processor's background thread only; request
+        threads never wait on the exporter. Callbacks are optional and are set
+        by the metrics collector when metrics are enabled.
+        """
 
-class TracingManager:
+        def __init__(self, span_exporter, **kwargs):
+            super().__init__(span_exporter, **kwargs)
+            self.dropped_spans = 0
+            self.on_drop: Optional[Callable[[], None]] = None
+            self.on_export: Optional[Callable[[float, int, bool, int], None]] = None
+
+            original_export = span_exporter.export
+
+            def timed_export(spans):
+                start_time = time.time()
+                result = original_export(spans)
+                if self.on_export:
+                    self.on_export(
+                        time.time() - start_time,
+                        len(spans),
+                        result is SpanExportResult.SUCCESS,
+                        len(self.queue),
+                    )
+                return result
+
+            span_exporter.export = timed_export
+
+        def on_end(self, span) -> None:
+            if (
+                not self.done
+                and span.context.trace_flags.sampled
+                and len(self.queue) >= self.max_queue_size
+            ):
+                # The bounded deque discards the oldest span on append
+                self.dropped_spans += 1
+                if self.on_drop:
+                    self.on_drop()
+            super().on_end(span)
+
+
+@dataclass(frozen=True, slots=True)
+class SamplingSettings:
+    """
+    The root sampler and the span start attributes it reads, swapped as one unit.
+
+    A reload publishes a new instance with a single reference swap, so the
+    attributes a span starts with never belong to a different sampler.
+    """
+
+    sample_by_route: bool
+    sample_by_policy: bool
+    sampler: Any = None
+
+
+class TracingManager(ObservationSink):
     """
     Manages OpenTelemetry tracing for Django applications.
 
@@ -61,6 +164,11 @@ class TracingManager:
     - Span creation for HTTP requests
     - Django auto-instrumentation
     - Exception recording
+
+    Exactly one server span is produced per request. In "middleware" mode (the
+    default) the middleware creates it and makes it current for the duration of
+    the request; in "auto" mode DjangoInstrumentor creates it and the middleware
+    only enriches it.
     """
 
     def __init__(self, config: ObservabilityConfig):
@@ -72,8 +180,13 @@ class TracingManager:
         """
         self.config = config
         self.tracer = None
+        self.sampler = None
         self._span_processor = None
         self._initialized = False
+        self.auto_instrument = config.get("TRACING_MODE", "middleware") == "auto"
+        self.tail_sampling = config.get("TRACING_TAIL_SAMPLING", False)
+        self.sampling = SamplingSettings(sample_by_route=False, sample_by_policy=False)
+        self._tail_processor = None
 
         if not OPENTELEMETRY_AVAILABLE:
             logger.warning("Tracing disabled: OpenTelemetry not available")
@@ -114,44 +227,268 @@ class TracingManager:
         )
 
         # Create tracer provider
-        from opentelemetry.sdk.trace.sampling import TraceIdRatioBased
-
-        tracer_provider = TracerProvider(
-            resource=resource, sampler=TraceIdRatioBased(self.config.get_sample_rate())
-        )
+        self.sampling = self._create_sampling(self.config)
+        self.sampler = ReloadableSampler(lambda: self.sampling.sampler)
+        tracer_provider = TracerProvider(resource=resource, sampler=self.sampler)
+        self._setup_propagators()
 
         # Setup exporters
         otlp_endpoint = self.config.get("TRACING_EXPORT_ENDPOINT")
         if otlp_endpoint and OTLP_AVAILABLE:
             try:
                 exporter = OTLPSpanExporter(endpoint=otlp_endpoint)
-                self._span_processor = BatchSpanProcessor(exporter)
-                tracer_provider.add_span_processor(self._span_processor)
+                self._span_processor = self._create_span_processor(exporter)
+                tracer_provider.add_span_processor(self._wrap_span_processor())
                 logger.info(f"OTLP exporter configured: {otlp_endpoint}")
             except Exception as e:
                 logger.error(
                     f"Failed to setup OTLP exporter: {str(e)}. Falling back to ConsoleSpanExporter."
                 )
                 exporter = ConsoleSpanExporter()
-                self._span_processor = BatchSpanProcessor(exporter)
-                tracer_provider.add_span_processor(self._span_processor)
+                self._span_processor = self._create_span_processor(exporter)
+                tracer_provider.add_span_processor(self._wrap_span_processor())
                 logger.info("ConsoleSpanExporter configured as fallback")
         else:
             exporter = ConsoleSpanExporter()
-            self._span_processor = BatchSpanProcessor(exporter)
-            tracer_provider.add_span_processor(self._span_processor)
+            self._span_processor = self._create_span_processor(exporter)
+            tracer_provider.add_span_processor(self._wrap_span_processor())
             logger.info("ConsoleSpanExporter configured for development")
 
+        if self.config.get("TRACING_FLUSH_ON_SHUTDOWN", True):
+            atexit.register(self.shutdown)
+
         # Set global tracer provider
         trace.set_tracer_provider(tracer_provider)
         self.tracer = trace.get_tracer("django_observability")
         logger.debug(f"Tracer initialized: {self.tracer}")
 
+    def _create_sampling(self, config: ObservabilityConfig) -> SamplingSettings:
+        """
+        Build the sampling settings of a configuration.
+
+        Args:
+            config: The observability configuration instance
+
+        Returns:
+            The sampling settings
+        """
+        sample_by_policy = self._has_policy_rates(config)
+        return SamplingSettings(
+            sample_by_route=config.get("TRACING_ROOT_SAMPLER") == "adaptive",
+            sample_by_policy=sample_by_policy,
+            sampler=self._create_sampler(config, sample_by_policy),
+        )
+
+    def _create_sampler(self, config: ObservabilityConfig, sample_by_policy: bool):
+        """
+        Create the sampler: inbound sampling decisions are honored, and the root
+        sampler only decides for traces that start in this service.
+
+        Args:
+            config: The observability configuration instance
+            sample_by_policy: Whether route policies set trace sample rates
+
+        Returns:
+            A ParentBased sampler wrapping the configured root sampler
+        """
+        root_sampler = config.get("TRACING_ROOT_SAMPLER", "traceidratio")
+        if self.tail_sampling:
+            # Every local trace must be recorded for the tail sampler to decide on it
+            root_sampler = "always_on"
+        if root_sampler == "always_on":
+            root = ALWAYS_ON
+        elif root_sampler == "always_off":
+            root = ALWAYS_OFF
+        elif root_sampler == "adaptive":
+            root = AdaptiveRouteSampler(
+                budget=config.get("TRACING_ADAPTIVE_BUDGET", 100.0),
+                min_rate=config.get("TRACING_ADAPTIVE_MIN_RATE", 0.1),
+                interval=config.get("TRACING_ADAPTIVE_INTERVAL", 10.0),
+                initial_rate=config.get_sample_rate(),
+            )
+        else:
+            root = TraceIdRatioBased(config.get_sample_rate())
+        if sample_by_policy and not self.tail_sampling:
+            root = RoutePolicySampler(root)
+        logger.debug(f"Using parent-based sampler with root sampler {root_sampler}")
+        return ParentBased(root=root)
+
+    @staticmethod
+    def _has_policy_rates(config: ObservabilityConfig) -> bool:
+        """Check if any route policy sets a trace_sample_rate."""
+        return any(
+            policy.trace_sample_rate is not None
+            for policy in RoutePolicyTable.from_config(config)
+        )
+
+    def _get_start_attributes(self, observation: RequestObservation):
+        """
+        Return the attributes the sampler needs when the request span starts.
+
+        Args:
+            observation: The request observation
+
+        Returns:
+            The attributes, or None if the sampler does not need any
+        """
+        sampling = self.sampling
+        attributes = None
+        if sampling.sample_by_route:
+            attributes = {ROUTE_ATTRIBUTE: observation.endpoint}
+        rate = observation.policy.trace_sample_rate
+        # Only the RoutePolicySampler strips the attribute, and it is not
+        # installed under tail sampling
+        if rate is not None and sampling.sample_by_policy and not self.tail_sampling:
+            attributes = attributes or {}
+            attributes[POLICY_RATE_ATTRIBUTE] = rate
+        return attributes
+
+    def _setup_propagators(self) -> None:
+        """
+        Install the propagators named in TRACING_PROPAGATORS as the global textmap.
+        """
+        propagators = []
+        for name in self.config.get("TRACING_PROPAGATORS", ["tracecontext", "baggage"]):
+            try:
+                entry_point = next(
+                    iter(entry_points(group="opentelemetry_propagator", name=name))
+                )
+                propagators.append(entry_point.load()())
+            except StopIteration:
+                logger.warning(f"Unknown trace propagator: {name}")
+            except Exception as e:
+                logger.error(f"Failed to load trace propagator {name}: {str(e)}")
+
+        propagate.set_global_textmap(CompositePropagator(propagators))
+        logger.debug(f"Trace propagators configured: {propagators}")
+
+    def extract_context(self, request: HttpRequest):
+        """
+        Extract the inbound trace context (e.g. traceparent) from request headers.
+
+        Args:
+            request: The Django HttpRequest object
+
+        Returns:
+            The extracted OpenTelemetry context
+        """
+        return propagate.extract(request.META, getter=request_meta_getter)
+
+    def _create_span_processor(self, exporter) -> "MonitoredBatchSpanProcessor":
+        """
+        Create the batch span processor using the configured flush policy.
+
+        Unset options fall back to the OTEL_BSP_* environment variables and the
+        SDK defaults.
+        """
+        options = {
+            "max_queue_size": self.config.get("TRACING_MAX_QUEUE_SIZE"),
+            "max_export_batch_size": self.config.get("TRACING_MAX_EXPORT_BATCH_SIZE"),
+            "schedule_delay_millis": self.config.get("TRACING_SCHEDULE_DELAY_MILLIS"),
+            "export_timeout_millis": self.config.get("TRACING_EXPORT_TIMEOUT_MILLIS"),
+        }
+        return MonitoredBatchSpanProcessor(
+            exporter,
+            **{key: value for key, value in options.items() if value is not None},
+        )
+
+    def _wrap_span_processor(self):
+        """
+        Return the processor to register with the tracer provider: the batch
+        processor, behind a tail sampling buffer if TRACING_TAIL_SAMPLING is on.
+        """
+        if not self.tail_sampling:
+            return self._span_processor
+
+        self._tail_processor = TailSamplingSpanProcessor(
+            self._span_processor,
+            max_spans=self.config.get("TRACING_TAIL_MAX_SPANS", 10000),
+            latency_threshold=self.config.get("TRACING_TAIL_LATENCY_THRESHOLD", 1.0),
+            route_thresholds=self.config.get("TRACING_TAIL_ROUTE_THRESHOLDS"),
+            baseline_rate=self.config.get_sample_rate(),
+        )
+        logger.info("Tail-based sampling enabled")
+        return self._tail_processor
+
+    @property
+    def span_processor(self) -> Optional["MonitoredBatchSpanProcessor"]:
+        """The batch span processor, if tracing is initialized."""
+        return self._span_processor
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        """
+        Export all queued spans, blocking until done or the timeout expires.
+
+        Not called on the request path; use it from management commands, tests,
+        or before a deliberate process exit.
+
+        Args:
+            timeout_millis: Maximum time to wait for the export
+
+        Returns:
+            True if all spans were exported within the timeout
+        """
+        if not self._span_processor:
+            return True
+        try:
+            return self._span_processor.force_flush(timeout_millis)
+        except Exception as e:
+            logger.error(f"Failed to flush spans: {str(e)}")
+            return False
+
+    def shutdown(self) -> None:
+        """Flush remaining spans and stop the span processor's export thread."""
+        if not self._span_processor:
+            return
+        try:
+            self._span_processor.shutdown()
+            logger.debug("Span processor shut down")
+        except Exception as e:
+            logger.error(f"Failed to shut down span processor: {str(e)}")
+
+    def apply_config(self, config: ObservabilityConfig) -> None:
+        """
+        Swap in the sampling settings of a reloaded configuration.
+
+        The root sampler and tail sampling thresholds are replaced; exporters,
+        propagators, TRACING_MODE and TRACING_TAIL_SAMPLING only apply at startup.
+
+        Args:
+            config: The reloaded configuration
+        """
+        self.config = config
+        if self.sampler is None:
+            return
+        try:
+            # Built in full before the swap, so spans see old or new settings
+            self.sampling = self._create_sampling(config)
+            if self._tail_processor:
+                self._tail_processor.latency_threshold = config.get(
+                    "TRACING_TAIL_LATENCY_THRESHOLD", 1.0
+                )
+                self._tail_processor.route_thresholds = (
+                    config.get("TRACING_TAIL_ROUTE_THRESHOLDS") or {}
+                )
+                self._tail_processor.baseline_bound = (
+                    TraceIdRatioBased.get_bound_for_rate(config.get_sample_rate())
+                )
+            logger.info(f"Tracing sampler reloaded: {self.sampler.get_description()}")
+        except Exception as e:
+            logger.error(f"Failed to reload tracing sampler: {str(e)}")
+
     def _setup_instrumentations(self) -> None:
         """
-        Setup automatic instrumentation for Django.
+        Setup automatic instrumentation for Django (auto mode only).
         """
-        if not self._initialized:
+        if self.tracer is None:
+            return
+
+        if not self.auto_instrument:
+            if DjangoInstrumentor().is_instrumented_by_opentelemetry:
+                logger.warning(
+                    "DjangoInstrumentor is active while TRACING_MODE is 'middleware'; "
+                    "requests will produce two server spans"
+                )
             return
 
         try:
@@ -169,6 +506,27 @@ class TracingManager:
             if self.config.get("DEBUG_MODE", False):
                 raise
 
+    def _get_request_attributes(self, observation: RequestObservation) -> dict:
+        """
+        Build the request attributes of a recording span.
+
+        Args:
+            observation: The request observation
+
+        Returns:
+            Span attributes describing the request
+        """
+        return {
+            SpanAttributes.HTTP_METHOD: observation.method,
+            SpanAttributes.HTTP_URL: observation.url,
+            SpanAttributes.HTTP_SCHEME: observation.scheme,
+            SpanAttributes.HTTP_HOST: observation.host,
+            SpanAttributes.NET_PEER_IP: observation.client_ip,
+            "http.user_agent": observation.user_agent or "unknown",
+            "http.route": observation.view_name,
+            ROUTE_ATTRIBUTE: observation.endpoint,
+        }
+
     def _request_hook(self, span: trace.Span, request: HttpRequest) -> None:
         """
         Add custom attributes to request spans.
@@ -177,21 +535,11 @@ class TracingManager:
             span: The OpenTelemetry span
             request: The Django HttpRequest object
         """
-        if not span:
+        if not span or not span.is_recording():
             return
 
         try:
-            span.set_attributes(
-                {
-                    SpanAttributes.HTTP_METHOD: request.method,
-                    SpanAttributes.HTTP_URL: request.build_absolute_uri(),
-                    SpanAttributes.HTTP_SCHEME: request.scheme,
-                    SpanAttributes.HTTP_HOST: request.get_host(),
-                    SpanAttributes.NET_PEER_IP: get_client_ip(request),
-                    "http.user_agent": request.META.get("HTTP_USER_AGENT", "unknown"),
-                    "http.route": get_view_name(request),
-                }
-            )
+            span.set_attributes(self._get_request_attributes(get_observation(request)))
             logger.debug(
                 f"Set request attributes for span: {request.method} {request.path}"
             )
@@ -209,16 +557,14 @@ class TracingManager:
             request: The Django HttpRequest object
             response: The Django HttpResponse object
         """
-        if not span:
+        if not span or not span.is_recording():
             return
 
         try:
             span.set_attributes(
                 {
                     SpanAttributes.HTTP_STATUS_CODE: response.status_code,
-                    "http.response_content_length": (
-                        len(response.content) if hasattr(response, "content") else 0
-                    ),
+                    "http.response_content_length": get_response_size(response),
                 }
             )
             logger.debug(
@@ -237,7 +583,7 @@ class TracingManager:
         return OPENTELEMETRY_AVAILABLE and self._initialized and self.tracer is not None
 
     def start_request_span(
-        self, request: HttpRequest, correlation_id: str
+        self, request: HttpRequest, correlation_id: str, parent_context: Any = None
     ) -> Optional[trace.Span]:
         """
         Start a new span for an HTTP request.
@@ -245,6 +591,8 @@ class TracingManager:
         Args:
             request: The Django HttpRequest object
             correlation_id: The correlation ID for the request
+            parent_context: Context to start the span in (defaults to the context
+                extracted from the request headers)
 
         Returns:
             The created span, or None if tracing is not available
@@ -254,19 +602,21 @@ class TracingManager:
             return None
 
         try:
+            observation = get_observation(request, correlation_id)
+            # Attributes are only built once the sampler has kept the span
+            if parent_context is None:
+                parent_context = self.extract_context(request)
             span = self.tracer.start_span(
-                name=f"{request.method} {get_view_name(request)}",
-                attributes={
-                    SpanAttributes.HTTP_METHOD: request.method,
-                    SpanAttributes.HTTP_URL: request.build_absolute_uri(),
-                    SpanAttributes.HTTP_SCHEME: request.scheme,
-                    SpanAttributes.HTTP_HOST: request.get_host(),
-                    SpanAttributes.NET_PEER_IP: get_client_ip(request),
-                    "http.user_agent": request.META.get("HTTP_USER_AGENT", "unknown"),
-                    "http.correlation_id": correlation_id,
-                    "http.route": get_view_name(request),
-                },
+                name=observation.method,
+                context=parent_context,
+                kind=trace.SpanKind.SERVER,
+                attributes=self._get_start_attributes(observation),
             )
+            if span.is_recording():
+                span.update_name(f"{observation.method} {observation.view_name}")
+                attributes = self._get_request_attributes(observation)
+                attributes["http.correlation_id"] = correlation_id
+                span.set_attributes(attributes)
             logger.debug(f"Started span for {request.method} {request.path}: {span}")
             return span
         except Exception as e:
@@ -295,14 +645,23 @@ class TracingManager:
             logger.debug("Cannot end span: tracing not available or span is None")
             return
 
+        if not span.is_recording():
+            span.end()
+            return
+
         try:
             if response:
+                observation = get_observation(request)
                 span.set_attribute(
                     SpanAttributes.HTTP_STATUS_CODE, response.status_code
                 )
                 span.set_attribute(
                     "http.response_content_length",
-                    len(response.content) if hasattr(response, "content") else 0,
+                    (
+                        observation.response_size
+                        if observation.response is response
+                        else get_response_size(response)
+                    ),
                 )
                 if response.status_code >= 400:
                     span.set_status(trace.Status(trace.StatusCode.ERROR))
@@ -311,10 +670,6 @@ class TracingManager:
             span.set_attribute("http.duration_ms", duration * 1000)
             span.end()
             logger.debug(f"Ended span for {request.method} {request.path}")
-            # Force flush spans for console output
-            if self._span_processor:
-                self._span_processor.force_flush()
-                logger.debug("Span processor flushed")
         except Exception as e:
             logger.error(
                 f"Failed to end span for {request.method} {request.path}: {str(e)}"
@@ -340,9 +695,69 @@ class TracingManager:
             span.record_exception(exception)
             span.set_status(trace.Status(trace.StatusCode.ERROR, str(exception)))
             logger.debug(f"Recorded exception in span: {exception.__class__.__name__}")
-            # Force flush spans for console output
-            if self._span_processor:
-                self._span_processor.force_flush()
-                logger.debug("Span processor flushed after exception")
         except Exception as e:
             logger.error(f"Failed to record exception: {str(e)}")
+
+    def _adopt_current_span(self, observation: RequestObservation) -> Any:
+        """
+        Return the server span DjangoInstrumentor made current for this request.
+
+        Args:
+            observation: The request observation
+
+        Returns:
+            The current span, or None if there is no valid current span
+        """
+        span = trace.get_current_span()
+        if not span.get_span_context().is_valid:
+            return None
+        if span.is_recording():
+            span.set_attribute("http.correlation_id", observation.correlation_id)
+        return span
+
+    def request_started(self, observation: RequestObservation) -> None:
+        """Start (or adopt) the request span and attach it to the observation."""
+        if self.auto_instrument:
+            span = (
+                self._adopt_current_span(observation) if self.is_available() else None
+            )
+        elif self.is_available():
+            parent_context = self.extract_context(observation.request)
+            span = self.start_request_span(
+                observation.request, observation.correlation_id, parent_context
+            )
+            if span is not None:
+                # Make the span current so DB, cache and template spans nest under it
+                observation.span_context_token = context.attach(
+                    trace.set_span_in_context(span, parent_context)
+                )
+        else:
+            span = None
+        observation.span = span
+        observation.request.observability_span = span
+
+    def request_finished(self, observation: RequestObservation) -> None:
+        """End the request span with the observed response."""
+        if self.auto_instrument:
+            # DjangoInstrumentor sets the response attributes and ends its span
+            return
+
+        token = observation.span_context_token
+        observation.span_context_token = None
+        self.end_request_span(
+            observation.span,
+            observation.request,
+            observation.response,
+            observation.duration,
+        )
+        if token is not None:
+            context.detach(token)
+
+    def request_failed(
+        self, observation: RequestObservation, exception: Exception
+    ) -> None:
+        """Record the exception on the request span."""
+        if self.auto_instrument:
+            # DjangoInstrumentor records the exception when it ends its span
+            return
+        self.record_exception(observation.span, exception)
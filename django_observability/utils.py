@@ -1,8 +1,11 @@
 import logging
-from typing import Dict, List
+from typing import Any, Dict, List, Optional
 
-from django.http import HttpRequest
-from django.urls import resolve
+from django.http import HttpRequest, HttpResponse
+from django.urls import ResolverMatch, resolve
+from django.utils.functional import LazyObject, empty
+
+from .routes import get_route_catalog
 
 logger = logging.getLogger("django_observability.utils")
 
@@ -58,27 +61,117 @@ def is_excluded_path(path: str, exclude_paths: List[str]) -> bool:
     return any(path.startswith(excluded) for excluded in exclude_paths)
 
 
-def get_view_name(request: HttpRequest) -> str:
+def resolve_request(request: HttpRequest) -> Optional[ResolverMatch]:
     """
-    Get the view name for a request.
+    Resolve a request the way Django's handler does.
+
+    The path is matched without its SCRIPT_NAME prefix (path_info), against the
+    request's own urlconf if a middleware has set one.
 
     Args:
         request: The Django HttpRequest object
 
     Returns:
-        The view name or 'unknown' if not resolved
+        The ResolverMatch, or None if the request does not resolve
     """
     try:
-        # Ensure resolver_match is populated
-        if not hasattr(request, "resolver_match") or not request.resolver_match:
-            resolver_match = resolve(request.path)
-            request.resolver_match = resolver_match
-            logger.debug(
-                f"Manually resolved path {request.path}: {resolver_match.__dict__}"
-            )
-        view_name = request.resolver_match.view_name or "unknown"
-        logger.debug(f"Resolved view_name for {request.path}: {view_name}")
-        return view_name
+        return resolve(request.path_info, getattr(request, "urlconf", None))
     except Exception as e:
-        logger.debug(f"Failed to resolve view name for {request.path}: {str(e)}")
+        logger.debug(f"Failed to resolve {request.path_info}: {str(e)}")
+        return None
+
+
+def get_view_name(
+    request: HttpRequest, resolver_match: Optional[ResolverMatch] = None
+) -> str:
+    """
+    Get the view name for a request.
+
+    Args:
+        request: The Django HttpRequest object
+        resolver_match: The request's ResolverMatch, if already known. Otherwise
+            Django's match is used, or the request is resolved here.
+
+    Returns:
+        The view name or 'unknown' if not resolved
+    """
+    match = (
+        resolver_match
+        or getattr(request, "resolver_match", None)
+        or resolve_request(request)
+    )
+    view_name = getattr(match, "view_name", None) or "unknown"
+    logger.debug(f"Resolved view_name for {request.path}: {view_name}")
+    return view_name
+
+
+def get_endpoint_label(
+    request: Optional[HttpRequest], resolver_match: Optional[ResolverMatch] = None
+) -> str:
+    """
+    Generate a low-cardinality endpoint label for a request.
+
+    The label is the matched route template (e.g. "api/users/<int:pk>/"), looked
+    up in the precompiled route catalog. Requests that did not resolve share the
+    "unmatched" label.
+
+    Args:
+        request: The Django HttpRequest object (optional)
+        resolver_match: The request's ResolverMatch, if already known. Otherwise
+            Django's match is used, or the request is resolved here.
+
+    Returns:
+        The endpoint label
+    """
+    if not request:
         return "unknown"
+
+    match = (
+        resolver_match
+        or getattr(request, "resolver_match", None)
+        or resolve_request(request)
+    )
+    return get_route_catalog().label_for(match)
+
+
+def get_response_size(response: Optional[HttpResponse]) -> int:
+    """
+    Get the response content size in bytes.
+
+    Args:
+        response: The Django HttpResponse object (optional)
+
+    Returns:
+        The content length, or 0 if it cannot be determined
+    """
+    try:
+        content_length = response.get("Content-Length")
+        if content_length is not None:
+            return int(content_length)
+        if hasattr(response, "content"):
+            return len(response.content)
+        return 0
+    except Exception:
+        return 0
+
+
+def get_loaded_user(request: HttpRequest) -> Optional[Any]:
+    """
+    Get the request's user only if it has already been loaded.
+
+    AuthenticationMiddleware sets request.user to a lazy object that reads the
+    session and queries the user table on first access. This returns None
+    instead of triggering that load.
+
+    Args:
+        request: The Django HttpRequest object
+
+    Returns:
+        The user object, or None if there is none or it has not been loaded
+    """
+    user = getattr(request, "user", None)
+    if isinstance(user, LazyObject):
+        user = user._wrapped
+        if user is empty:
+            return None
+    return user
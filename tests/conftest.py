@@ -11,6 +11,7 @@ from opentelemetry.sdk.trace.export import ConsoleSpanExporter, SimpleSpanProces
 from opentelemetry.sdk.trace.sampling import TraceIdRatioBased
 
 from django_observability.config import ObservabilityConfig
+from django_observability.context import unbind_observation
 
 # Configure minimal Django settings for tests
 if not settings.configured:
@@ -47,9 +48,11 @@ def reset_global_state():
     import django_observability.config
 
     django_observability.config._config_instance = None
+    unbind_observation()
     yield
     trace._TRACER_PROVIDER = None
     django_observability.config._config_instance = None
+    unbind_observation()
 
 
 @pytest.fixture
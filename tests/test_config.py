@@ -1,3 +1,5 @@
+import dataclasses
+
 import pytest
 
 from django_observability.config import ObservabilityConfig
@@ -65,3 +67,23 @@ def test_sample_rate_validation_edge_cases():
         ValueError, match="TRACING_SAMPLE_RATE must be between 0.0 and 1.0"
     ):
         config.get_sample_rate()
+
+
+def test_compiled_config_snapshot(config):
+    """Test compile() normalizes per-request settings into a frozen snapshot."""
+    config._config["EXCLUDE_PATHS"] = ["/health/", "/metrics/"]
+    config._config["ADD_CORRELATION_HEADER"] = 1
+    snapshot = config.compile()
+
+    assert snapshot.exclude_paths == ("/health/", "/metrics/")
+    assert snapshot.is_excluded("/health/live")
+    assert not snapshot.is_excluded("/api/health/")
+    assert snapshot.add_correlation_header is True
+    assert not hasattr(snapshot, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        snapshot.debug_mode = True
+
+    # The snapshot does not follow later changes
+    config._config["EXCLUDE_PATHS"] = []
+    assert snapshot.is_excluded("/health/")
+    assert not config.compile().is_excluded("/health/")
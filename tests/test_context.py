@@ -0,0 +1,124 @@
+import asyncio
+import logging
+
+import pytest
+from django.http import HttpResponse
+from opentelemetry.trace import format_span_id, format_trace_id
+
+from django_observability.context import (
+    RequestContextFilter,
+    bind_observation,
+    get_current_observation,
+    install_context_filter,
+    unbind_observation,
+)
+from django_observability.middleware import (
+    AsyncObservabilityMiddleware,
+    ObservabilityMiddleware,
+)
+from django_observability.observation import RequestObservation
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+@pytest.fixture
+def app_records():
+    """Capture records of an application logger through a filtered handler."""
+    handler = _ListHandler()
+    install_context_filter(handler)
+    app_logger = logging.getLogger("tests.app")
+    app_logger.addHandler(handler)
+    app_logger.setLevel(logging.INFO)
+    yield app_logger, handler.records
+    app_logger.removeHandler(handler)
+
+
+def _record(**extra):
+    record = logging.LogRecord("tests.app", logging.INFO, __file__, 1, "m", (), None)
+    record.__dict__.update(extra)
+    return record
+
+
+def test_context_filter_stamps_ids(request_factory, tracer_provider):
+    """Test records get the bound correlation ID and the current span IDs."""
+    context_filter = RequestContextFilter()
+    observation = RequestObservation(request_factory.get("/test/"), "cid")
+    token = bind_observation(observation)
+    try:
+        tracer = tracer_provider.get_tracer(__name__)
+        with tracer.start_as_current_span("view") as span:
+            record = _record()
+            explicit = _record(correlation_id="other")
+            context_filter.filter(record)
+            context_filter.filter(explicit)
+    finally:
+        unbind_observation(token)
+
+    span_context = span.get_span_context()
+    assert record.correlation_id == "cid"
+    assert record.trace_id == format_trace_id(span_context.trace_id)
+    assert record.span_id == format_span_id(span_context.span_id)
+    assert explicit.correlation_id == "other"
+
+    record = _record()
+    context_filter.filter(record)
+    assert get_current_observation() is None
+    assert not hasattr(record, "correlation_id")
+    assert not hasattr(record, "trace_id")
+
+
+def test_install_context_filter_is_idempotent():
+    """Test installing twice adds a single filter per handler."""
+    handler = _ListHandler()
+    install_context_filter(handler)
+    install_context_filter(handler)
+    assert len(handler.filters) == 1
+
+
+@pytest.mark.django_db
+def test_middleware_binds_request_context(config, request_factory, app_records):
+    """Test application logs written by a view carry the request IDs."""
+    app_logger, records = app_records
+
+    def get_response(request):
+        app_logger.info("in view")
+        return HttpResponse()
+
+    middleware = ObservabilityMiddleware(get_response, config=config)
+    request = request_factory.get("/test/")
+    middleware(request)
+
+    assert records[0].correlation_id == request.observability_correlation_id
+    span_context = request.observability_observation.span.get_span_context()
+    assert records[0].trace_id == format_trace_id(span_context.trace_id)
+    assert get_current_observation() is None
+
+
+@pytest.mark.asyncio
+async def test_async_middleware_binds_request_context(request_factory, app_records):
+    """Test the async middleware context reaches tasks spawned by the view."""
+    app_logger, records = app_records
+
+    async def log_later():
+        app_logger.info("in task")
+
+    async def get_response(request):
+        app_logger.info("in view")
+        await asyncio.create_task(log_later())
+        return HttpResponse()
+
+    middleware = AsyncObservabilityMiddleware(get_response)
+    request = request_factory.get("/test/")
+    await middleware(request)
+
+    assert [record.correlation_id for record in records] == [
+        request.observability_correlation_id
+    ] * 2
+    assert get_current_observation() is None
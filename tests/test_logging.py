@@ -1,7 +1,25 @@
+import io
+import json
+import logging
+import threading
+from datetime import datetime, timezone
+from unittest.mock import Mock, patch
+
 import pytest
-from django.http import HttpResponse
+from django.contrib.auth.models import User
+from django.http import FileResponse, HttpResponse, StreamingHttpResponse
+from django.utils.functional import SimpleLazyObject
+from opentelemetry.trace import NonRecordingSpan, SpanContext
 
-from django_observability.logging import JSONFormatter, StructuredLogger
+from django_observability.context import RequestContextFilter
+from django_observability.logging import (
+    BoundedQueueHandler,
+    JSONFormatter,
+    LogSampler,
+    StructlogLogger,
+    StructuredLogger,
+)
+from django_observability.observation import RequestObservation
 
 
 @pytest.mark.django_db
@@ -78,3 +96,441 @@ def test_structured_logger_exception(config, request_factory):
     correlation_id = "test-correlation-id"
     exception = ValueError("Test error")
     logger.log_exception(request, exception, correlation_id)
+
+
+def _log_record(created=1234567890.0, msg="Test message", **extra):
+    record = logging.LogRecord(
+        "test", logging.INFO, "test_module.py", 42, msg, None, None
+    )
+    record.created = created
+    record.__dict__.update(extra)
+    return record
+
+
+def test_json_formatter_timestamp_matches_isoformat():
+    """Test the cached timestamp prefix produces datetime.isoformat() output."""
+    formatter = JSONFormatter()
+
+    for created in (1234567890.0, 1234567890.25, 1234567890.9999999, 1234567891.5):
+        expected = datetime.fromtimestamp(created, tz=timezone.utc).isoformat()
+        assert formatter.format_timestamp(created) == expected
+
+
+def test_json_formatter_extra_fields():
+    """Test extra fields are serialized in one pass with a str() fallback."""
+    formatter = JSONFormatter()
+    marker = object()
+
+    entry = json.loads(
+        formatter.format(_log_record(user_id=7, obj=marker, bad_keys={(1, 2): "a"}))
+    )
+
+    assert entry["extra"]["user_id"] == 7
+    assert entry["extra"]["obj"] == str(marker)
+    assert entry["extra"]["bad_keys"] == str({(1, 2): "a"})
+    assert "msg" not in entry["extra"]
+
+
+@pytest.mark.parametrize("backend", ["orjson", "auto"])
+def test_json_formatter_orjson_backend(backend):
+    """Test the orjson backend produces the same entry as the json backend."""
+    pytest.importorskip("orjson")
+    record = _log_record(created=1234567890.5, path="/test/", obj=object())
+
+    fast = json.loads(JSONFormatter(backend=backend).format(record))
+    default = json.loads(JSONFormatter().format(record))
+
+    assert fast == default
+
+
+class _GatedHandler(logging.Handler):
+    """Handler that blocks on its first record until released."""
+
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+        self.started = threading.Event()
+        self.gate = threading.Event()
+
+    def emit(self, record):
+        self.started.set()
+        self.gate.wait(5)
+        self.messages.append(record.getMessage())
+
+
+@pytest.mark.parametrize(
+    "drop_policy,expected",
+    [("drop_newest", ["1", "2", "3"]), ("drop_oldest", ["1", "3", "4"])],
+)
+def test_bounded_queue_handler_drop_policy(drop_policy, expected):
+    """Test a full log queue drops records per policy instead of blocking."""
+    target = _GatedHandler()
+    handler = BoundedQueueHandler(target, maxsize=2, drop_policy=drop_policy)
+    handler.on_drop = Mock()
+
+    handler.handle(_log_record(msg="1"))
+    assert target.started.wait(5)
+    for message in ("2", "3", "4"):
+        handler.handle(_log_record(msg=message))
+
+    assert handler.dropped_records == 1
+    handler.on_drop.assert_called_once()
+    target.gate.set()
+    handler.close()
+    assert target.messages == expected
+
+
+def test_structured_logger_async_mode(config):
+    """Test async mode logs through a queue listener and keeps exception info."""
+    config._config["LOGGING_ASYNC"] = True
+    structured_logger = StructuredLogger(config)
+    handler = structured_logger.logger.handlers[0]
+    assert isinstance(handler, BoundedQueueHandler)
+    assert structured_logger.queue_handler is handler
+
+    records = []
+    target = handler.listener.handlers[0]
+    target.emit = records.append
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        structured_logger.logger.exception("failed %s", "request")
+    structured_logger.shutdown()
+
+    assert records[0].getMessage() == "failed request"
+    assert records[0].exc_info[0] is ValueError
+    assert structured_logger.dropped_records == 0
+
+
+@pytest.mark.django_db
+def test_access_log_single_record(config, request_factory, mocker):
+    """Test access-log mode emits one combined record per request."""
+    config._config["LOGGING_ACCESS_LOG"] = True
+    structured_logger = StructuredLogger(config)
+    info = mocker.patch.object(structured_logger.logger, "info")
+    observation = RequestObservation(request_factory.get("/test/?q=1"), "cid")
+
+    structured_logger.request_started(observation)
+    observation.finish(HttpResponse(status=201), 0.25)
+    structured_logger.request_finished(observation)
+
+    info.assert_called_once()
+    record = info.call_args.kwargs["extra"]
+    assert record["event"] == "request"
+    assert record["correlation_id"] == "cid"
+    assert record["http"]["query_string"] == "q=1"
+    assert record["http"]["status_code"] == 201
+    assert record["timing"]["duration_ms"] == 250.0
+    assert "client_ip" in record["network"]
+
+
+@pytest.mark.django_db
+def test_access_log_start_record_for_long_requests(config, request_factory, mocker):
+    """Test a lightweight start record is kept for configured long-running paths."""
+    config._config["LOGGING_ACCESS_LOG"] = True
+    config._config["LOGGING_ACCESS_LOG_START_PATHS"] = ["/exports/"]
+    structured_logger = StructuredLogger(config)
+    info = mocker.patch.object(structured_logger.logger, "info")
+
+    structured_logger.request_started(
+        RequestObservation(request_factory.get("/test/"), "cid")
+    )
+    info.assert_not_called()
+    structured_logger.request_started(
+        RequestObservation(request_factory.post("/exports/run/"), "cid")
+    )
+
+    assert info.call_args.kwargs["extra"] == {
+        "event": "request_start",
+        "correlation_id": "cid",
+        "http": {"method": "POST", "path": "/exports/run/"},
+    }
+
+
+def _finished_observation(request_factory, status=200, duration=0.01, cid="cid"):
+    observation = RequestObservation(request_factory.get("/test/"), cid)
+    observation.finish(HttpResponse(status=status), duration)
+    return observation
+
+
+@pytest.mark.django_db
+def test_log_sampler_always_keeps_errors_and_slow_requests(request_factory):
+    """Test always-keep rules override a zero sampling rate."""
+    sampler = LogSampler(rate=0.0, slow_threshold=1.0)
+    sampler.on_sampled_out = Mock()
+
+    assert not sampler.keep(_finished_observation(request_factory))
+    assert sampler.keep(_finished_observation(request_factory, status=503))
+    assert sampler.keep(_finished_observation(request_factory, duration=2.0))
+    failed = _finished_observation(request_factory, status=404)
+    failed.exception = ValueError("boom")
+    assert sampler.keep(failed)
+
+    sampler.record_sampled_out(_finished_observation(request_factory))
+    sampler.on_sampled_out.assert_called_once_with("test/")
+
+
+@pytest.mark.django_db
+def test_log_sampler_is_deterministic(request_factory):
+    """Test decisions follow the trace ID ratio, or a hash of the correlation ID."""
+    sampler = LogSampler(rate=0.5, route_rates={"test/": 0.25})
+    observation = _finished_observation(request_factory)
+    observation.span = NonRecordingSpan(
+        SpanContext(trace_id=(1 << 62) - 1, span_id=1, is_remote=False)
+    )
+    assert sampler.keep(observation)
+    observation.span = NonRecordingSpan(
+        SpanContext(trace_id=1 << 62, span_id=1, is_remote=False)
+    )
+    assert not sampler.keep(observation)
+
+    decisions = {
+        cid: sampler.keep(_finished_observation(request_factory, cid=cid))
+        for cid in map(str, range(200))
+    }
+    assert decisions == {
+        cid: sampler.keep(_finished_observation(request_factory, cid=cid))
+        for cid in decisions
+    }
+    assert 20 < sum(decisions.values()) < 80
+
+
+@pytest.mark.django_db
+def test_log_sampler_rate_limit(request_factory):
+    """Test the per-route records-per-second limit."""
+    sampler = LogSampler(rate=1.0, rate_limit=2)
+
+    with patch("django_observability.logging.time.monotonic", return_value=10.0):
+        kept = [sampler.keep(_finished_observation(request_factory)) for _ in range(3)]
+    with patch("django_observability.logging.time.monotonic", return_value=11.0):
+        kept.append(sampler.keep(_finished_observation(request_factory)))
+
+    assert kept == [True, True, False, True]
+
+
+@pytest.mark.django_db
+def test_structured_logger_skips_sampled_out_records(config, request_factory, mocker):
+    """Test sampled-out requests are counted instead of logged."""
+    config._config["LOGGING_SAMPLE_RATE"] = 0.0
+    structured_logger = StructuredLogger(config)
+    info = mocker.patch.object(structured_logger.logger, "info")
+    observation = RequestObservation(request_factory.get("/test/"), "cid")
+
+    structured_logger.request_started(observation)
+    observation.finish(HttpResponse(status=200), 0.01)
+    structured_logger.request_finished(observation)
+
+    info.assert_not_called()
+    assert structured_logger.sampler.sampled_out_records == 2
+
+
+@pytest.mark.django_db
+def test_structured_logger_does_not_load_lazy_user(config, request_factory, mocker):
+    """Test an unevaluated request.user is never loaded by logging."""
+    structured_logger = StructuredLogger(config)
+    info = mocker.patch.object(structured_logger.logger, "info")
+    load_user = Mock()
+    request = request_factory.get("/test/")
+    request.user = SimpleLazyObject(load_user)
+
+    structured_logger.log_request_start(request, "cid")
+    structured_logger.log_request_end(request, HttpResponse(), 0.01, "cid")
+
+    load_user.assert_not_called()
+    assert "user" not in info.call_args.kwargs["extra"]
+
+
+@pytest.mark.django_db
+def test_structured_logger_logs_loaded_user_at_response(
+    config, request_factory, mocker
+):
+    """Test a user the view already loaded is logged on the end record."""
+    structured_logger = StructuredLogger(config)
+    info = mocker.patch.object(structured_logger.logger, "info")
+    user = User(pk=7, username="alice", is_staff=True)
+    request = request_factory.get("/test/")
+    request.user = SimpleLazyObject(lambda: user)
+    request.user.is_authenticated  # the view evaluates the user
+
+    structured_logger.log_request_end(request, HttpResponse(), 0.01, "cid")
+
+    assert info.call_args.kwargs["extra"]["user"] == {
+        "id": "7",
+        "username": "alice",
+        "is_staff": True,
+        "is_superuser": False,
+    }
+
+
+@pytest.fixture
+def body_logger(config, mocker):
+    """Create a structured logger capturing bodies of at most 8 bytes."""
+    config._config["LOGGING_INCLUDE_BODY"] = True
+    config._config["LOGGING_BODY_MAX_BYTES"] = 8
+    structured_logger = StructuredLogger(config)
+    info = mocker.patch.object(structured_logger.logger, "info")
+    return structured_logger, info
+
+
+@pytest.mark.django_db
+def test_request_body_capture_is_bounded(body_logger, request_factory):
+    """Test request bodies are truncated, and large bodies are never read."""
+    structured_logger, info = body_logger
+
+    request = request_factory.post(
+        "/test/", data='{"name": "alice"}', content_type="application/json"
+    )
+    request.body  # already loaded by the view
+    structured_logger.log_request_start(request, "cid")
+    assert info.call_args.kwargs["extra"]["http"]["body"] == (
+        '{"name":...[TRUNCATED 9 bytes]'
+    )
+
+    request = request_factory.post("/test/", data="x" * 100, content_type="text/plain")
+    structured_logger.log_request_start(request, "cid")
+    assert info.call_args.kwargs["extra"]["http"]["body"] == (
+        "[NOT CAPTURED: 100 bytes]"
+    )
+    assert not request._read_started
+    assert request.body == b"x" * 100
+
+
+@pytest.mark.django_db
+def test_request_body_without_content_length_not_read(body_logger, request_factory):
+    """Test a body of unknown length (e.g. chunked) is never read for logging."""
+    structured_logger, info = body_logger
+
+    request = request_factory.post("/test/", data="x" * 100, content_type="text/plain")
+    del request.META["CONTENT_LENGTH"]
+    structured_logger.log_request_start(request, "cid")
+
+    assert info.call_args.kwargs["extra"]["http"]["body"] == (
+        "[NOT CAPTURED: unknown length]"
+    )
+    assert not request._read_started
+
+
+@pytest.mark.django_db
+def test_response_body_capture_skips_streaming(body_logger, request_factory):
+    """Test streaming and file responses are left untouched."""
+    structured_logger, info = body_logger
+    request = request_factory.get("/test/")
+
+    structured_logger.log_request_end(
+        request, HttpResponse("0123456789", content_type="text/plain"), 0.01, "cid"
+    )
+    assert info.call_args.kwargs["extra"]["http"]["response_body"] == (
+        "01234567...[TRUNCATED 2 bytes]"
+    )
+
+    streaming = StreamingHttpResponse(iter(["abc"]), content_type="text/plain")
+    iterator = streaming._iterator
+    structured_logger.log_request_end(request, streaming, 0.01, "cid")
+    assert streaming._iterator is iterator
+    assert "response_body" not in info.call_args.kwargs["extra"]["http"]
+
+    file_response = FileResponse(io.BytesIO(b"data"), content_type="text/plain")
+    structured_logger.log_request_end(request, file_response, 0.01, "cid")
+    assert "response_body" not in info.call_args.kwargs["extra"]["http"]
+
+
+@pytest.mark.django_db
+def test_response_body_tee_for_streaming(body_logger, config, request_factory):
+    """Test streaming bodies are teed and logged once the stream ends."""
+    structured_logger, info = body_logger
+    config._config["LOGGING_BODY_CAPTURE_STREAMING"] = True
+    structured_logger.apply_config(config)
+    response = StreamingHttpResponse(
+        iter(["hello ", "streaming ", "world"]), content_type="text/plain"
+    )
+
+    structured_logger.log_request_end(
+        request_factory.get("/test/"), response, 0.01, "cid"
+    )
+    assert b"".join(response.streaming_content) == b"hello streaming world"
+
+    assert info.call_args.kwargs["extra"] == {
+        "event": "response_body",
+        "correlation_id": "cid",
+        "http": {"response_body": "hello st...[TRUNCATED 13 bytes]"},
+    }
+
+
+class _LegacyStreamingResponse(StreamingHttpResponse):
+    """Streaming response as in Django < 4.2, without is_async."""
+
+    @property
+    def streaming_content(self):
+        return map(self.make_bytes, self._iterator)
+
+    @streaming_content.setter
+    def streaming_content(self, value):
+        self._iterator = iter(value)
+
+
+@pytest.mark.django_db
+def test_response_body_tee_without_is_async(body_logger, config, request_factory):
+    """Test streaming responses without is_async (Django < 4.2) are teed."""
+    structured_logger, info = body_logger
+    config._config["LOGGING_BODY_CAPTURE_STREAMING"] = True
+    structured_logger.apply_config(config)
+    response = _LegacyStreamingResponse(iter(["abc"]), content_type="text/plain")
+    assert not hasattr(response, "is_async")
+
+    structured_logger.log_request_end(
+        request_factory.get("/test/"), response, 0.01, "cid"
+    )
+    assert info.call_args.kwargs["extra"]["event"] == "request_end"
+    assert b"".join(response.streaming_content) == b"abc"
+    assert info.call_args.kwargs["extra"]["http"] == {"response_body": "abc"}
+
+
+@pytest.mark.django_db
+def test_structlog_engine(config, request_factory):
+    """Test the structlog engine renders request events as flat JSON lines."""
+    config._config["LOGGING_ENGINE"] = "structlog"
+    structured_logger = StructuredLogger(config)
+    assert isinstance(structured_logger.logger, StructlogLogger)
+    assert structured_logger.queue_handler is None
+
+    stream = io.StringIO()
+    structured_logger.logger = StructlogLogger(level=logging.INFO, stream=stream)
+    request = request_factory.get("/test/")
+    structured_logger.log_request_end(request, HttpResponse(status=201), 0.01, "cid")
+    structured_logger.log_exception(request, ValueError("boom"), "cid")
+
+    end, exception = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert end["event"] == "request_end"
+    assert end["message"] == "Request completed"
+    assert end["correlation_id"] == "cid"
+    assert end["http"]["status_code"] == 201
+    assert end["level"] == "info"
+    assert exception["exception"] == {"type": "ValueError", "message": "boom"}
+    assert "ValueError: boom" in exception["traceback"]
+
+
+@pytest.mark.django_db
+def test_structlog_engine_injects_context_into_root_handlers(config):
+    """Test application records get request IDs under the structlog engine too."""
+    config._config["LOGGING_ENGINE"] = "structlog"
+    handler = logging.NullHandler()
+    root = logging.getLogger()
+    root.addHandler(handler)
+    try:
+        StructuredLogger(config)
+        assert any(isinstance(f, RequestContextFilter) for f in handler.filters)
+    finally:
+        root.removeHandler(handler)
+
+
+def test_structlog_logger_filters_level():
+    """Test events below the configured level are not rendered."""
+    stream = io.StringIO()
+    structlog_logger = StructlogLogger(level=logging.ERROR, stream=stream)
+
+    structlog_logger.info("skipped", extra={"event": "request_end"})
+    structlog_logger.error("kept")
+
+    assert [json.loads(line)["message"] for line in stream.getvalue().splitlines()] == [
+        "kept"
+    ]
@@ -1,9 +1,10 @@
 from unittest.mock import Mock, patch
 
 import pytest
-from django.core.cache import cache
+from django.core.cache import cache, caches
 from django.db import connection
 from django.http import HttpResponse
+from prometheus_client import Counter
 
 from django_observability.metrics import MetricsCollector
 
@@ -89,47 +90,29 @@ def test_instrument_database_error(config):
     """Test database instrumentation error handling."""
     collector = MetricsCollector(config)
 
-    mock_cursor = Mock()
-    mock_execute = Mock(side_effect=Exception("DB error"))
-    mock_cursor.execute = mock_execute
-
-    with patch("django.db.connection.cursor", return_value=mock_cursor):
-        with patch("django_observability.metrics.logger") as mock_logger:
-            collector._instrument_database()
-            cursor = connection.cursor()
-            try:
-                cursor.execute("SELECT 1")
-            except Exception:
-                pass
-            assert any(
-                "Query failed" in str(call) for call in mock_logger.error.call_args_list
-            )
-            assert "test_app_django_db_queries_total" in collector.get_metrics()
+    with patch("django_observability.metrics.logger") as mock_logger:
+        with pytest.raises(Exception):
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT * FROM missing_table")
+        assert any(
+            "Query failed" in str(call) for call in mock_logger.error.call_args_list
+        )
+    assert "test_app_http_exceptions_total" in collector.get_metrics()
 
 
 @pytest.mark.django_db
 def test_instrument_cache_error(config):
     """Test cache instrumentation error handling."""
     collector = MetricsCollector(config)
-    mock_cache = Mock()
-    mock_cache.get.side_effect = Exception("Cache error")
+    cache.delete("missing_key")
 
-    with patch("django.core.cache.caches", return_value={"default": mock_cache}):
-        with patch("django_observability.metrics.logger") as mock_logger:
-            collector._instrument_cache()
-            original_get = cache.get
-            cache.get = mock_cache.get
-            try:
-                cache.get("test_key")
-            except Exception:
-                pass
-            finally:
-                cache.get = original_get
-            assert any(
-                "Failed to record cache operation" in str(call)
-                for call in mock_logger.error.call_args_list
-            )
-            assert "test_app_django_cache_operations_total" in collector.get_metrics()
+    with pytest.raises(ValueError):
+        cache.incr("missing_key")
+
+    assert (
+        'test_app_django_cache_operations_total{cache_name="default",operation="incr",result="error"} 1.0'
+        in collector.get_metrics()
+    )
 
 
 @pytest.mark.django_db
@@ -158,7 +141,10 @@ def test_get_endpoint_label(request_factory, config):
     """Test endpoint label generation."""
     collector = MetricsCollector(config)
     request = request_factory.get("/api/users/123/")
-    assert collector._get_endpoint_label(request) == "api/users/{id}/"
+    assert collector._get_endpoint_label(request) == "api/users/<int:pk>/"
+
+    request = request_factory.get("/no/such/page-1f3a9c/")
+    assert collector._get_endpoint_label(request) == "unmatched"
 
 
 @pytest.mark.django_db
@@ -187,107 +173,146 @@ def test_instrument_database_success(config):
     """Test successful database instrumentation."""
     collector = MetricsCollector(config)
 
-    mock_cursor = Mock()
-    mock_execute = Mock(return_value="result")
-    mock_cursor.execute = mock_execute
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1")
+        assert cursor.fetchone() == (1,)
 
-    with patch("django.db.connection.cursor", return_value=mock_cursor):
-        with patch("django_observability.metrics.logger") as mock_logger:
-            with patch("time.time", side_effect=[1000.0, 1000.1]):
-                collector._instrument_database()
-                cursor = connection.cursor()
-                result = cursor.execute("SELECT 1")
-                assert result == "result"
-                debug_calls = [str(call) for call in mock_logger.debug.call_args_list]
-                assert any("Executing query" in call for call in debug_calls)
-                assert any("Query completed" in call for call in debug_calls)
-                assert "test_app_django_db_queries_total" in collector.get_metrics()
+    metrics = collector.get_metrics()
+    assert (
+        'test_app_django_db_queries_total{db_alias="default",query_type="SELECT"} 1.0'
+        in metrics
+    )
+
+
+@pytest.mark.django_db
+def test_instrument_database_executemany(config):
+    """Test executemany is recorded through the execute wrapper."""
+    collector = MetricsCollector(config)
+
+    with connection.cursor() as cursor:
+        cursor.execute("CREATE TEMP TABLE obs_items (value INTEGER)")
+        cursor.executemany("INSERT INTO obs_items VALUES (%s)", [(1,), (2,)])
+
+    assert (
+        'test_app_django_db_queries_total{db_alias="default",query_type="INSERT"} 1.0'
+        in collector.get_metrics()
+    )
+
+
+@pytest.mark.django_db
+def test_instrument_database_installed_once(request_factory, config):
+    """Test the execute wrapper is installed once, not per request."""
+    collector = MetricsCollector(config)
+    collector._instrument_database()
+    for _ in range(3):
+        collector.start_request(request_factory.get("/test/"))
+
+    assert connection.execute_wrappers.count(collector._execute_wrapper) == 1
+
+
+@pytest.mark.django_db
+def test_execute_wrapper_added_inside_user_wrapper_block(config):
+    """Test a connection created inside execute_wrapper() keeps both wrappers."""
+    collector = MetricsCollector(config)
+    connection.execute_wrappers.clear()
+
+    def user_wrapper(execute, sql, params, many, context):
+        return execute(sql, params, many, context)
+
+    with connection.execute_wrapper(user_wrapper):
+        collector._on_connection_created(sender=None, connection=connection)
+
+    assert connection.execute_wrappers == [collector._execute_wrapper]
 
 
 @pytest.mark.django_db
 def test_instrument_cache_success(config):
     """Test successful cache instrumentation."""
     collector = MetricsCollector(config)
-    mock_cache = Mock()
-    mock_cache.get.return_value = "value"
+    cache.set("test_key", "value")
 
-    with patch("django.core.cache.caches", return_value={"default": mock_cache}):
-        with patch("django_observability.metrics.logger") as mock_logger:
-            with patch("time.time", side_effect=[1000.0, 1000.1]):
-                collector._instrument_cache()
-                original_get = cache.get
-                cache.get = mock_cache.get
-                try:
-                    result = cache.get("test_key")
-                    assert result == "value"
-                    debug_calls = [
-                        str(call) for call in mock_logger.debug.call_args_list
-                    ]
-                    assert any("Cache get completed" in call for call in debug_calls)
-                    assert (
-                        "test_app_django_cache_operations_total"
-                        in collector.get_metrics()
-                    )
-                finally:
-                    cache.get = original_get
+    assert cache.get("test_key") == "value"
+    assert cache.get("other_key") is None
+
+    metrics = collector.get_metrics()
+    assert (
+        'test_app_django_cache_operations_total{cache_name="default",operation="get",result="hit"} 1.0'
+        in metrics
+    )
+    assert (
+        'test_app_django_cache_operations_total{cache_name="default",operation="get",result="miss"} 1.0'
+        in metrics
+    )
+    assert (
+        'test_app_django_cache_operation_duration_seconds_count{cache_name="default",operation="get"} 2.0'
+        in metrics
+    )
 
 
 @pytest.mark.django_db
 def test_instrument_cache_get_many(config):
-    """Test cache get_many instrumentation."""
+    """Test cache get_many instrumentation counts hits and misses per key."""
     collector = MetricsCollector(config)
-    mock_cache = Mock()
-    mock_cache.get_many.return_value = {"key1": "value1", "key2": "value2"}
+    cache.set_many({"key1": "value1", "key2": "value2"})
 
-    with patch("django.core.cache.caches", return_value={"default": mock_cache}):
-        with patch("django_observability.metrics.logger") as mock_logger:
-            with patch("time.time", side_effect=[1000.0, 1000.1]):
-                collector._instrument_cache()
-                original_get_many = cache.get_many
-                cache.get_many = mock_cache.get_many
-                try:
-                    result = cache.get_many(["key1", "key2"])
-                    assert result == {"key1": "value1", "key2": "value2"}
-                    debug_calls = [
-                        str(call) for call in mock_logger.debug.call_args_list
-                    ]
-                    assert any(
-                        "Cache get_many completed" in call for call in debug_calls
-                    )
-                    assert (
-                        "test_app_django_cache_operations_total"
-                        in collector.get_metrics()
-                    )
-                finally:
-                    cache.get_many = original_get_many
+    result = cache.get_many(["key1", "key2", "key3"])
+    assert result == {"key1": "value1", "key2": "value2"}
+
+    metrics = collector.get_metrics()
+    assert (
+        'test_app_django_cache_operations_total{cache_name="default",operation="get_many",result="hit"} 2.0'
+        in metrics
+    )
+    assert (
+        'test_app_django_cache_operations_total{cache_name="default",operation="get_many",result="miss"} 1.0'
+        in metrics
+    )
+    # BaseCache.get_many delegates to get(); nested calls are not double counted
+    assert 'operation="get",' not in metrics
 
 
 @pytest.mark.django_db
 def test_instrument_cache_set(config):
-    """Test cache set instrumentation."""
+    """Test cache write operations are instrumented."""
     collector = MetricsCollector(config)
-    mock_cache = Mock()
-    mock_cache.set.return_value = None
 
-    with patch("django.core.cache.caches", return_value={"default": mock_cache}):
-        with patch("django_observability.metrics.logger") as mock_logger:
-            with patch("time.time", side_effect=[1000.0, 1000.1]):
-                collector._instrument_cache()
-                original_set = cache.set
-                cache.set = mock_cache.set
-                try:
-                    result = cache.set("test_key", "test_value")
-                    assert result is None
-                    debug_calls = [
-                        str(call) for call in mock_logger.debug.call_args_list
-                    ]
-                    assert any("Cache set completed" in call for call in debug_calls)
-                    assert (
-                        "test_app_django_cache_operations_total"
-                        in collector.get_metrics()
-                    )
-                finally:
-                    cache.set = original_set
+    assert cache.set("test_key", "test_value") is None
+    cache.add("test_key", "other")
+    cache.touch("test_key")
+    cache.delete("test_key")
+
+    metrics = collector.get_metrics()
+    for operation in ("set", "add", "touch", "delete"):
+        assert (
+            f'test_app_django_cache_operations_total{{cache_name="default",operation="{operation}",result="success"}} 1.0'
+            in metrics
+        )
+
+
+@pytest.mark.django_db
+def test_instrument_cache_installed_once(config):
+    """Test cache backends are wrapped once, not per call."""
+    collector = MetricsCollector(config)
+    wrapped_get = cache.get
+    collector._instrument_cache()
+    collector._instrument_cache_backend("default", caches["default"])
+
+    assert caches["default"].get is wrapped_get
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db
+async def test_instrument_cache_async(config):
+    """Test async cache calls are recorded once."""
+    collector = MetricsCollector(config)
+    await cache.aset("async_key", "value")
+
+    assert await cache.aget("async_key") == "value"
+    metrics = collector.get_metrics()
+    assert (
+        'test_app_django_cache_operations_total{cache_name="default",operation="get",result="hit"} 1.0'
+        in metrics
+    )
 
 
 @pytest.mark.django_db
@@ -371,3 +396,214 @@ def test_record_request_duration_error(config, request_factory):
                 "Failed to record request duration" in str(call)
                 for call in mock_logger.error.call_args_list
             )
+
+
+@pytest.mark.django_db
+def test_request_children_cached(config):
+    """Test metric children are resolved once per label tuple."""
+    collector = MetricsCollector(config)
+    labels = ("GET", "test_view", "200", "test_view")
+
+    children = collector._get_request_children(*labels)
+    assert collector._get_request_children(*labels) is children
+    assert children.requests_total is collector.http_requests_total.labels(*labels)
+
+
+@pytest.mark.django_db
+def test_request_children_cache_bounded(config):
+    """Test the child cache never grows past its configured size."""
+    collector = MetricsCollector(config)
+    collector._child_cache_size = 4
+
+    for status in range(10):
+        collector._get_request_children("GET", "test_view", str(status), "test_view")
+
+    assert len(collector._request_children) <= 4
+
+
+@pytest.mark.django_db
+def test_request_metrics_overflow(config):
+    """Test new label sets fold into the overflow series past the budget."""
+    config._config["METRICS_CARDINALITY_LIMIT"] = 2
+    collector = MetricsCollector(config)
+
+    for endpoint in ("a/", "b/", "c/", "d/"):
+        collector._get_request_children(
+            "GET", endpoint, "200", "view"
+        ).requests_total.inc()
+
+    metrics = collector.get_metrics()
+    assert 'endpoint="a/"' in metrics
+    assert 'endpoint="c/"' not in metrics
+    assert (
+        'test_app_http_requests_total{endpoint="__overflow__",method="GET",status="200",view_name="__overflow__"} 2.0'
+        in metrics
+    )
+    assert (
+        'test_app_metrics_label_sets_rejected_total{metric="test_app_http_requests"} 2.0'
+        in metrics
+    )
+
+
+@pytest.mark.django_db
+def test_rejected_label_sets_counted_once(config):
+    """Test a repeated over-budget label set is counted once and cached."""
+    config._config["METRICS_CARDINALITY_LIMIT"] = 1
+    collector = MetricsCollector(config)
+    collector._get_request_children("GET", "a/", "200", "view")
+
+    first = collector._get_request_children("GET", "b/", "200", "view")
+    with patch.object(collector._request_limiter, "_lock") as lock:
+        assert collector._get_request_children("GET", "b/", "200", "view") is first
+        assert collector._request_limiter.admit(("GET", "b/", "200", "view")) == (
+            "GET",
+            "__overflow__",
+            "200",
+            "__overflow__",
+        )
+        lock.__enter__.assert_not_called()
+
+    assert ("GET", "b/", "200", "view") in collector._request_limiter._overflowed
+    assert (
+        'test_app_metrics_label_sets_rejected_total{metric="test_app_http_requests"} 1.0'
+        in collector.get_metrics()
+    )
+
+
+@pytest.mark.django_db
+def test_custom_counter_cardinality_budget(config):
+    """Test custom labelled metrics are bounded too."""
+    config._config["METRICS_CARDINALITY_LIMIT"] = 1
+    collector = MetricsCollector(config)
+    counter = collector.create_custom_counter("budget", "Budget counter", ["user"])
+
+    assert isinstance(counter, Counter)
+
+    counter.labels(user="alice").inc()
+    counter.labels(user="bob").inc()
+
+    metrics = collector.get_metrics()
+    assert 'test_app_budget_total{user="alice"} 1.0' in metrics
+    assert 'test_app_budget_total{user="__overflow__"} 1.0' in metrics
+
+
+@pytest.mark.django_db
+def test_cardinality_ttl_eviction(config):
+    """Test stale label sets are evicted and their series removed."""
+    config._config["METRICS_CARDINALITY_TTL"] = 60
+    collector = MetricsCollector(config)
+
+    with patch("django_observability.cardinality.time.monotonic", return_value=0.0):
+        collector._request_limiter._next_eviction = 60.0
+        collector._get_request_children(
+            "GET", "old/", "200", "view"
+        ).requests_total.inc()
+    with patch("django_observability.cardinality.time.monotonic", return_value=100.0):
+        collector._get_request_children(
+            "GET", "new/", "200", "view"
+        ).requests_total.inc()
+
+    metrics = collector.get_metrics()
+    assert 'endpoint="old/"' not in metrics
+    assert 'endpoint="new/"' in metrics
+    assert len(collector._request_limiter) == 1
+
+
+@pytest.mark.django_db
+def test_cardinality_ttl_eviction_keeps_shared_series(config):
+    """Test eviction keeps series still shared with a live label set."""
+    config._config["METRICS_CARDINALITY_TTL"] = 60
+    collector = MetricsCollector(config)
+
+    with patch("django_observability.cardinality.time.monotonic", return_value=0.0):
+        collector._request_limiter._next_eviction = 60.0
+        for status in ("200", "500"):
+            collector._get_request_children(
+                "GET", "old/", status, "view"
+            ).request_size.observe(10)
+    with patch("django_observability.cardinality.time.monotonic", return_value=50.0):
+        collector._get_request_children("GET", "old/", "500", "view")
+    with patch("django_observability.cardinality.time.monotonic", return_value=100.0):
+        collector._get_request_children("GET", "new/", "200", "view")
+
+    assert len(collector._request_limiter) == 2
+    metrics = collector.get_metrics()
+    assert (
+        'test_app_http_request_size_bytes_count{endpoint="old/",method="GET"} 2.0'
+        in metrics
+    )
+
+
+@pytest.mark.django_db
+def test_instrument_span_processor(config):
+    """Test span processor callbacks feed the span export metrics."""
+    collector = MetricsCollector(config)
+    processor = Mock()
+
+    collector.instrument_span_processor(processor)
+    processor.on_drop()
+    processor.on_export(0.02, 3, True, 5)
+    processor.on_export(0.5, 2, False, 0)
+
+    metrics = collector.get_metrics()
+    assert "test_app_tracing_spans_dropped_total 1.0" in metrics
+    assert 'test_app_tracing_spans_exported_total{result="success"} 3.0' in metrics
+    assert 'test_app_tracing_spans_exported_total{result="failure"} 2.0' in metrics
+    assert "test_app_tracing_span_export_duration_seconds_count 2.0" in metrics
+    assert "test_app_tracing_span_queue_size 0.0" in metrics
+
+
+@pytest.fixture
+def multiprocess_dir(tmp_path, monkeypatch):
+    """Enable prometheus_client multiprocess mode backed by a temp directory."""
+    from prometheus_client import values
+
+    monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+    monkeypatch.setattr(values, "ValueClass", values.MultiProcessValue())
+    return tmp_path
+
+
+@pytest.mark.django_db
+def test_multiprocess_metrics_aggregated(config, multiprocess_dir):
+    """Test multiprocess mode exposes values aggregated from the shared files."""
+    collector = MetricsCollector(config)
+    assert collector.multiprocess
+
+    collector.django_active_requests.inc()
+    collector._get_request_children(
+        "GET", "test/", "200", "test_view"
+    ).requests_total.inc()
+
+    metrics = collector.get_metrics()
+    assert "test_app_django_active_requests 1.0" in metrics
+    assert (
+        'test_app_http_requests_total{endpoint="test/",method="GET",status="200",view_name="test_view"} 1.0'
+        in metrics
+    )
+    assert list(multiprocess_dir.glob("gauge_livesum_*.db"))
+
+
+@pytest.mark.django_db
+def test_mark_process_dead_removes_live_gauges(config, multiprocess_dir):
+    """Test worker exit cleanup drops the worker's live gauge files."""
+    import os
+
+    from django_observability.metrics import child_exit
+
+    collector = MetricsCollector(config)
+    collector.django_active_requests.inc()
+
+    child_exit(None, Mock(pid=os.getpid()))
+
+    assert not list(multiprocess_dir.glob("gauge_livesum_*.db"))
+
+
+@pytest.mark.django_db
+def test_multiprocess_requires_directory(config, monkeypatch):
+    """Test METRICS_MULTIPROCESS without a directory falls back to per-process."""
+    monkeypatch.delenv("PROMETHEUS_MULTIPROC_DIR", raising=False)
+    monkeypatch.delenv("prometheus_multiproc_dir", raising=False)
+    config._config["METRICS_MULTIPROCESS"] = True
+
+    collector = MetricsCollector(config)
+    assert not collector.multiprocess
@@ -0,0 +1,106 @@
+from unittest.mock import Mock, PropertyMock, patch
+
+import pytest
+from django.http import HttpResponse
+from django.urls import resolve
+
+from django_observability.middleware import ObservabilityMiddleware
+from django_observability.observation import (
+    ObservationSink,
+    RequestObservation,
+    get_observation,
+)
+
+
+def test_observation_computes_fields_once(request_factory):
+    """Test derived fields are computed lazily and at most once."""
+    request = request_factory.get("/test/", HTTP_USER_AGENT="pytest")
+    observation = RequestObservation(request, "cid")
+
+    with patch(
+        "django_observability.observation.get_view_name", return_value="test_view"
+    ) as mock_view_name:
+        assert observation.view_name == "test_view"
+        assert observation.view_name == "test_view"
+        assert mock_view_name.call_count == 1
+
+    assert observation.user_agent == "pytest"
+    assert observation.url == "http://testserver/test/"
+
+
+def test_observation_resolves_like_django(request_factory):
+    """Test early resolution ignores SCRIPT_NAME and honours request.urlconf."""
+    request = request_factory.get("/api/users/42/", SCRIPT_NAME="/app")
+    assert request.path == "/app/api/users/42/"
+    observation = RequestObservation(request, "cid")
+    assert observation.view_name == "user_detail"
+    assert observation.endpoint == "api/users/<int:pk>/"
+
+    request = request_factory.get("/test/")
+    request.urlconf = "tests.no_such_urlconf"
+    observation = RequestObservation(request, "cid")
+    assert observation.view_name == "unknown"
+    assert observation.endpoint == "unmatched"
+
+
+def test_observation_prefers_djangos_resolver_match(request_factory):
+    """Test labels follow Django's resolver_match once it is set."""
+    request = request_factory.get("/test/")
+    observation = RequestObservation(request, "cid")
+    assert observation.view_name == "test_view"
+
+    request.resolver_match = resolve("/api/users/42/", "tests.urls")
+    assert observation.view_name == "user_detail"
+    assert observation.endpoint == "api/users/<int:pk>/"
+
+
+def test_observation_response_size(request_factory):
+    """Test response size is tied to the attached response."""
+    observation = RequestObservation(request_factory.get("/test/"))
+    assert observation.response_size == 0
+    assert observation.status_code is None
+
+    observation.finish(HttpResponse(content=b"12345"), 0.1)
+    assert observation.response_size == 5
+    assert observation.status_code == 200
+
+
+def test_get_observation_reuses_instance(request_factory):
+    """Test get_observation attaches a single observation per request."""
+    request = request_factory.get("/test/")
+    observation = get_observation(request, "cid")
+    assert get_observation(request) is observation
+    assert observation.correlation_id == "cid"
+
+
+@pytest.mark.django_db
+def test_middleware_dispatches_to_sinks(request_factory, config):
+    """Test the middleware hands one observation to every sink."""
+
+    def get_response(request):
+        return HttpResponse(status=200)
+
+    middleware = ObservabilityMiddleware(get_response, config=config)
+    sink = Mock(spec=ObservationSink)
+    middleware.sinks = [sink]
+    request = request_factory.get("/test/")
+
+    middleware.process_request(request)
+    middleware.process_response(request, HttpResponse(status=200))
+
+    started = sink.request_started.call_args.args[0]
+    finished = sink.request_finished.call_args.args[0]
+    assert started is finished is request.observability_observation
+    assert finished.status_code == 200
+
+
+def test_observation_response_size_prefers_content_length(request_factory):
+    """Test the Content-Length header is used instead of measuring the body."""
+    observation = RequestObservation(request_factory.get("/test/"))
+    response = HttpResponse(content=b"12345")
+    response["Content-Length"] = "5"
+    observation.finish(response, 0.1)
+
+    with patch.object(HttpResponse, "content", new_callable=PropertyMock) as content:
+        assert observation.response_size == 5
+    content.assert_not_called()
@@ -0,0 +1,180 @@
+import logging
+from types import SimpleNamespace
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from django.http import HttpResponse
+from django.urls import resolve
+from opentelemetry.sdk.trace.sampling import ALWAYS_OFF, Decision
+
+from django_observability.logging import StructuredLogger
+from django_observability.metrics import MetricsCollector
+from django_observability.middleware import ObservabilityMiddleware
+from django_observability.observation import RequestObservation
+from django_observability.policies import DEFAULT_POLICY, RoutePolicyTable
+from django_observability.sampling import POLICY_RATE_ATTRIBUTE, RoutePolicySampler
+from django_observability.tracing import TracingManager
+
+
+def _observation(view_name, endpoint):
+    return SimpleNamespace(view_name=view_name, endpoint=endpoint)
+
+
+def test_policy_table_matches_url_name_then_longest_prefix():
+    """Test URL names win over prefixes, and the longest prefix wins."""
+    table = RoutePolicyTable(
+        {
+            "checkout": {"trace_sample_rate": 1.0},
+            "/api/": {"log_level": "warning"},
+            "/api/bulk/": {"histogram_buckets": [1, 5, 30]},
+        }
+    )
+
+    policy = table.resolve(_observation("shop:checkout", "api/bulk/checkout/"))
+    assert policy.name == "checkout"
+    assert policy.trace_sample_rate == 1.0
+
+    policy = table.resolve(_observation("bulk_import", "api/bulk/<int:pk>/"))
+    assert policy.name == "/api/bulk/"
+    assert policy.histogram_buckets == (1.0, 5.0, 30.0)
+
+    assert table.resolve(_observation("users", "api/users/")).log_level == (
+        logging.WARNING
+    )
+    assert table.resolve(_observation("home", "")) is DEFAULT_POLICY
+    assert RoutePolicyTable().resolve(None) is DEFAULT_POLICY
+
+
+@pytest.mark.parametrize(
+    "settings",
+    [
+        {"sample_rate": 0.5},
+        {"trace_sample_rate": 1.5},
+        {"log_level": "LOUD"},
+        {"histogram_buckets": ["fast"]},
+        "exclude",
+    ],
+)
+def test_policy_table_rejects_invalid_policies(settings):
+    """Test invalid ROUTE_POLICIES entries are rejected."""
+    with pytest.raises(ImproperlyConfigured):
+        RoutePolicyTable({"checkout": settings})
+
+
+def test_policy_table_rejects_colliding_histogram_names():
+    """Test policies whose histograms would share a metric name are rejected."""
+    with pytest.raises(ImproperlyConfigured, match="api_bulk"):
+        RoutePolicyTable(
+            {
+                "/api/bulk/": {"histogram_buckets": [1, 5]},
+                "api_bulk": {"histogram_buckets": [1, 30]},
+            }
+        )
+    with pytest.raises(ImproperlyConfigured):
+        RoutePolicyTable({"/": {"histogram_buckets": [1]}})
+    # Without buckets no histogram is created, so the names may collide
+    RoutePolicyTable({"/api/bulk/": {"log_body": False}, "api_bulk": {}})
+
+
+@pytest.mark.django_db
+def test_middleware_skips_excluded_routes(config, request_factory):
+    """Test requests matching an excluded policy are not observed."""
+    config._config["ROUTE_POLICIES"] = {"user_detail": {"exclude": True}}
+    middleware = ObservabilityMiddleware(lambda request: HttpResponse(), config=config)
+    request = request_factory.get("/api/users/42/")
+    request.resolver_match = resolve("/api/users/42/", "tests.urls")
+
+    assert middleware.process_request(request) is None
+    assert not hasattr(request, "observability_observation")
+    middleware.tracing_manager.shutdown()
+
+
+@pytest.mark.django_db
+def test_structured_logger_applies_route_policy(config, request_factory, mocker):
+    """Test a policy's log_level suppresses records and log_body overrides."""
+    config._config["ROUTE_POLICIES"] = {
+        "quiet": {"log_level": "WARNING"},
+        "upload": {"log_body": True},
+    }
+    table = RoutePolicyTable.from_config(config)
+    structured_logger = StructuredLogger(config)
+    info = mocker.patch.object(structured_logger.logger, "info")
+
+    request = request_factory.post(
+        "/test/", data='{"a": 1}', content_type="application/json"
+    )
+    request.body  # already loaded by the view
+    observation = RequestObservation(request, "cid")
+    request.observability_observation = observation
+
+    observation.policy = table.resolve(_observation("quiet", "test/"))
+    structured_logger.request_started(observation)
+    info.assert_not_called()
+
+    observation.policy = table.resolve(_observation("upload", "test/"))
+    structured_logger.request_started(observation)
+    assert info.call_args.kwargs["extra"]["http"]["body"] == '{"a": 1}'
+
+
+def test_route_policy_sampler():
+    """Test policy rates override the root sampler and are not kept on spans."""
+    sampler = RoutePolicySampler(ALWAYS_OFF)
+    attributes = {POLICY_RATE_ATTRIBUTE: 1.0, "http.endpoint": "checkout/"}
+
+    result = sampler.should_sample(None, 1, "request", attributes=attributes)
+    assert result.decision == Decision.RECORD_AND_SAMPLE
+    assert dict(result.attributes) == {"http.endpoint": "checkout/"}
+
+    attributes[POLICY_RATE_ATTRIBUTE] = 0.0
+    result = sampler.should_sample(None, 1, "request", attributes=attributes)
+    assert result.decision == Decision.DROP
+
+    result = sampler.should_sample(None, 1, "request", attributes={})
+    assert result.decision == Decision.DROP
+
+
+@pytest.mark.django_db
+def test_policy_histogram_buckets(config, request_factory):
+    """Test a policy with buckets also records durations into its own histogram."""
+    config._config["ROUTE_POLICIES"] = {"/api/bulk/": {"histogram_buckets": [1, 30]}}
+    collector = MetricsCollector(config)
+    request = request_factory.get("/api/bulk/")
+    observation = RequestObservation(request, "cid")
+    observation.policy = RoutePolicyTable.from_config(config).resolve(
+        _observation("bulk", "api/bulk/")
+    )
+    request.observability_observation = observation
+
+    collector.record_request_duration(request, HttpResponse(), 12.0)
+
+    metrics = collector.get_metrics()
+    assert "test_app_http_request_duration_api_bulk_seconds_bucket{" in metrics
+    assert 'le="30.0"' in metrics
+    assert (
+        'test_app_http_request_duration_seconds_count{endpoint="unmatched",'
+        'method="GET",status="200",view_name="unknown"} 1.0'
+    ) in metrics
+
+
+@pytest.mark.django_db
+def test_tracing_wraps_root_sampler_for_policy_rates(config):
+    """Test policy rates reach the root sampler unless tail sampling is on."""
+    config._config["ROUTE_POLICIES"] = {"checkout": {"trace_sample_rate": 1.0}}
+    tracing_manager = TracingManager(config)
+    assert isinstance(tracing_manager.sampling.sampler._root, RoutePolicySampler)
+
+    observation = SimpleNamespace(
+        endpoint="checkout/",
+        policy=RoutePolicyTable.from_config(config).resolve(
+            _observation("checkout", "checkout/")
+        ),
+    )
+    assert tracing_manager._get_start_attributes(observation) == {
+        POLICY_RATE_ATTRIBUTE: 1.0
+    }
+
+    tracing_manager.tail_sampling = True
+    sampling = tracing_manager._create_sampling(config)
+    assert not isinstance(sampling.sampler._root, RoutePolicySampler)
+    assert tracing_manager._get_start_attributes(observation) is None
+    tracing_manager.shutdown()
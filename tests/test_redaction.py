@@ -0,0 +1,153 @@
+import json
+
+import pytest
+from django.http import HttpResponse
+
+from django_observability.logging import StructuredLogger
+from django_observability.redaction import (
+    BEARER_TOKEN_PATTERN,
+    CARD_NUMBER_PATTERN,
+    REDACTED,
+    Redactor,
+)
+
+
+@pytest.fixture
+def redactor():
+    """Create a redactor with header, value and body rules."""
+    return Redactor(
+        headers=["Authorization", "x-api-key", "content-type"],
+        value_patterns=[BEARER_TOKEN_PATTERN, CARD_NUMBER_PATTERN],
+        body_keys=["password", "card.number", "items.*.token"],
+    )
+
+
+def test_redact_meta_only_includes_headers(redactor):
+    """Test only HTTP_* keys are logged and sensitive ones are redacted."""
+    meta = {
+        "HTTP_AUTHORIZATION": "Basic abc",
+        "HTTP_X_API_KEY": "key",
+        "HTTP_ACCEPT": "text/html",
+        "CONTENT_TYPE": "application/json",
+        "CONTENT_LENGTH": "10",
+        "REMOTE_ADDR": "127.0.0.1",
+        "wsgi.input": object(),
+    }
+
+    assert redactor.redact_meta(meta) == {
+        "HTTP_AUTHORIZATION": REDACTED,
+        "HTTP_X_API_KEY": REDACTED,
+        "HTTP_ACCEPT": "text/html",
+        "CONTENT_TYPE": REDACTED,
+        "CONTENT_LENGTH": "10",
+    }
+
+
+def test_redact_value_patterns(redactor):
+    """Test secrets are redacted inside otherwise harmless values."""
+    headers = redactor.redact_headers(
+        {
+            "X-Forwarded-Auth": "Bearer eyJhbGciOi.abc.def",
+            "X-Note": "card 4111 1111 1111 1111 ok",
+            "Authorization": "anything",
+        }
+    )
+
+    assert headers == {
+        "X-Forwarded-Auth": REDACTED,
+        "X-Note": f"card {REDACTED} ok",
+        "Authorization": REDACTED,
+    }
+
+
+def test_redact_json_body(redactor):
+    """Test key names are redacted at any depth and paths from the root."""
+    body = json.dumps(
+        {
+            "user": {"name": "alice", "password": "hunter2"},
+            "card": {"number": "x", "expiry": "12/30"},
+            "items": [{"token": "a", "id": 1}, {"token": "b", "id": 2}],
+            "number": "kept",
+        }
+    )
+
+    assert json.loads(redactor.redact_body(body, is_json=True)) == {
+        "user": {"name": "alice", "password": REDACTED},
+        "card": {"number": REDACTED, "expiry": "12/30"},
+        "items": [{"token": REDACTED, "id": 1}, {"token": REDACTED, "id": 2}],
+        "number": "kept",
+    }
+
+
+def test_redact_truncated_json_body(redactor):
+    """Test bodies that cannot be parsed fall back to textual redaction."""
+    body = '{"password": "hun\\"ter2", "name": "al'
+
+    assert redactor.redact_body(body, is_json=True) == (
+        f'{{"password": "{REDACTED}", "name": "al'
+    )
+    assert redactor.redact_body('{"password": "x"}') == '{"password": "x"}'
+
+
+def test_redact_card_numbers_passing_luhn_only(redactor):
+    """Test digit runs that fail the Luhn check, like timestamps, are kept."""
+    assert redactor.redact_value("card 5500-0000-0000-0004") == f"card {REDACTED}"
+    assert redactor.redact_value("ts 1700000000000 ok") == "ts 1700000000000 ok"
+    assert redactor.redact_value("card 4111 1111 1111 1112") == (
+        "card 4111 1111 1111 1112"
+    )
+    assert redactor.redact_value("Bearer abc 4111111111111111") == (
+        f"{REDACTED} {REDACTED}"
+    )
+
+
+@pytest.mark.parametrize(
+    "body, expected",
+    [
+        ('{"number": 4111, "name": "al', '{"number": "%s", "name": "al'),
+        ('{"number": -1.5e3, "x": [', '{"number": "%s", "x": ['),
+        (
+            '{"token": null, "password": true, "n',
+            '{"token": "%s", "password": "%s", "n',
+        ),
+        ('{"password": false, "a": 1', '{"password": "%s", "a": 1'),
+        ('{"name": "al", "password": "hunt', '{"name": "al", "password": "%s"'),
+    ],
+)
+def test_redact_truncated_json_body_non_string_values(redactor, body, expected):
+    """Test the textual fallback redacts numbers, literals and cut-off strings."""
+    expected = expected.replace("%s", REDACTED)
+    assert redactor.redact_body(body, is_json=True) == expected
+
+
+@pytest.mark.django_db
+def test_structured_logger_redacts_bodies(config, request_factory, mocker):
+    """Test the structured logger redacts headers and captured bodies."""
+    config._config["LOGGING_INCLUDE_BODY"] = True
+    config._config["LOGGING_INCLUDE_HEADERS"] = True
+    config._config["LOGGING_REDACT_PATTERNS"] = [BEARER_TOKEN_PATTERN]
+    structured_logger = StructuredLogger(config)
+    info = mocker.patch.object(structured_logger.logger, "info")
+    request = request_factory.post(
+        "/test/",
+        data='{"username": "alice", "password": "hunter2"}',
+        content_type="application/json",
+        HTTP_AUTHORIZATION="Bearer abc",
+        HTTP_X_DEBUG="Bearer abc",
+    )
+    request.body
+
+    structured_logger.log_request_start(request, "cid")
+    http = info.call_args.kwargs["extra"]["http"]
+    assert http["headers"]["HTTP_AUTHORIZATION"] == REDACTED
+    assert http["headers"]["HTTP_X_DEBUG"] == REDACTED
+    assert "REMOTE_ADDR" not in http["headers"]
+    assert json.loads(http["body"]) == {"username": "alice", "password": REDACTED}
+
+    response = HttpResponse(
+        '{"token": "abc"}', content_type="application/json", headers={"X-Key": "v"}
+    )
+    structured_logger.log_request_end(request, response, 0.01, "cid")
+    http = info.call_args.kwargs["extra"]["http"]
+    assert json.loads(http["response_body"]) == {"token": REDACTED}
+    assert http["response_headers"]["X-Key"] == "v"
@@ -0,0 +1,150 @@
+import json
+import logging
+import os
+import signal
+
+import pytest
+from django.http import HttpResponse
+
+from django_observability import config as config_module
+from django_observability.middleware import ObservabilityMiddleware
+from django_observability.reload import ConfigReloader, reload_view
+
+
+@pytest.fixture
+def reload_file(tmp_path, monkeypatch):
+    """Return a helper writing the reload file; the global config is restored."""
+    monkeypatch.setattr(config_module, "config", config_module.config)
+    path = tmp_path / "observability.json"
+
+    def write(overrides, mtime=None):
+        path.write_text(json.dumps(overrides))
+        if mtime is not None:
+            os.utime(path, (mtime, mtime))
+        return str(path)
+
+    return write
+
+
+@pytest.fixture
+def middleware(config):
+    """Create a sync middleware registered with its own reloader."""
+    middleware = ObservabilityMiddleware(lambda request: HttpResponse(), config=config)
+    reloader = ConfigReloader()
+    reloader.register(middleware)
+    yield middleware, reloader
+    middleware.tracing_manager.shutdown()
+
+
+@pytest.mark.django_db
+def test_reload_swaps_settings(middleware, reload_file):
+    """Test a reload swaps new settings into the middleware, sampler and logger."""
+    middleware, reloader = middleware
+    reloader.path = reload_file(
+        {
+            "EXCLUDE_PATHS": ["/test/"],
+            "TRACING_SAMPLE_RATE": 0.5,
+            "LOGGING_LEVEL": "WARNING",
+            "LOGGING_SAMPLE_RATE": 0.25,
+        }
+    )
+    old_snapshot = middleware.snapshot
+
+    new_config = reloader.reload()
+
+    assert new_config is config_module.get_config()
+    assert middleware.config is new_config
+    assert middleware.snapshot.is_excluded("/test/")
+    assert not old_snapshot.is_excluded("/test/")
+    tracing_manager = middleware.tracing_manager
+    assert tracing_manager.sampler.delegate is tracing_manager.sampling.sampler
+    assert tracing_manager.sampler.delegate._root.rate == 0.5
+    structured_logger = middleware.structured_logger
+    assert structured_logger.sampler.rate == 0.25
+    assert structured_logger.sampler.on_sampled_out is not None
+    assert logging.getLogger("django_observability").level == logging.WARNING
+    assert reloader.reload_count == 1
+
+
+@pytest.mark.django_db
+def test_reload_rejects_invalid_config(middleware, reload_file):
+    """Test an invalid reload file keeps the current settings."""
+    middleware, reloader = middleware
+    snapshot = middleware.snapshot
+
+    reloader.path = reload_file({"TRACING_SAMPLE_RATE": 2.0})
+    assert reloader.reload() is None
+
+    reloader.path = reload_file(["not", "an", "object"])
+    assert reloader.reload() is None
+
+    assert middleware.snapshot is snapshot
+    assert reloader.reload_count == 0
+
+
+@pytest.mark.django_db
+def test_check_applies_signal_and_file_changes(middleware, reload_file):
+    """Test SIGHUP and reload file changes are applied by the next check."""
+    middleware, reloader = middleware
+    reloader.path = reload_file({"ADD_CORRELATION_HEADER": True}, mtime=1000)
+    reloader.interval = 0.0
+    reloader._mtime = reloader._get_mtime()
+
+    reloader.check()
+    assert reloader.reload_count == 0
+
+    previous = signal.getsignal(signal.SIGHUP)
+    try:
+        reloader.install_signal_handler()
+        os.kill(os.getpid(), signal.SIGHUP)
+    finally:
+        signal.signal(signal.SIGHUP, previous)
+    reloader.check()
+    assert reloader.reload_count == 1
+    assert middleware.snapshot.add_correlation_header
+
+    reload_file({"ADD_CORRELATION_HEADER": False}, mtime=2000)
+    reloader.check()
+    reloader.check()
+    assert reloader.reload_count == 2
+    assert not middleware.snapshot.add_correlation_header
+
+
+@pytest.mark.django_db
+def test_reload_view_requires_token(config, request_factory, reload_file):
+    """Test the reload endpoint is disabled without a token and checks it."""
+    config_module.config = config
+    assert reload_view(request_factory.post("/reload/")).status_code == 404
+
+    config._config["CONFIG_RELOAD_TOKEN"] = "s3cret"
+    assert reload_view(request_factory.get("/reload/")).status_code == 405
+    response = reload_view(
+        request_factory.post("/reload/", HTTP_X_OBSERVABILITY_RELOAD_TOKEN="wrong")
+    )
+    assert response.status_code == 403
+
+    response = reload_view(
+        request_factory.post("/reload/", HTTP_X_OBSERVABILITY_RELOAD_TOKEN="s3cret")
+    )
+    assert response.status_code == 200
+    assert json.loads(response.content)["reloaded"] is True
+
+
+@pytest.mark.django_db
+def test_request_keeps_settings_across_reload(middleware, reload_file, request_factory):
+    """Test a request in flight keeps the settings it started with."""
+    middleware, reloader = middleware
+    structured_logger = middleware.structured_logger
+    old_settings = structured_logger.settings
+    request = request_factory.get("/test/")
+    middleware.process_request(request)
+    observation = request.observability_observation
+
+    reloader.path = reload_file({"ADD_CORRELATION_HEADER": True})
+    reloader.reload()
+    response = middleware.process_response(request, HttpResponse())
+
+    assert structured_logger.settings is not old_settings
+    assert observation.log_settings is old_settings
+    assert observation.snapshot is not middleware.snapshot
+    assert "X-Correlation-ID" not in response
@@ -0,0 +1,45 @@
+from django.urls import resolve
+
+from django_observability.routes import (
+    UNMATCHED_ENDPOINT,
+    RouteCatalog,
+    normalize_route,
+)
+from django_observability.utils import get_endpoint_label
+
+
+def test_route_catalog_walks_nested_patterns():
+    """Test the catalog collects full routes across includes."""
+    catalog = RouteCatalog("tests.urls")
+    assert catalog.labels["test/"] == "test/"
+    assert catalog.labels["api/users/<int:pk>/"] == "api/users/<int:pk>/"
+    assert catalog.labels["api/files/(?P<name>[\\w-]+)/$"] == (
+        "api/files/(?P<name>[\\w-]+)/"
+    )
+
+
+def test_route_catalog_label_for_resolver_match():
+    """Test labels come from the resolved route, not the raw path."""
+    catalog = RouteCatalog("tests.urls")
+    assert catalog.label_for(resolve("/api/users/42/", "tests.urls")) == (
+        "api/users/<int:pk>/"
+    )
+    assert catalog.label_for(resolve("/api/files/a-b/", "tests.urls")) == (
+        "api/files/(?P<name>[\\w-]+)/"
+    )
+    assert catalog.label_for(None) == UNMATCHED_ENDPOINT
+
+
+def test_normalize_route():
+    """Test regex anchors are stripped and the root route is named."""
+    assert normalize_route("^api/$") == "api/"
+    assert normalize_route("") == "/"
+
+
+def test_endpoint_label_under_script_name(request_factory):
+    """Test requests under a SCRIPT_NAME prefix resolve on their path_info."""
+    request = request_factory.get("/api/users/42/", SCRIPT_NAME="/app")
+    assert get_endpoint_label(request) == "api/users/<int:pk>/"
+
+    request = request_factory.get("/no/such/page/", SCRIPT_NAME="/app")
+    assert get_endpoint_label(request) == UNMATCHED_ENDPOINT
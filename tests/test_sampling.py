@@ -0,0 +1,157 @@
+from unittest.mock import patch
+
+import pytest
+from opentelemetry import trace
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+    InMemorySpanExporter,
+)
+from opentelemetry.sdk.trace.sampling import ALWAYS_ON, Decision
+
+from django_observability.sampling import (
+    ROUTE_ATTRIBUTE,
+    AdaptiveRouteSampler,
+    TailSamplingSpanProcessor,
+    allocate_budget,
+)
+from django_observability.tracing import TracingManager
+
+
+def test_allocate_budget_fair_share():
+    """Test quiet routes are fully sampled and busy routes share the rest."""
+    probabilities = allocate_budget(
+        {"health/": 1000.0, "orders/": 90.0, "reports/": 2.0}, budget=100.0
+    )
+
+    assert probabilities["reports/"] == 1.0
+    assert probabilities["orders/"] == pytest.approx(49.0 / 90.0)
+    assert probabilities["health/"] == pytest.approx(0.049)
+    assert sum(
+        rate * probabilities[route]
+        for route, rate in {"health/": 1000.0, "orders/": 90.0, "reports/": 2.0}.items()
+    ) == pytest.approx(100.0)
+
+
+def test_allocate_budget_minimum_rate():
+    """Test every route keeps its minimum trace rate."""
+    probabilities = allocate_budget(
+        {"a/": 1000.0, "b/": 1000.0}, budget=1.0, min_rate=2.0
+    )
+    assert probabilities == {"a/": 0.002, "b/": 0.002}
+
+
+def test_adaptive_sampler_recomputes_rates():
+    """Test the sampler derives per-route rates from its own counters."""
+    with patch("django_observability.sampling.time.monotonic", return_value=0.0):
+        sampler = AdaptiveRouteSampler(budget=10.0, min_rate=0.0, interval=10.0)
+    with patch("django_observability.sampling.time.monotonic", return_value=5.0):
+        for trace_id in range(1000):
+            sampler.should_sample(
+                None, trace_id, "GET", attributes={ROUTE_ATTRIBUTE: "hot/"}
+            )
+        sampler.should_sample(None, 1, "GET", attributes={ROUTE_ATTRIBUTE: "rare/"})
+    with patch("django_observability.sampling.time.monotonic", return_value=10.0):
+        result = sampler.should_sample(
+            None, 1, "GET", attributes={ROUTE_ATTRIBUTE: "rare/"}
+        )
+
+    assert result.decision is Decision.RECORD_AND_SAMPLE
+    assert sampler.get_rate("rare/") == 1.0
+    # 100 req/s on hot/ shares the budget left after rare/ (2 requests in 10s)
+    assert sampler.get_rate("hot/") == pytest.approx(0.098)
+    assert sampler.get_rate("unknown/") is None
+
+
+@pytest.mark.django_db
+def test_tracing_uses_adaptive_sampler(config):
+    """Test the adaptive sampler is used as the root sampler."""
+    config._config["TRACING_ROOT_SAMPLER"] = "adaptive"
+    tracing_manager = TracingManager(config)
+
+    sampler = tracing_manager.sampling.sampler
+    assert isinstance(sampler._root, AdaptiveRouteSampler)
+    assert tracing_manager.sampling.sample_by_route
+    assert tracing_manager.sampler.delegate is sampler
+    tracing_manager.shutdown()
+
+
+@pytest.fixture
+def tail_pipeline():
+    """Create a tracer whose spans pass through a tail sampler into memory."""
+    exporter = InMemorySpanExporter()
+    processor = TailSamplingSpanProcessor(
+        SimpleSpanProcessor(exporter),
+        max_spans=3,
+        latency_threshold=1.0,
+        route_thresholds={"reports/": 0.0},
+    )
+    provider = TracerProvider()
+    provider.add_span_processor(processor)
+    return provider.get_tracer(__name__), processor, exporter
+
+
+def _request_trace(tracer, status_code, route="orders/", children=1):
+    with tracer.start_as_current_span(
+        "request", attributes={ROUTE_ATTRIBUTE: route}
+    ) as root:
+        for _ in range(children):
+            with tracer.start_as_current_span("db"):
+                pass
+        root.set_attribute("http.status_code", status_code)
+
+
+def test_tail_sampling_keeps_error_traces(tail_pipeline):
+    """Test a 5xx trace is exported with all of its spans."""
+    tracer, processor, exporter = tail_pipeline
+
+    _request_trace(tracer, 503)
+
+    assert [span.name for span in exporter.get_finished_spans()] == ["db", "request"]
+    assert processor.kept_traces == 1
+
+
+def test_tail_sampling_drops_fast_traces(tail_pipeline):
+    """Test fast, successful traces outside the baseline are dropped."""
+    tracer, processor, exporter = tail_pipeline
+
+    _request_trace(tracer, 200)
+
+    assert exporter.get_finished_spans() == ()
+    assert processor.dropped_traces == 1
+    assert processor._buffered == 0
+
+
+def test_tail_sampling_route_threshold(tail_pipeline):
+    """Test per-route latency thresholds keep slow traces."""
+    tracer, processor, exporter = tail_pipeline
+
+    _request_trace(tracer, 200, route="reports/")
+
+    assert len(exporter.get_finished_spans()) == 2
+
+
+def test_tail_sampling_buffer_is_bounded(tail_pipeline):
+    """Test the oldest undecided trace is evicted when the pool is full."""
+    tracer, processor, exporter = tail_pipeline
+    roots = [tracer.start_span("request") for _ in range(2)]
+
+    for root in roots:
+        context = trace.set_span_in_context(root)
+        for _ in range(2):
+            tracer.start_span("db", context=context).end()
+
+    assert processor.evicted_spans == 2
+    assert processor._buffered == 2
+    assert list(processor._traces) == [roots[1].get_span_context().trace_id]
+
+
+@pytest.mark.django_db
+def test_tracing_wraps_processor_for_tail_sampling(config):
+    """Test tail sampling wraps the batch processor and records every root trace."""
+    config._config["TRACING_TAIL_SAMPLING"] = True
+    tracing_manager = TracingManager(config)
+
+    assert tracing_manager._tail_processor.downstream is tracing_manager.span_processor
+    assert tracing_manager.sampling.sampler._root is ALWAYS_ON
+    tracing_manager.shutdown()
@@ -1,7 +1,18 @@
+from unittest.mock import Mock
+
 import pytest
+from django.http import HttpResponse
+from opentelemetry import propagate, trace
+from opentelemetry.instrumentation.django import DjangoInstrumentor
+from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import ConsoleSpanExporter
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+    InMemorySpanExporter,
+)
+from opentelemetry.sdk.trace.sampling import ALWAYS_OFF
 
-from django_observability.tracing import TracingManager
+from django_observability.observation import RequestObservation
+from django_observability.tracing import MonitoredBatchSpanProcessor, TracingManager
 
 
 @pytest.mark.django_db
@@ -28,3 +39,182 @@ def test_tracing_otlp_failure(config, mocker):
     assert isinstance(
         span_exporter, ConsoleSpanExporter
     ), f"Expected ConsoleSpanExporter, got {type(span_exporter)}"
+
+
+@pytest.mark.django_db
+def test_span_processor_uses_flush_policy(config):
+    """Test the batch span processor is built from the configured flush policy."""
+    config._config.update(
+        {
+            "TRACING_MAX_QUEUE_SIZE": 64,
+            "TRACING_MAX_EXPORT_BATCH_SIZE": 16,
+            "TRACING_SCHEDULE_DELAY_MILLIS": 250,
+            "TRACING_EXPORT_TIMEOUT_MILLIS": 1000,
+        }
+    )
+    tracing_manager = TracingManager(config)
+    processor = tracing_manager.span_processor
+
+    assert isinstance(processor, MonitoredBatchSpanProcessor)
+    assert processor.max_queue_size == 64
+    assert processor.max_export_batch_size == 16
+    assert processor.schedule_delay_millis == 250
+    assert processor.export_timeout_millis == 1000
+    tracing_manager.shutdown()
+
+
+@pytest.mark.django_db
+def test_end_request_span_does_not_flush(tracing_manager, request_factory, mocker):
+    """Test ending a request span never blocks on the exporter."""
+    request = request_factory.get("/test/")
+    span = tracing_manager.start_request_span(request, "cid")
+    force_flush = mocker.patch.object(tracing_manager.span_processor, "force_flush")
+
+    tracing_manager.end_request_span(span, request, HttpResponse(status=200), 0.01)
+
+    force_flush.assert_not_called()
+
+
+def test_span_processor_reports_drops_and_exports():
+    """Test the processor counts dropped spans and times exports."""
+    exporter = InMemorySpanExporter()
+    processor = MonitoredBatchSpanProcessor(
+        exporter,
+        max_queue_size=1,
+        max_export_batch_size=1,
+        schedule_delay_millis=60000,
+    )
+    processor.on_drop = Mock()
+    processor.on_export = Mock()
+    tracer = TracerProvider().get_tracer(__name__)
+
+    processor.queue.append(tracer.start_span("queued"))
+    processor.on_end(tracer.start_span("dropped"))
+    assert processor.dropped_spans == 1
+    processor.on_drop.assert_called_once()
+
+    assert processor.force_flush(5000)
+    duration, span_count, success, queue_size = processor.on_export.call_args.args
+    assert duration >= 0
+    assert span_count == 1
+    assert success is True
+    assert queue_size == 0
+    processor.shutdown()
+
+
+@pytest.mark.django_db
+def test_middleware_mode_span_is_current(
+    tracing_manager, tracer_provider, request_factory
+):
+    """Test the request span is current so child spans nest under it."""
+    tracing_manager.tracer = tracer_provider.get_tracer(__name__)
+    observation = RequestObservation(request_factory.get("/test/"), "cid")
+
+    tracing_manager.request_started(observation)
+    span = observation.span
+    assert trace.get_current_span() is span
+    child = tracer_provider.get_tracer(__name__).start_span("db")
+    assert child.parent.span_id == span.get_span_context().span_id
+    child.end()
+
+    observation.finish(HttpResponse(status=200), 0.01)
+    tracing_manager.request_finished(observation)
+    assert trace.get_current_span() is not span
+    assert not span.is_recording()
+
+
+@pytest.mark.django_db
+def test_auto_mode_adopts_instrumentor_span(config, tracer_provider, request_factory):
+    """Test auto mode enriches the instrumentor's span instead of creating one."""
+    config._config["TRACING_MODE"] = "auto"
+    tracing_manager = TracingManager(config)
+    tracing_manager.tracer.start_span = Mock()
+    observation = RequestObservation(request_factory.get("/test/"), "cid")
+
+    tracer = tracer_provider.get_tracer(__name__)
+    with tracer.start_as_current_span("server") as server_span:
+        tracing_manager.request_started(observation)
+        observation.finish(HttpResponse(status=200), 0.01)
+        tracing_manager.request_finished(observation)
+        assert observation.span is server_span
+        assert server_span.is_recording()
+        assert server_span.attributes["http.correlation_id"] == "cid"
+
+    tracing_manager.tracer.start_span.assert_not_called()
+    DjangoInstrumentor().uninstrument()
+
+
+@pytest.mark.django_db
+def test_unsampled_span_skips_attributes(tracing_manager, request_factory, mocker):
+    """Test no request or response attributes are built for unsampled spans."""
+    tracing_manager.tracer = TracerProvider(sampler=ALWAYS_OFF).get_tracer(__name__)
+    get_view_name = mocker.patch("django_observability.observation.get_view_name")
+    get_response_size = mocker.patch("django_observability.tracing.get_response_size")
+    request = request_factory.get("/test/")
+
+    span = tracing_manager.start_request_span(request, "cid")
+    tracing_manager.end_request_span(span, request, HttpResponse(b"body"), 0.01)
+
+    assert not span.is_recording()
+    get_view_name.assert_not_called()
+    get_response_size.assert_not_called()
+
+
+@pytest.mark.django_db
+def test_sampled_span_has_request_attributes(
+    tracing_manager, tracer_provider, request_factory
+):
+    """Test sampled spans carry the request attributes and route name."""
+    tracing_manager.tracer = tracer_provider.get_tracer(__name__)
+    request = request_factory.get("/test/", HTTP_USER_AGENT="pytest")
+
+    span = tracing_manager.start_request_span(request, "cid")
+
+    assert span.name == "GET test_view"
+    assert span.attributes["http.correlation_id"] == "cid"
+    assert span.attributes["http.user_agent"] == "pytest"
+    assert span.attributes["http.url"] == "http://testserver/test/"
+    span.end()
+
+
+TRACEPARENT = "00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-{flags}"
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "root_sampler,flags,recording",
+    [("always_off", "01", True), ("always_on", "00", False)],
+)
+def test_inbound_sampling_decision_is_honored(
+    config, request_factory, root_sampler, flags, recording
+):
+    """Test the inbound traceparent decides sampling, not the root sampler."""
+    config._config["TRACING_ROOT_SAMPLER"] = root_sampler
+    tracing_manager = TracingManager(config)
+    sampler = tracing_manager.sampling.sampler
+    tracing_manager.tracer = TracerProvider(sampler=sampler).get_tracer(__name__)
+    observation = RequestObservation(
+        request_factory.get("/test/", HTTP_TRACEPARENT=TRACEPARENT.format(flags=flags)),
+        "cid",
+    )
+
+    tracing_manager.request_started(observation)
+    span_context = observation.span.get_span_context()
+    assert observation.span.is_recording() is recording
+    assert span_context.trace_id == 0x0AF7651916CD43DD8448EB211C80319C
+    assert trace.get_current_span() is observation.span
+
+    observation.finish(HttpResponse(status=200), 0.01)
+    tracing_manager.request_finished(observation)
+    tracing_manager.shutdown()
+
+
+@pytest.mark.django_db
+def test_propagators_follow_config(config):
+    """Test only the configured propagators are installed."""
+    config._config["TRACING_PROPAGATORS"] = ["tracecontext", "unknown"]
+    TracingManager(config).shutdown()
+
+    assert propagate.get_global_textmap().fields == {"traceparent", "tracestate"}
+    config._config["TRACING_PROPAGATORS"] = ["tracecontext", "baggage"]
+    TracingManager(config).shutdown()
@@ -1,12 +1,18 @@
 # tests/urls.py
 from django.http import HttpResponse
-from django.urls import path
+from django.urls import include, path, re_path
 
 
 def test_view(request):
     return HttpResponse(status=200)
 
 
+api_patterns = [
+    path("users/<int:pk>/", test_view, name="user_detail"),
+    re_path(r"^files/(?P<name>[\w-]+)/$", test_view, name="file_detail"),
+]
+
 urlpatterns = [
     path("test/", test_view, name="test_view"),
+    path("api/", include(api_patterns)),
 ]